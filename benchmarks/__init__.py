@@ -0,0 +1 @@
+"""Performance benchmarks for Homomorphic Battleship"""
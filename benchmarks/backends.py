@@ -0,0 +1,92 @@
+"""
+Arithmetic backend comparison for the Paillier operations.
+
+Times key generation, encryption of a value and of a whole board, the
+homomorphic hit check, the defender's zero test and decryption on every
+installed backend (gmpy2 and pure Python), with the same key for all
+backends.
+
+Usage:
+    python -m benchmarks.backends --key-length 2048 --repeat 20
+"""
+
+import argparse
+import time
+from typing import Callable, Dict, List, Optional
+from src.backend import BACKENDS, available_backends, backend_report, get_backend, set_backend
+from src.board import Board
+from src.crypto import (ZeroTestDecryptor, decrypt_value, encrypt_value, generate_keypair,
+                        perform_homomorphic_hit_check)
+
+
+def _mean_ms(operation: Callable[[], object], repeat: int) -> float:
+    """Mean milliseconds per call of an operation."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        operation()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def compare_backends(key_length: int = 2048, repeat: int = 20, keygen_repeat: int = 2,
+                     board_repeat: int = 2) -> Dict[str, Dict[str, float]]:
+    """
+    Time the Paillier operations on every installed backend.
+
+    Args:
+        key_length: Bit length of the modulus
+        repeat: Calls timed per operation
+        keygen_repeat: Keypairs generated per backend
+        board_repeat: Boards encrypted per backend
+
+    Returns:
+        Mean milliseconds per operation, keyed by backend name
+    """
+    previous = get_backend().name
+    public_key, private_key = generate_keypair(key_length)
+    board = Board("Bench")
+    board.place_ships()
+    results = {}
+    try:
+        for name in available_backends():
+            set_backend(name)
+            cell = encrypt_value(public_key, 1)
+            hit_check = perform_homomorphic_hit_check(cell, 1)
+            zero_tester = ZeroTestDecryptor(private_key)
+            results[name] = {
+                "keygen": _mean_ms(lambda: generate_keypair(key_length), keygen_repeat),
+                "encrypt": _mean_ms(lambda: encrypt_value(public_key, 1), repeat),
+                "encrypt_board": _mean_ms(lambda: board.encrypt_board(public_key), board_repeat),
+                "hit_check": _mean_ms(lambda: perform_homomorphic_hit_check(cell, 1), repeat),
+                "zero_test": _mean_ms(lambda: zero_tester.is_zero(hit_check), repeat),
+                "decrypt": _mean_ms(lambda: decrypt_value(private_key, hit_check), repeat),
+            }
+    finally:
+        set_backend(previous)
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the comparison from the command line and print a table."""
+    parser = argparse.ArgumentParser(description="Compare arithmetic backends")
+    parser.add_argument("--key-length", type=int, default=2048)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--keygen-repeat", type=int, default=2)
+    parser.add_argument("--board-repeat", type=int, default=2)
+    args = parser.parse_args(argv)
+
+    print(backend_report())
+    missing = [name for name in BACKENDS if name not in available_backends()]
+    if missing:
+        print(f"Not installed: {', '.join(missing)}")
+
+    results = compare_backends(args.key_length, args.repeat, args.keygen_repeat,
+                               args.board_repeat)
+    operations = list(next(iter(results.values())))
+    print(f"{args.key_length}-bit keys, ms per operation")
+    print(f"  {'backend':8s}" + "".join(f"{operation:>14s}" for operation in operations))
+    for name, timings in results.items():
+        print(f"  {name:8s}" + "".join(f"{timings[operation]:14.3f}" for operation in operations))
+
+
+if __name__ == "__main__":
+    main()
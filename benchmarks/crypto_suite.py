@@ -0,0 +1,244 @@
+"""
+Crypto micro-benchmark suite with regression thresholds.
+
+Measures generate_keypair, encrypt_value, Board.encrypt_board,
+perform_homomorphic_hit_check and decrypt_value for each key length,
+recording ops/sec and latency percentiles. Results can be saved as a
+JSON baseline; a later run compared against that baseline exits with
+status 1 if any metric regressed by more than the threshold, or if the
+baseline has no value for a key length, operation or metric being
+compared.
+
+Baselines are only comparable on the same machine and arithmetic
+backend. Key generation time depends on the random prime search and
+varies too much between runs to gate on, so it is reported but left out
+of the comparison unless --gate-keygen is given (use it with many
+--keygen-samples). A latency percentile is only reported when there are
+enough samples for it to differ from the maximum.
+
+Usage:
+    python -m benchmarks.crypto_suite --output benchmarks/crypto_baseline.json
+    python -m benchmarks.crypto_suite --baseline benchmarks/crypto_baseline.json --threshold 0.25
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Sequence
+from src.backend import get_backend
+from src.board import Board
+from src.crypto import decrypt_value, encrypt_value, generate_keypair, perform_homomorphic_hit_check
+
+
+DEFAULT_KEY_LENGTHS = (1024, 2048, 3072)
+METRICS = ("ops_per_sec", "p50_ms", "p90_ms", "max_ms")
+DEFAULT_METRICS = ("ops_per_sec", "p50_ms")
+
+# Operations too noisy for the default regression gate
+UNGATED_OPERATIONS = ("generate_keypair",)
+
+# Metrics where a larger value is an improvement; all others are latencies
+HIGHER_IS_BETTER = {"ops_per_sec"}
+
+
+def summarize(samples_ns: Sequence[int]) -> Dict[str, float]:
+    """
+    Summarize latency samples.
+
+    Args:
+        samples_ns: Latency of each call in nanoseconds
+
+    Returns:
+        Dictionary with ops/sec, latency percentiles in milliseconds and the
+        sample count; a percentile is None if there are too few samples for it
+    """
+    ordered = sorted(samples_ns)
+    count = len(ordered)
+
+    def percentile(fraction: float) -> Optional[float]:
+        # Needs at least one sample above the percentile, or it is just the maximum
+        index = int(count * fraction)
+        if index >= count - 1:
+            return None
+        return ordered[index] / 1e6
+
+    return {
+        "ops_per_sec": count / (sum(ordered) / 1e9) if sum(ordered) else float("inf"),
+        "p50_ms": percentile(0.50),
+        "p90_ms": percentile(0.90),
+        "max_ms": ordered[-1] / 1e6,
+        "samples": count,
+    }
+
+
+def time_operation(operation: Callable[[], object], samples: int, warmup: int = 1) -> Dict[str, float]:
+    """
+    Time repeated calls of an operation.
+
+    Args:
+        operation: The call to time
+        samples: Number of timed calls
+        warmup: Untimed calls made first
+
+    Returns:
+        Summary from summarize
+    """
+    for _ in range(warmup):
+        operation()
+    clock = time.perf_counter_ns
+    timings = []
+    for _ in range(samples):
+        start = clock()
+        operation()
+        timings.append(clock() - start)
+    return summarize(timings)
+
+
+def run_suite(key_lengths: Sequence[int] = DEFAULT_KEY_LENGTHS, samples: int = 20,
+              keygen_samples: int = 3, board_samples: int = 2) -> Dict:
+    """
+    Run every benchmark for every key length.
+
+    Args:
+        key_lengths: Modulus bit lengths to benchmark
+        samples: Timed calls for the per-value operations
+        keygen_samples: Timed calls of generate_keypair
+        board_samples: Timed calls of Board.encrypt_board
+
+    Returns:
+        Dictionary with "meta" and "results" (key length -> operation -> summary)
+    """
+    results = {}
+    for key_length in key_lengths:
+        public_key, private_key = generate_keypair(key_length)
+        board = Board()
+        board.place_ships()
+        cell = encrypt_value(public_key, 1)
+        hit_check = perform_homomorphic_hit_check(cell, 1)
+
+        results[str(key_length)] = {
+            "generate_keypair": time_operation(lambda: generate_keypair(key_length),
+                                               keygen_samples, warmup=0),
+            "encrypt_value": time_operation(lambda: encrypt_value(public_key, 1), samples),
+            "encrypt_board": time_operation(lambda: board.encrypt_board(public_key),
+                                            board_samples, warmup=0),
+            "hit_check": time_operation(lambda: perform_homomorphic_hit_check(cell, 1), samples),
+            "decrypt_value": time_operation(lambda: decrypt_value(private_key, hit_check), samples),
+        }
+
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "backend": get_backend().name,
+            "samples": samples,
+            "keygen_samples": keygen_samples,
+            "board_samples": board_samples,
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict, baseline: Dict, threshold: float = 0.2,
+            metrics: Sequence[str] = DEFAULT_METRICS,
+            skip_operations: Sequence[str] = UNGATED_OPERATIONS) -> List[str]:
+    """
+    Find metrics that regressed against a baseline, or that it lacks.
+
+    Every measured key length, operation and metric of the current run
+    must have a baseline value; a gap is reported rather than skipped.
+    Metrics the current run has too few samples for are not compared.
+
+    Args:
+        current: Output of run_suite
+        baseline: A saved run_suite output
+        threshold: Allowed relative regression (0.2 = 20%)
+        metrics: Metrics to check
+        skip_operations: Operations left out of the comparison
+
+    Returns:
+        One message per regression or missing baseline value (empty if none)
+    """
+    regressions = []
+    for key_length, operations in current["results"].items():
+        baseline_operations = baseline["results"].get(key_length)
+        if baseline_operations is None:
+            regressions.append(f"{key_length}-bit: missing from baseline")
+            continue
+        for operation, summary in operations.items():
+            if operation in skip_operations:
+                continue
+            reference = baseline_operations.get(operation)
+            if reference is None:
+                regressions.append(f"{key_length}-bit {operation}: missing from baseline")
+                continue
+            for metric in metrics:
+                value, expected = summary.get(metric), reference.get(metric)
+                if value is None:
+                    continue
+                if not expected:
+                    regressions.append(f"{key_length}-bit {operation} {metric}: missing from baseline")
+                    continue
+                change = (value - expected) / expected
+                regressed = change < -threshold if metric in HIGHER_IS_BETTER else change > threshold
+                if regressed:
+                    regressions.append(f"{key_length}-bit {operation} {metric}: {value:.3f} "
+                                       f"vs baseline {expected:.3f} ({change:+.1%})")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the suite from the command line; returns 1 if a regression was found."""
+    parser = argparse.ArgumentParser(description="Crypto micro-benchmarks")
+    parser.add_argument("--key-lengths", type=int, nargs="+", default=list(DEFAULT_KEY_LENGTHS))
+    parser.add_argument("--samples", type=int, default=20)
+    parser.add_argument("--keygen-samples", type=int, default=3)
+    parser.add_argument("--board-samples", type=int, default=2)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed relative regression (default 0.2 = 20%%)")
+    parser.add_argument("--metrics", nargs="+", choices=METRICS, default=list(DEFAULT_METRICS))
+    parser.add_argument("--gate-keygen", action="store_true",
+                        help="also fail on generate_keypair regressions")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.key_lengths, args.samples, args.keygen_samples, args.board_samples)
+    print(f"Backend: {report['meta']['backend']}")
+    print(f"  {'bits':>5s} {'operation':18s} {'ops/sec':>10s} {'p50 ms':>10s} "
+          f"{'p90 ms':>10s} {'max ms':>10s}")
+    for key_length, operations in report["results"].items():
+        for operation, summary in operations.items():
+            latencies = ["-" if summary[metric] is None else f"{summary[metric]:.3f}"
+                         for metric in ("p50_ms", "p90_ms", "max_ms")]
+            print(f"  {key_length:>5s} {operation:18s} {summary['ops_per_sec']:10.2f} "
+                  + " ".join(f"{latency:>10s}" for latency in latencies))
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline["meta"].get("backend") != report["meta"]["backend"]:
+            print(f"Warning: baseline was recorded on the {baseline['meta'].get('backend')} backend")
+        skip_operations = () if args.gate_keygen else UNGATED_OPERATIONS
+        regressions = compare(report, baseline, args.threshold, args.metrics, skip_operations)
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%} "
+                  f"or missing baseline value(s):")
+            for message in regressions:
+                print(f"  {message}")
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""
+Per-turn latency benchmark for the homomorphic hit check.
+
+Fires every cell of both boards through GameLogic and reports latency
+percentiles for game setup (encrypting both boards), the attacker-side
+hit check (prepare_guess) and the whole turn (make_guess): with probes
+computed on demand, precomputed, and precomputed with boards encrypted
+from fixed-base obfuscator tables. The fixed-base setup time includes
+building each key's table in the first game.
+
+Usage:
+    python -m benchmarks.turn_latency --key-length 2048 --rounds 3
+"""
+
+import argparse
+import random
+import time
+from typing import Dict, List, Optional
+from src.board import Board
+from src.crypto import generate_keypair
+from src.fixed_base import FixedBaseCache
+from src.game_logic import GameLogic
+
+
+def percentiles(samples_ns: List[int]) -> Dict[str, float]:
+    """Get p50/p99/max of nanosecond samples, in microseconds."""
+    ordered = sorted(samples_ns)
+    if not ordered:
+        return {"p50_us": 0.0, "p99_us": 0.0, "max_us": 0.0}
+    return {
+        "p50_us": ordered[len(ordered) // 2] / 1000,
+        "p99_us": ordered[min(len(ordered) - 1, len(ordered) * 99 // 100)] / 1000,
+        "max_us": ordered[-1] / 1000,
+    }
+
+
+def measure(keypairs, precompute_probes: bool, rounds: int, board_size: Optional[int],
+            seed: int, fixed_base_cache: Optional[FixedBaseCache] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Time hit checks and whole turns over fresh games.
+
+    Args:
+        keypairs: ((alice_pub, alice_priv), (bob_pub, bob_priv))
+        precompute_probes: Whether games precompute hit-check probes
+        rounds: Number of games; every cell of both boards is fired at in each
+        board_size: Width and height of the boards
+        seed: Seed for placement and shot order
+        fixed_base_cache: Optional cache for fixed-base obfuscator tables
+
+    Returns:
+        Percentiles for "setup", "hit_check" and "turn"
+    """
+    (alice_pub, alice_priv), (bob_pub, bob_priv) = keypairs
+    rng = random.Random(seed)
+    clock = time.perf_counter_ns
+    setups: List[int] = []
+    hit_checks: List[int] = []
+    turns: List[int] = []
+
+    for _ in range(rounds):
+        alice_board = Board("Alice", board_size=board_size)
+        alice_board.place_ships(rng)
+        bob_board = Board("Bob", board_size=board_size)
+        bob_board.place_ships(rng)
+        start = clock()
+        game = GameLogic(alice_board, bob_board, alice_pub, bob_pub, alice_priv, bob_priv,
+                         precompute_probes=precompute_probes, fixed_base_cache=fixed_base_cache)
+        setups.append(clock() - start)
+        for table in game.probe_tables.values():
+            table.wait()  # Measure the steady state, after the background stage
+
+        cells = [(x, y) for x in range(alice_board.board_size) for y in range(alice_board.board_size)]
+        shots = {"Alice": rng.sample(cells, len(cells)), "Bob": rng.sample(cells, len(cells))}
+        for x, y in shots["Alice"]:
+            start = clock()
+            game.prepare_guess("Alice", x, y)
+            hit_checks.append(clock() - start)
+
+        while not game.game_state.game_over:
+            player = game.game_state.current_turn
+            x, y = shots[player].pop()
+            start = clock()
+            game.make_guess(player, x, y)
+            turns.append(clock() - start)
+            game.game_state.switch_turn()
+
+    return {"setup": percentiles(setups), "hit_check": percentiles(hit_checks),
+            "turn": percentiles(turns)}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the benchmark from the command line and print the percentiles."""
+    parser = argparse.ArgumentParser(description="Per-turn hit-check latency")
+    parser.add_argument("--key-length", type=int, default=2048)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--board-size", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    keypairs = generate_keypair(args.key_length), generate_keypair(args.key_length)
+    print(f"{args.key_length}-bit keys, {args.rounds} game(s)")
+    modes = (("on demand", False, None), ("precomputed", True, None),
+             ("fixed-base", True, FixedBaseCache()))
+    for label, precompute, cache in modes:
+        results = measure(keypairs, precompute, args.rounds, args.board_size, args.seed, cache)
+        for kind, stats in results.items():
+            print(f"  {label:12s} {kind:10s} p50 {stats['p50_us']:9.1f} us  "
+                  f"p99 {stats['p99_us']:9.1f} us  max {stats['max_us']:9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Big-integer arithmetic backends for the Paillier operations.
+
+Key generation, encryption obfuscators, hit-check blinding, zero tests
+and decryption go through the active backend instead of relying on phe
+to pick up gmpy2 silently. The gmpy2 backend is used when gmpy2 is
+installed; otherwise everything runs on Python's built-in integers.
+
+Usage:
+    from src.backend import get_backend
+    get_backend().powmod(base, exponent, modulus)
+"""
+
+import random
+from typing import Dict, List
+import phe.util
+
+try:
+    import gmpy2
+except ImportError:  # Optional accelerator; the Python backend is used instead
+    gmpy2 = None
+
+
+class ArithmeticBackend:
+    """Modular arithmetic on Python's built-in integers."""
+
+    name = "python"
+
+    @staticmethod
+    def available() -> bool:
+        """Whether the backend can be used in this environment."""
+        return True
+
+    @staticmethod
+    def version() -> str:
+        """Version of the underlying library."""
+        return "builtin"
+
+    def powmod(self, base: int, exponent: int, modulus: int) -> int:
+        """Compute base^exponent mod modulus."""
+        return pow(base, exponent, modulus)
+
+    def mulmod(self, a: int, b: int, modulus: int) -> int:
+        """Compute a * b mod modulus."""
+        return a * b % modulus
+
+    def invert(self, a: int, modulus: int) -> int:
+        """Compute the inverse of a modulo modulus (raises ValueError if none exists)."""
+        return pow(a, -1, modulus)
+
+    def is_prime(self, n: int) -> bool:
+        """Test whether n is probably prime."""
+        return phe.util.is_prime(n)
+
+    def random_prime(self, bits: int) -> int:
+        """
+        Generate a random prime with exactly the given number of bits.
+
+        Args:
+            bits: Bit length of the prime
+
+        Returns:
+            A probable prime in [2^(bits - 1), 2^bits)
+        """
+        candidate = random.SystemRandom().randrange(2 ** (bits - 1), 2 ** bits) | 1
+        while not self.is_prime(candidate):
+            candidate += 2
+        return candidate
+
+
+class Gmpy2Backend(ArithmeticBackend):
+    """Modular arithmetic on GMP through gmpy2; results are returned as ints."""
+
+    name = "gmpy2"
+
+    @staticmethod
+    def available() -> bool:
+        return gmpy2 is not None
+
+    @staticmethod
+    def version() -> str:
+        return gmpy2.version() if gmpy2 is not None else "not installed"
+
+    def powmod(self, base: int, exponent: int, modulus: int) -> int:
+        return int(gmpy2.powmod(base, exponent, modulus))
+
+    def mulmod(self, a: int, b: int, modulus: int) -> int:
+        return int(gmpy2.mpz(a) * b % modulus)
+
+    def invert(self, a: int, modulus: int) -> int:
+        try:
+            return int(gmpy2.invert(a, modulus))
+        except ZeroDivisionError:
+            raise ValueError("base is not invertible for the given modulus") from None
+
+    def is_prime(self, n: int) -> bool:
+        return bool(gmpy2.is_prime(n, 25))
+
+    def random_prime(self, bits: int) -> int:
+        candidate = gmpy2.mpz(random.SystemRandom().getrandbits(bits))
+        candidate = gmpy2.bit_set(candidate, bits - 1)
+        prime = gmpy2.next_prime(candidate)
+        if prime.bit_length() > bits:  # Rolled past 2^bits; start again
+            return self.random_prime(bits)
+        return int(prime)
+
+
+# Backends by name, fastest first
+BACKENDS: Dict[str, ArithmeticBackend] = {
+    Gmpy2Backend.name: Gmpy2Backend(),
+    ArithmeticBackend.name: ArithmeticBackend(),
+}
+
+_active: ArithmeticBackend = next(backend for backend in BACKENDS.values() if backend.available())
+
+
+def available_backends() -> List[str]:
+    """Get the names of the backends usable in this environment."""
+    return [name for name, backend in BACKENDS.items() if backend.available()]
+
+
+def get_backend() -> ArithmeticBackend:
+    """Get the active arithmetic backend."""
+    return _active
+
+
+def set_backend(name: str) -> ArithmeticBackend:
+    """
+    Select the arithmetic backend for this process.
+
+    Args:
+        name: Backend name ("gmpy2" or "python")
+
+    Returns:
+        The selected backend
+
+    Raises:
+        ValueError: if the backend is unknown or not installed
+    """
+    global _active
+    backend = BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(f"Unknown arithmetic backend {name!r}")
+    if not backend.available():
+        raise ValueError(f"Arithmetic backend {name!r} is not installed")
+    _active = backend
+    return backend
+
+
+def backend_report() -> str:
+    """Describe the active backend, and whether phe itself uses gmpy2."""
+    phe_path = "gmpy2" if phe.util.HAVE_GMP else "python"
+    report = f"Arithmetic backend: {_active.name} ({_active.version()}); phe internals: {phe_path}"
+    if gmpy2 is None:
+        report += " [gmpy2 not installed, using the pure-Python fallback]"
+    return report
@@ -0,0 +1,213 @@
+"""
+Integer-bitmask board backend for Battleship.
+
+BitBoard keeps the public Board API but stores ship cells, per-ship
+cells and guesses as Python int bitmasks, so hit recording, sunk checks
+and game-over checks are constant-time bit operations. Intended for
+high-volume plaintext simulation.
+
+Cell (x, y) maps to bit x * board_size + y.
+"""
+
+from array import array
+from collections.abc import MutableMapping, Set
+from typing import Iterator, List, Optional, Tuple
+from src.board import Board, Ship
+
+
+class _CellMap(MutableMapping):
+    """Dict-like view of a BitBoard's cells (0 = water, 1 = ship)."""
+
+    def __init__(self, owner: "BitBoard"):
+        self._owner = owner
+
+    def __getitem__(self, coord: Tuple[int, int]) -> int:
+        return (self._owner._ship_mask >> self._owner._bit_index(coord)) & 1
+
+    def __setitem__(self, coord: Tuple[int, int], value: int) -> None:
+        bit = 1 << self._owner._bit_index(coord)
+        if value:
+            self._owner._ship_mask |= bit
+        else:
+            self._owner._ship_mask &= ~bit
+
+    def __delitem__(self, coord: Tuple[int, int]) -> None:
+        raise TypeError("Board cells cannot be deleted")
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        size = self._owner.board_size
+        for x in range(size):
+            for y in range(size):
+                yield (x, y)
+
+    def __len__(self) -> int:
+        return self._owner.board_size * self._owner.board_size
+
+
+class _GuessSet(Set):
+    """Set-like view of the coordinates guessed against a BitBoard."""
+
+    def __init__(self, owner: "BitBoard"):
+        self._owner = owner
+
+    def __contains__(self, coord) -> bool:
+        try:
+            bit_index = self._owner._bit_index(coord)
+        except (TypeError, ValueError, KeyError):
+            return False
+        return bool((self._owner._guess_mask >> bit_index) & 1)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        mask = self._owner._guess_mask
+        size = self._owner.board_size
+        while mask:
+            low_bit = mask & -mask
+            yield divmod(low_bit.bit_length() - 1, size)
+            mask ^= low_bit
+
+    def __len__(self) -> int:
+        return self._owner._guess_mask.bit_count()
+
+    def add(self, coord: Tuple[int, int]) -> None:
+        self._owner._guess_mask |= 1 << self._owner._bit_index(coord)
+
+
+class BitBoard(Board):
+    """
+    Board backed by integer bitmasks.
+
+    Ships must be placed through place_ships, place_ships_manual or
+    place_ship so the per-ship masks stay in sync; hits must be recorded
+    through record_hit_on_board.
+    """
+
+    def _initialize_board(self) -> None:
+        """Initialize an empty board as bitmasks."""
+        self._ship_mask = 0
+        self._guess_mask = 0
+        self._ship_masks: List[int] = []
+        self._cell_owner = self._empty_owners()
+        self.board = _CellMap(self)
+        self.guesses = _GuessSet(self)
+
+    def _empty_owners(self) -> array:
+        """Get an all-water cell owner table (ship index + 1 per cell, 0 = water)."""
+        # 16-bit entries: MAX_BOARD_SIZE caps a fleet well below 65535 ships
+        return array("H", [0]) * (self.board_size * self.board_size)
+
+    def _bit_index(self, coord: Tuple[int, int]) -> int:
+        """Map a coordinate to its bit index."""
+        x, y = coord
+        if not (0 <= x < self.board_size and 0 <= y < self.board_size):
+            raise KeyError(coord)
+        return x * self.board_size + y
+
+    def _rebuild_masks(self) -> None:
+        """Rebuild the per-ship masks and cell owners from self.ships."""
+        self._ship_masks = []
+        self._cell_owner = self._empty_owners()
+        for index, ship in enumerate(self.ships):
+            ship_mask = 0
+            for coord in ship.coordinates:
+                bit_index = self._bit_index(coord)
+                ship_mask |= 1 << bit_index
+                self._cell_owner[bit_index] = index + 1
+            self._ship_masks.append(ship_mask)
+            self._ship_mask |= ship_mask
+
+    def place_ship(self, ship: Ship, coordinates: List[Tuple[int, int]]) -> None:
+        """
+        Place a single ship at the given coordinates.
+
+        Args:
+            ship: The ship to place
+            coordinates: The cells the ship occupies
+        """
+        ship_mask = 0
+        for coord in coordinates:
+            ship_mask |= 1 << self._bit_index(coord)
+        if ship_mask & self._ship_mask:
+            raise ValueError(f"Ship {ship.name} overlaps another ship")
+
+        ship.coordinates = list(coordinates)
+        self.ships.append(ship)
+        index = len(self.ships)
+        for coord in coordinates:
+            self._cell_owner[self._bit_index(coord)] = index
+        self._ship_masks.append(ship_mask)
+        self._ship_mask |= ship_mask
+
+    def _place_fleet(self, placements: List[List[Tuple[int, int]]]) -> None:
+        """Replace the board contents with ships at the given cells, in fleet order."""
+        self.ships = []
+        self._ship_masks = []
+        self._ship_mask = 0
+        self._cell_owner = self._empty_owners()
+        for ship_id, (size, name, coordinates) in enumerate(
+                zip(self.ship_sizes, self.ship_names, placements)):
+            self.place_ship(Ship(ship_id=ship_id, name=name, size=size), coordinates)
+
+    def place_ships_manual(self) -> None:
+        """Allow a player to manually place the whole fleet on the board."""
+        self._ship_mask = 0
+        super().place_ships_manual()
+        self._rebuild_masks()
+
+    def record_hit_on_board(self, x: int, y: int) -> Tuple[bool, bool]:
+        """
+        Record a hit at the specified coordinate.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+
+        Returns:
+            Tuple of (is_hit, is_duplicate)
+        """
+        if not (0 <= x < self.board_size and 0 <= y < self.board_size):
+            raise ValueError(f"Coordinate ({x}, {y}) out of bounds")
+
+        bit_index = x * self.board_size + y
+        bit = 1 << bit_index
+        is_duplicate = bool(self._guess_mask & bit)
+        self._guess_mask |= bit
+        is_hit = bool(self._ship_mask & bit)
+
+        if is_hit and not is_duplicate:
+            owner = self._cell_owner[bit_index]
+            if owner:
+                self.ships[owner - 1].record_hit()
+
+        return is_hit, is_duplicate
+
+    def get_ship_at(self, x: int, y: int) -> Optional[Ship]:
+        """
+        Get the ship at the specified coordinate, if any.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+
+        Returns:
+            The Ship object if there's a ship at this location, None otherwise
+        """
+        if not (0 <= x < self.board_size and 0 <= y < self.board_size):
+            return None
+        owner = self._cell_owner[x * self.board_size + y]
+        return self.ships[owner - 1] if owner else None
+
+    def is_ship_sunk(self, ship_index: int) -> bool:
+        """
+        Check whether a ship is sunk using its mask.
+
+        Args:
+            ship_index: Index of the ship in self.ships
+
+        Returns:
+            True if every cell of the ship has been guessed
+        """
+        return not self._ship_masks[ship_index] & ~self._guess_mask
+
+    def all_ships_sunk(self) -> bool:
+        """Check if all ships are sunk."""
+        return not self._ship_mask & ~self._guess_mask
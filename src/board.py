@@ -4,9 +4,11 @@ Board management for Battleship game.
 Handles board creation, ship placement, encryption, and hit tracking.
 """
 
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, Iterator, List, Tuple, Optional
 from dataclasses import dataclass, field
 from phe.paillier import PaillierPublicKey, EncryptedNumber
+from src.crypto import encrypt_value
+from src.placement import get_placement_engine
 import random
 
 
@@ -18,6 +20,8 @@ class Ship:
     size: int
     coordinates: List[Tuple[int, int]] = field(default_factory=list)
     hits: int = 0
+    # Called on hits that damage an intact cell; set by the owning Board
+    on_damage: Optional[Callable[[], None]] = field(default=None, repr=False, compare=False)
     
     def is_sunk(self) -> bool:
         """Check if the ship is completely sunk."""
@@ -25,6 +29,8 @@ class Ship:
     
     def record_hit(self) -> None:
         """Record a hit on this ship."""
+        if self.hits < self.size and self.on_damage is not None:
+            self.on_damage()
         self.hits += 1
     
     @staticmethod
@@ -77,19 +83,24 @@ class Ship:
         return True, None
     
     @staticmethod
-    def get_valid_range(coords: List[Tuple[int, int]], size: int) -> str:
+    def get_valid_range(coords: List[Tuple[int, int]], size: int,
+                        board_size: Optional[int] = None) -> str:
         """
         Get the valid range for remaining coordinates of a ship.
         
         Args:
             coords: List of coordinates already placed
             size: Total size of the ship
+            board_size: Width and height of the board (defaults to Board.BOARD_SIZE)
             
         Returns:
             String describing valid range for next coordinate
         """
+        if board_size is None:
+            board_size = Board.BOARD_SIZE
+        max_coord = board_size - 1
         if len(coords) < 1:
-            return "Any coordinate on the board (0-9 for x and y)"
+            return f"Any coordinate on the board (0-{max_coord} for x and y)"
         
         if len(coords) == 1:
             x1, y1 = coords[0]
@@ -107,10 +118,10 @@ class Ship:
             min_y = y_coords[0] - remaining
             max_y = y_coords[-1] + remaining
             min_y = max(min_y, 0)
-            max_y = min(max_y, 9)
+            max_y = min(max_y, max_coord)
             
             # Next coordinate must continue the line
-            if y_coords[-1] + 1 <= 9:
+            if y_coords[-1] + 1 <= max_coord:
                 next_valid = f"y must be {y_coords[-1] + 1} (continuing from current line)"
             else:
                 next_valid = f"Line is complete at this end, no more room"
@@ -123,10 +134,10 @@ class Ship:
             min_x = x_coords[0] - remaining
             max_x = x_coords[-1] + remaining
             min_x = max(min_x, 0)
-            max_x = min(max_x, 9)
+            max_x = min(max_x, max_coord)
             
             # Next coordinate must continue the line
-            if x_coords[-1] + 1 <= 9:
+            if x_coords[-1] + 1 <= max_coord:
                 next_valid = f"x must be {x_coords[-1] + 1} (continuing from current line)"
             else:
                 next_valid = f"Line is complete at this end, no more room"
@@ -138,90 +149,176 @@ class Board:
     """Manages the Battleship board for a single player."""
     
     BOARD_SIZE = 10
+    MAX_BOARD_SIZE = 100
     SHIP_SIZES = [5, 4, 3, 2, 2]  # Aircraft Carrier, Battleship, Submarine, Destroyer, Patrol Boat
     SHIP_NAMES = ["Aircraft Carrier", "Battleship", "Submarine", "Destroyer", "Patrol Boat"]
     
-    def __init__(self, player_name: str = "Player"):
+    def __init__(self, player_name: str = "Player", board_size: Optional[int] = None,
+                 fleet: Optional[List[Tuple[str, int]]] = None):
         """
         Initialize a board for a player.
         
         Args:
             player_name: Name of the player who owns this board
+            board_size: Width and height of the board (defaults to BOARD_SIZE)
+            fleet: List of (ship_name, ship_size) to place (defaults to the standard fleet)
+        
+        Raises:
+            ValueError: if the board size or fleet is invalid
         """
+        if board_size is None:
+            board_size = self.BOARD_SIZE
+        if fleet is None:
+            fleet = list(zip(self.SHIP_NAMES, self.SHIP_SIZES))
+        self._validate_config(board_size, fleet)
+        
         self.player_name = player_name
+        self.board_size = board_size
+        self.ship_names: List[str] = [name for name, _ in fleet]
+        self.ship_sizes: List[int] = [size for _, size in fleet]
         self.board: Dict[Tuple[int, int], int] = {}
         self.ships: List[Ship] = []
         self.guesses: set = set()  # Track all guesses made against this board
+        self._ship_index: Dict[Tuple[int, int], Ship] = {}  # Coordinate -> ship
+        self._indexed_ships: List[Ship] = []  # Ship list the index was built from
+        self._indexed_count = 0
+        self._remaining_ship_cells = 0
         self._initialize_board()
     
+    @classmethod
+    def _validate_config(cls, board_size: int, fleet: List[Tuple[str, int]]) -> None:
+        """Check that a board size and fleet describe a playable board."""
+        if not (1 <= board_size <= cls.MAX_BOARD_SIZE):
+            raise ValueError(f"Board size must be between 1 and {cls.MAX_BOARD_SIZE}")
+        if not fleet:
+            raise ValueError("Fleet must contain at least one ship")
+        for name, size in fleet:
+            if not (1 <= size <= board_size):
+                raise ValueError(f"Ship {name} of size {size} does not fit a {board_size}x{board_size} board")
+        if sum(size for _, size in fleet) > board_size * board_size:
+            raise ValueError("Fleet has more ship cells than the board")
+    
+    @property
+    def fleet(self) -> List[Tuple[str, int]]:
+        """The (ship_name, ship_size) pairs this board is played with."""
+        return list(zip(self.ship_names, self.ship_sizes))
+    
+    def in_bounds(self, x: int, y: int) -> bool:
+        """Check whether a coordinate lies on the board."""
+        return 0 <= x < self.board_size and 0 <= y < self.board_size
+    
     def _initialize_board(self) -> None:
-        """Initialize an empty 10x10 board."""
-        for x in range(self.BOARD_SIZE):
-            for y in range(self.BOARD_SIZE):
+        """Initialize an empty board_size x board_size board."""
+        for x in range(self.board_size):
+            for y in range(self.board_size):
                 self.board[(x, y)] = 0  # 0 = water
     
-    def place_ships(self) -> None:
+    def _reset_ship_index(self) -> None:
+        """Start a fresh coordinate index for the current ship list."""
+        self._ship_index = {}
+        self._indexed_ships = self.ships
+        self._indexed_count = 0
+        self._remaining_ship_cells = 0
+    
+    def _index_ship(self, ship: Ship) -> None:
+        """Add a placed ship to the coordinate index and remaining-cell counter."""
+        for coord in ship.coordinates:
+            self._ship_index[coord] = ship
+        ship.on_damage = self._on_ship_damage
+        self._remaining_ship_cells += max(ship.size - ship.hits, 0)
+        self._indexed_count += 1
+    
+    def _on_ship_damage(self) -> None:
+        """Count down the remaining intact ship cells."""
+        self._remaining_ship_cells -= 1
+    
+    def _ensure_ship_index(self) -> None:
+        """Rebuild the index if self.ships was replaced or changed directly."""
+        if self._indexed_ships is not self.ships or self._indexed_count != len(self.ships):
+            self._reset_ship_index()
+            for ship in self.ships:
+                self._index_ship(ship)
+    
+    def place_ships(self, rng=random) -> None:
         """
-        Randomly place all 5 ships on the board.
+        Randomly place the whole fleet on the board.
         
         Ships are placed without overlap and must fit entirely on the board.
-        """
-        self.ships = []
+        Placements are sampled from the precomputed candidates of a
+        PlacementEngine, whose fallback search is complete, so this
+        succeeds whenever any placement of the fleet exists.
         
-        for ship_id, (size, name) in enumerate(zip(self.SHIP_SIZES, self.SHIP_NAMES)):
-            ship = Ship(ship_id=ship_id, name=name, size=size)
-            placed = False
-            attempts = 0
-            max_attempts = 100
+        Args:
+            rng: Random source (the random module or a seeded random.Random)
             
-            while not placed and attempts < max_attempts:
-                # Randomly choose horizontal or vertical
-                is_horizontal = random.choice([True, False])
-                
-                if is_horizontal:
-                    x = random.randint(0, self.BOARD_SIZE - size)
-                    y = random.randint(0, self.BOARD_SIZE - 1)
-                    coordinates = [(x + i, y) for i in range(size)]
-                else:
-                    x = random.randint(0, self.BOARD_SIZE - 1)
-                    y = random.randint(0, self.BOARD_SIZE - size)
-                    coordinates = [(x, y + i) for i in range(size)]
-                
-                # Check for overlap
-                if all(self.board[coord] == 0 for coord in coordinates):
-                    # Place ship
-                    for coord in coordinates:
-                        self.board[coord] = 1  # 1 = part of ship
-                    ship.coordinates = coordinates
-                    self.ships.append(ship)
-                    placed = True
+        Raises:
+            ValueError: if no placement of the fleet exists
+        """
+        placements = get_placement_engine(self.board_size, tuple(self.ship_sizes)).sample(rng)
+        self._place_fleet(placements)
+    
+    def place_ships_from_row(self, row) -> None:
+        """
+        Place the fleet from a compact cell row (see BoardCorpus).
+        
+        Args:
+            row: board_size * board_size bytes, cell (x, y) at x * board_size + y,
+                holding ship index + 1 for ship cells and 0 for water
                 
-                attempts += 1
-            
-            if not placed:
-                raise ValueError(f"Could not place ship {name} after {max_attempts} attempts")
+        Raises:
+            ValueError: if the row does not match this board's size and fleet
+        """
+        if len(row) != self.board_size * self.board_size:
+            raise ValueError("Row does not match the board size")
+        
+        placements: List[List[Tuple[int, int]]] = [[] for _ in self.ship_sizes]
+        for cell_index, owner in enumerate(row):
+            if owner:
+                if owner > len(placements):
+                    raise ValueError(f"Row refers to unknown ship {owner - 1}")
+                placements[owner - 1].append(divmod(cell_index, self.board_size))
+        
+        for size, coordinates in zip(self.ship_sizes, placements):
+            if len(coordinates) != size or not Ship.is_valid_line(coordinates)[0]:
+                raise ValueError("Row does not match the fleet")
+        self._place_fleet(placements)
+    
+    def _place_fleet(self, placements: List[List[Tuple[int, int]]]) -> None:
+        """Replace the board contents with ships at the given cells, in fleet order."""
+        self._initialize_board()
+        self.ships = []
+        self._reset_ship_index()
+        
+        for ship_id, (size, name, coordinates) in enumerate(
+                zip(self.ship_sizes, self.ship_names, placements)):
+            for coord in coordinates:
+                self.board[coord] = 1  # 1 = part of ship
+            ship = Ship(ship_id=ship_id, name=name, size=size, coordinates=coordinates)
+            self.ships.append(ship)
+            self._index_ship(ship)
     
     def place_ships_manual(self) -> None:
         """
-        Allow a player to manually place all 5 ships on the board.
+        Allow a player to manually place the whole fleet on the board.
         
         The player is prompted to enter coordinates for each ship in the format "x y"
         repeated for each cell of the ship. Validates that:
-        - Coordinates are within bounds (0-9)
+        - Coordinates are within bounds (0 to board_size - 1)
         - Ships form continuous horizontal or vertical lines
         - No overlaps with existing ships
         - No duplicate coordinates within a ship
         - Each ship has the correct size
         """
         self.ships = []
+        self._reset_ship_index()
         print(f"\n{self.player_name}'s Manual Ship Placement")
         print("=" * 60)
         print("Enter coordinates for each cell of your ships (format: x y)")
         print("Ships must be placed in a straight line (horizontal or vertical)")
-        print("Board coordinates range from 0-9 for both x and y")
+        print(f"Board coordinates range from 0-{self.board_size - 1} for both x and y")
         print()
         
-        for ship_id, (size, name) in enumerate(zip(self.SHIP_SIZES, self.SHIP_NAMES)):
+        for ship_id, (size, name) in enumerate(zip(self.ship_sizes, self.ship_names)):
             ship = Ship(ship_id=ship_id, name=name, size=size)
             coordinates = []
             
@@ -240,8 +337,8 @@ class Board:
                     x, y = int(parts[0]), int(parts[1])
                     
                     # Validate bounds
-                    if not (0 <= x < self.BOARD_SIZE and 0 <= y < self.BOARD_SIZE):
-                        print(f"  Coordinates out of bounds. Please use 0-9.")
+                    if not self.in_bounds(x, y):
+                        print(f"  Coordinates out of bounds. Please use 0-{self.board_size - 1}.")
                         continue
                     
                     # Validate no repeat coordinates within this ship
@@ -261,7 +358,7 @@ class Board:
                     is_valid, error_msg = Ship.is_valid_line(temp_coordinates)
                     if not is_valid:
                         print(f"  Error: {error_msg}")
-                        valid_range = Ship.get_valid_range(coordinates, size)
+                        valid_range = Ship.get_valid_range(coordinates, size, self.board_size)
                         print(f"  Valid range for next coordinate: {valid_range}")
                         continue
                     
@@ -269,13 +366,14 @@ class Board:
                     print(f"  [OK] {len(coordinates)}/{size} cells placed at ({x}, {y})")
                 
                 except ValueError:
-                    print("  Invalid input. Please enter two integers (0-9).")
+                    print(f"  Invalid input. Please enter two integers (0-{self.board_size - 1}).")
             
             # Place the ship
             for coord in coordinates:
                 self.board[coord] = 1
             ship.coordinates = coordinates
             self.ships.append(ship)
+            self._index_ship(ship)
             print(f"  [OK] {name} placed successfully at: {coordinates}")
         
         print(f"\n{self.player_name}'s board setup complete!")
@@ -285,31 +383,64 @@ class Board:
         Get the plaintext value of a cell.
         
         Args:
-            x: X coordinate (0-9)
-            y: Y coordinate (0-9)
+            x: X coordinate (0 to board_size - 1)
+            y: Y coordinate (0 to board_size - 1)
             
         Returns:
             0 for water, 1 for ship
         """
-        if not (0 <= x < self.BOARD_SIZE and 0 <= y < self.BOARD_SIZE):
+        if not self.in_bounds(x, y):
             raise ValueError(f"Coordinate ({x}, {y}) out of bounds")
         return self.board[(x, y)]
     
-    def encrypt_board(self, public_key: PaillierPublicKey) -> Dict[Tuple[int, int], EncryptedNumber]:
+    def encrypt_board(self, public_key: PaillierPublicKey,
+                      engine=None) -> Dict[Tuple[int, int], EncryptedNumber]:
         """
         Encrypt the entire board using the provided public key.
         
         Args:
             public_key: The Paillier public key for encryption
+            engine: Optional engine with an encrypt_cells method, such as an
+                EncryptionEngine or an ObfuscatorPool for this key
             
         Returns:
             Dictionary mapping coordinates to encrypted cell values
         """
+        if engine is not None:
+            return engine.encrypt_cells(public_key, self.board)
+        
         encrypted_board = {}
         for coord, value in self.board.items():
-            encrypted_board[coord] = public_key.encrypt(value)
+            encrypted_board[coord] = encrypt_value(public_key, value)
         return encrypted_board
     
+    def iter_encrypted_cells(self, public_key: PaillierPublicKey, engine=None,
+                             chunk_size: int = 1024) -> Iterator[Tuple[Tuple[int, int], EncryptedNumber]]:
+        """
+        Encrypt the board in chunks, yielding cells in row-major (x, y) order.
+        
+        Only one chunk of ciphertexts is alive at a time, so large boards
+        can be written straight to disk (see EncryptedBoardStore.put_board)
+        without first building the full encrypted dictionary.
+        
+        Args:
+            public_key: The Paillier public key for encryption
+            engine: Optional engine with an encrypt_cells method
+            chunk_size: Number of cells encrypted per chunk
+        
+        Yields:
+            (coordinate, encrypted cell) pairs, cell (x, y) before (x, y + 1)
+        """
+        coords = [(x, y) for x in range(self.board_size) for y in range(self.board_size)]
+        for start in range(0, len(coords), chunk_size):
+            chunk = {coord: self.board[coord] for coord in coords[start:start + chunk_size]}
+            if engine is not None:
+                encrypted_chunk = engine.encrypt_cells(public_key, chunk)
+            else:
+                encrypted_chunk = {coord: encrypt_value(public_key, value) for coord, value in chunk.items()}
+            for coord in chunk:
+                yield coord, encrypted_chunk[coord]
+    
     def record_hit_on_board(self, x: int, y: int) -> Tuple[bool, bool]:
         """
         Record a hit at the specified coordinate.
@@ -323,7 +454,7 @@ class Board:
             - is_hit: True if coordinate contains a ship, False if water
             - is_duplicate: True if coordinate was already guessed before
         """
-        if not (0 <= x < self.BOARD_SIZE and 0 <= y < self.BOARD_SIZE):
+        if not self.in_bounds(x, y):
             raise ValueError(f"Coordinate ({x}, {y}) out of bounds")
         
         # Check if this coordinate was already guessed
@@ -335,10 +466,9 @@ class Board:
         # Only record hit on ship if this is not a duplicate guess
         if is_hit and not is_duplicate:
             # Find which ship was hit and record the hit
-            for ship in self.ships:
-                if (x, y) in ship.coordinates:
-                    ship.record_hit()
-                    break
+            ship = self.get_ship_at(x, y)
+            if ship is not None:
+                ship.record_hit()
         
         return is_hit, is_duplicate
     
@@ -353,14 +483,13 @@ class Board:
         Returns:
             The Ship object if there's a ship at this location, None otherwise
         """
-        for ship in self.ships:
-            if (x, y) in ship.coordinates:
-                return ship
-        return None
+        self._ensure_ship_index()
+        return self._ship_index.get((x, y))
     
     def all_ships_sunk(self) -> bool:
         """Check if all ships are sunk."""
-        return all(ship.is_sunk() for ship in self.ships)
+        self._ensure_ship_index()
+        return self._remaining_ship_cells == 0
     
     def get_game_status(self) -> Dict:
         """
@@ -386,8 +515,8 @@ class Board:
     def print_board_state(self) -> None:
         """Print the plaintext board state (for debugging only)."""
         print(f"\n{self.player_name}'s Board (Plaintext - DEBUG ONLY):")
-        print("   ", " ".join(str(i) for i in range(self.BOARD_SIZE)))
-        for y in range(self.BOARD_SIZE):
-            row = [str(self.board[(x, y)]) for x in range(self.BOARD_SIZE)]
+        print("   ", " ".join(str(i) for i in range(self.board_size)))
+        for y in range(self.board_size):
+            row = [str(self.board[(x, y)]) for x in range(self.board_size)]
             print(f"{y:2d}: {' '.join(row)}")
         print()
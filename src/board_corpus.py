@@ -0,0 +1,203 @@
+"""
+Bulk generation and storage of random fleet placements.
+
+A BoardCorpus holds many placements for one board configuration as
+fixed-width uint8 rows: one byte per cell, cell (x, y) at
+x * board_size + y, holding ship index + 1 (0 = water). Rows are
+generated with the PlacementEngine, optionally across worker processes,
+and can be written to and read back from a corpus file.
+
+File layout (big-endian):
+    magic        4s   b"HBFC"
+    version      B
+    board_size   H
+    count        I    number of rows
+    meta_length  I    length of the JSON metadata
+    metadata     JSON {"fleet": [[ship_name, ship_size], ...]}
+    rows         count * board_size^2 bytes
+"""
+
+import json
+import random
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+from src.board import Board
+from src.placement import get_placement_engine
+
+
+CORPUS_MAGIC = b"HBFC"
+CORPUS_VERSION = 1
+CORPUS_HEADER = struct.Struct(">4sBHII")
+
+
+def _generate_rows(board_size: int, ship_sizes: Tuple[int, ...], count: int,
+                   seed: str) -> bytes:
+    """Generate count placement rows from one seeded random stream."""
+    engine = get_placement_engine(board_size, ship_sizes)
+    rng = random.Random(seed)
+    # Linear cell indices of every candidate, so rows are filled without coordinate math
+    cell_indices = {
+        size: [[x * board_size + y for x, y in engine.cells(size, index)]
+               for index in range(engine.candidate_count(size))]
+        for size in set(ship_sizes)
+    }
+    row_size = board_size * board_size
+    rows = bytearray(count * row_size)
+    offset = 0
+    for _ in range(count):
+        for owner, (size, index) in enumerate(zip(ship_sizes, engine.sample_indices(rng)), 1):
+            for cell in cell_indices[size][index]:
+                rows[offset + cell] = owner
+        offset += row_size
+    return bytes(rows)
+
+
+class BoardCorpus:
+    """
+    Compact collection of fleet placements for one board size and fleet.
+
+    Rows are exposed as memoryview slices of a single buffer; to_board
+    turns a row into a playable Board.
+    """
+
+    def __init__(self, board_size: int, fleet: List[Tuple[str, int]], rows: bytes):
+        """
+        Initialize a corpus over existing rows.
+
+        Args:
+            board_size: Width and height of every board
+            fleet: List of (ship_name, ship_size), in row ship order
+            rows: Concatenated rows of board_size * board_size bytes
+        """
+        if len(fleet) > 255:
+            raise ValueError("Corpus rows support at most 255 ships")
+        self.board_size = board_size
+        self.fleet = [(name, size) for name, size in fleet]
+        self.row_size = board_size * board_size
+        if len(rows) % self.row_size:
+            raise ValueError("Row buffer is not a whole number of rows")
+        self._rows = memoryview(rows)
+
+    def __len__(self) -> int:
+        return len(self._rows) // self.row_size
+
+    def row(self, index: int) -> memoryview:
+        """
+        Get one placement row without copying.
+
+        Args:
+            index: Row number (negative indices count from the end)
+
+        Returns:
+            board_size * board_size bytes
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("corpus index out of range")
+        offset = index * self.row_size
+        return self._rows[offset:offset + self.row_size]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def to_board(self, index: int, player_name: str = "Player", board_cls=Board) -> Board:
+        """
+        Build a board with the fleet placed as in one row.
+
+        Args:
+            index: Row number
+            player_name: Name of the player who owns the board
+            board_cls: Board class to build (e.g. BitBoard)
+
+        Returns:
+            The placed board
+        """
+        board = board_cls(player_name, board_size=self.board_size, fleet=self.fleet)
+        board.place_ships_from_row(self.row(index))
+        return board
+
+    def save(self, path: str) -> None:
+        """
+        Write the corpus to a file.
+
+        Args:
+            path: Destination file path
+        """
+        metadata = json.dumps({"fleet": self.fleet}).encode()
+        with open(path, "wb") as corpus_file:
+            corpus_file.write(CORPUS_HEADER.pack(CORPUS_MAGIC, CORPUS_VERSION, self.board_size,
+                                                 len(self), len(metadata)))
+            corpus_file.write(metadata)
+            corpus_file.write(self._rows)
+
+    @classmethod
+    def load(cls, path: str) -> "BoardCorpus":
+        """
+        Read a corpus file written by save.
+
+        Args:
+            path: Corpus file path
+
+        Returns:
+            The loaded corpus
+        """
+        with open(path, "rb") as corpus_file:
+            data = corpus_file.read()
+        if len(data) < CORPUS_HEADER.size:
+            raise ValueError("File too short for a corpus header")
+        magic, version, board_size, count, meta_length = CORPUS_HEADER.unpack_from(data, 0)
+        if magic != CORPUS_MAGIC:
+            raise ValueError("Not a board corpus file")
+        if version != CORPUS_VERSION:
+            raise ValueError(f"Unsupported corpus version {version}")
+
+        rows_start = CORPUS_HEADER.size + meta_length
+        metadata = json.loads(data[CORPUS_HEADER.size:rows_start])
+        rows = memoryview(data)[rows_start:]
+        if len(rows) != count * board_size * board_size:
+            raise ValueError("Corpus file truncated")
+        return cls(board_size, [tuple(ship) for ship in metadata["fleet"]], rows)
+
+
+def generate_corpus(count: int, board_size: Optional[int] = None,
+                    fleet: Optional[List[Tuple[str, int]]] = None,
+                    seed: Optional[int] = None, workers: int = 1,
+                    chunk_size: int = 10000) -> BoardCorpus:
+    """
+    Generate many random fleet placements.
+
+    Work is split into chunks of chunk_size rows, each with its own
+    random stream derived from the seed, so the same seed and chunk size
+    give the same corpus regardless of the number of workers.
+
+    Args:
+        count: Number of placements to generate
+        board_size: Width and height of the board (defaults to Board.BOARD_SIZE)
+        fleet: List of (ship_name, ship_size) (defaults to the standard fleet)
+        seed: Seed for reproducible corpora (random if omitted)
+        workers: Number of worker processes (1 generates in this process)
+        chunk_size: Rows generated per chunk
+
+    Returns:
+        The generated corpus
+    """
+    if board_size is None:
+        board_size = Board.BOARD_SIZE
+    if fleet is None:
+        fleet = list(zip(Board.SHIP_NAMES, Board.SHIP_SIZES))
+    if seed is None:
+        seed = random.SystemRandom().randrange(2 ** 63)
+
+    ship_sizes = tuple(size for _, size in fleet)
+    chunks = [(board_size, ship_sizes, min(chunk_size, count - start), f"{seed}:{start // chunk_size}")
+              for start in range(0, count, chunk_size)]
+
+    if workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(_generate_rows, *zip(*chunks)))
+    else:
+        parts = [_generate_rows(*chunk) for chunk in chunks]
+    return BoardCorpus(board_size, fleet, b"".join(parts))
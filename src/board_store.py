@@ -0,0 +1,168 @@
+"""
+Memory-mapped on-disk storage for encrypted boards.
+
+Encrypted boards are written once in the binary wire format and then
+read through a memory map, so only the cells a game actually probes are
+paged into memory and idle games cost almost no resident memory.
+"""
+
+import mmap
+import os
+import tempfile
+from typing import Dict, Optional, Tuple
+from phe.paillier import PaillierPublicKey, EncryptedNumber
+from src.serialization import EncryptedBoardView, serialize_encrypted_board, write_encrypted_board
+
+
+class MmapEncryptedBoard(EncryptedBoardView):
+    """
+    Encrypted board read lazily from a memory-mapped file.
+
+    Drop-in replacement for the dict returned by Board.encrypt_board.
+    """
+
+    def __init__(self, path: str, public_key: PaillierPublicKey):
+        """
+        Open a board file written by EncryptedBoardStore.
+
+        Args:
+            path: Path to the board file
+            public_key: The public key the board is encrypted with
+        """
+        self.path = path
+        with open(path, "rb") as board_file:
+            self._mmap = mmap.mmap(board_file.fileno(), 0, access=mmap.ACCESS_READ)
+        super().__init__(self._mmap, public_key)
+
+    def advise_idle(self) -> None:
+        """Tell the OS the mapped pages can be dropped from memory."""
+        if hasattr(self._mmap, "madvise") and hasattr(mmap, "MADV_DONTNEED"):
+            self._mmap.madvise(mmap.MADV_DONTNEED)
+
+    def close(self) -> None:
+        """Unmap the board file."""
+        if not self._mmap.closed:
+            self.release()
+            self._mmap.close()
+
+
+class EncryptedBoardStore:
+    """
+    Directory of memory-mapped encrypted board files.
+
+    Uses a private temporary directory unless one is given; files in a
+    temporary directory are deleted when the store is closed.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory for board files (a temporary one if omitted)
+        """
+        self._temp_dir = None
+        if directory is None:
+            self._temp_dir = tempfile.TemporaryDirectory(prefix="battleship-boards-")
+            directory = self._temp_dir.name
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self._open_boards: Dict[str, MmapEncryptedBoard] = {}
+
+    def _path(self, name: str) -> str:
+        """Get the file path for a board name."""
+        if not name or os.sep in name or name.startswith("."):
+            raise ValueError(f"Invalid board name: {name!r}")
+        return os.path.join(self.directory, f"{name}.board")
+
+    def put(self, name: str, encrypted_board: Dict[Tuple[int, int], EncryptedNumber],
+            public_key: PaillierPublicKey) -> MmapEncryptedBoard:
+        """
+        Write an encrypted board to disk and map it.
+
+        Args:
+            name: Unique name for the board (e.g. "<game_id>-alice")
+            encrypted_board: Mapping of coordinates to encrypted cells
+            public_key: The public key the board is encrypted with
+
+        Returns:
+            The memory-mapped board
+        """
+        path = self._path(name)
+        with open(path, "wb") as board_file:
+            board_file.write(serialize_encrypted_board(encrypted_board, public_key))
+        return self.open(name, public_key)
+
+    def put_board(self, name: str, board, public_key: PaillierPublicKey,
+                  engine=None) -> MmapEncryptedBoard:
+        """
+        Encrypt a plaintext board straight to disk and map it.
+
+        Cells are encrypted and written chunk by chunk, so the full
+        encrypted board is never held in memory; use this for large boards.
+
+        Args:
+            name: Unique name for the board (e.g. "<game_id>-alice")
+            board: The plaintext Board to encrypt
+            public_key: The public key to encrypt with
+            engine: Optional engine with an encrypt_cells method
+
+        Returns:
+            The memory-mapped board
+        """
+        path = self._path(name)
+        cells = (cell for _, cell in board.iter_encrypted_cells(public_key, engine))
+        with open(path, "wb") as board_file:
+            write_encrypted_board(board_file, cells, public_key, board.board_size, board.board_size)
+        return self.open(name, public_key)
+
+    def open(self, name: str, public_key: PaillierPublicKey) -> MmapEncryptedBoard:
+        """
+        Map a previously stored board.
+
+        Args:
+            name: The board name
+            public_key: The public key the board is encrypted with
+
+        Returns:
+            The memory-mapped board
+        """
+        board = self._open_boards.get(name)
+        if board is None:
+            board = MmapEncryptedBoard(self._path(name), public_key)
+            self._open_boards[name] = board
+        return board
+
+    def remove(self, name: str) -> None:
+        """
+        Unmap and delete a stored board.
+
+        Args:
+            name: The board name
+        """
+        board = self._open_boards.pop(name, None)
+        if board is not None:
+            board.close()
+        path = self._path(name)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def advise_idle(self) -> None:
+        """Release resident pages of every mapped board."""
+        for board in self._open_boards.values():
+            board.advise_idle()
+
+    def close(self) -> None:
+        """Unmap all boards and delete the temporary directory, if any."""
+        for board in self._open_boards.values():
+            board.close()
+        self._open_boards.clear()
+        if self._temp_dir is not None:
+            self._temp_dir.cleanup()
+            self._temp_dir = None
+
+    def __enter__(self) -> "EncryptedBoardStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -2,13 +2,28 @@
 Cryptographic utilities for Paillier homomorphic encryption.
 
 This module provides key generation, encryption/decryption, and
-homomorphic hit-checking operations.
+homomorphic hit-checking operations. The big-integer arithmetic runs on
+the active backend from src.backend (gmpy2 when installed).
 """
 
 import random
-from typing import Tuple
-from phe import paillier
-from phe.paillier import PaillierPublicKey, PaillierPrivateKey, EncryptedNumber
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, Future
+from typing import Dict, List, Optional, Tuple
+from phe.paillier import PaillierPublicKey, PaillierPrivateKey, EncryptedNumber, EncodedNumber
+from src.backend import get_backend
+from src.fixed_base import FixedBaseCache, FixedBaseTable
+
+
+# Hit-check results are blinded by a random factor in [1, BLINDING_FACTOR_MAX]
+BLINDING_FACTOR_MAX = 999999
+
+# Fixed obfuscator base h = r^n mod n^2 of recently used public keys, keyed by n
+OBFUSCATOR_BASE_CACHE_SIZE = 256
+_obfuscator_bases: "OrderedDict[int, int]" = OrderedDict()
+_obfuscator_bases_lock = threading.Lock()
 
 
 def generate_keypair(n_length: int = 2048) -> Tuple[PaillierPublicKey, PaillierPrivateKey]:
@@ -21,22 +36,73 @@ def generate_keypair(n_length: int = 2048) -> Tuple[PaillierPublicKey, PaillierP
     Returns:
         Tuple of (public_key, private_key)
     """
-    public_key, private_key = paillier.generate_paillier_keypair(n_length=n_length)
+    backend = get_backend()
+    n = p = q = None
+    while n is None or n.bit_length() != n_length:
+        p = backend.random_prime(n_length // 2)
+        q = p
+        while q == p:
+            q = backend.random_prime(n_length // 2)
+        n = p * q
+    
+    public_key = PaillierPublicKey(n)
+    private_key = PaillierPrivateKey(public_key, p, q)
     return public_key, private_key
 
 
-def encrypt_value(public_key: PaillierPublicKey, value: int) -> EncryptedNumber:
+def encrypt_value(public_key: PaillierPublicKey, value: int,
+                  obfuscator_pool: Optional["ObfuscatorPool"] = None) -> EncryptedNumber:
     """
     Encrypt a single integer value using the public key.
     
     Args:
         public_key: The Paillier public key
         value: The plaintext integer to encrypt (0 or 1 for board cells)
+        obfuscator_pool: Optional pool of precomputed obfuscators for this key
+        
+    Returns:
+        An encrypted number
+    """
+    if obfuscator_pool is not None:
+        return obfuscator_pool.encrypt(value)
+    backend = get_backend()
+    obfuscator = backend.powmod(public_key.get_random_lt_n(), public_key.n, public_key.nsquare)
+    return _encrypt_with_obfuscator(public_key, value, obfuscator)
+
+
+def _encrypt_with_obfuscator(public_key: PaillierPublicKey, value: int,
+                             obfuscator: int) -> EncryptedNumber:
+    """Encrypt a value with a given obfuscator r^n mod n^2."""
+    encoding = EncodedNumber.encode(public_key, value)
+    # r_value=1 makes phe skip its own obfuscation (1^n = 1)
+    nude_ciphertext = public_key.raw_encrypt(encoding.encoding, r_value=1)
+    ciphertext = get_backend().mulmod(nude_ciphertext, obfuscator, public_key.nsquare)
+    return make_encrypted_number(public_key, ciphertext, encoding.exponent)
+
+
+def make_encrypted_number(
+    public_key: PaillierPublicKey,
+    ciphertext: int,
+    exponent: int = 0
+) -> EncryptedNumber:
+    """
+    Wrap an already-obfuscated raw ciphertext in an EncryptedNumber.
+    
+    Used when ciphertexts were produced elsewhere (e.g. a worker process),
+    so that phe does not obfuscate them a second time when they are sent.
+    
+    Args:
+        public_key: The Paillier public key the ciphertext belongs to
+        ciphertext: The raw, already obfuscated ciphertext
+        exponent: The encoding exponent (0 for integers)
         
     Returns:
         An encrypted number
     """
-    return public_key.encrypt(value)
+    encrypted = EncryptedNumber(public_key, ciphertext, exponent)
+    # phe keeps this flag private; the ciphertext is already randomized
+    encrypted._EncryptedNumber__is_obfuscated = True
+    return encrypted
 
 
 def decrypt_value(private_key: PaillierPrivateKey, encrypted_value: EncryptedNumber) -> int:
@@ -50,13 +116,441 @@ def decrypt_value(private_key: PaillierPrivateKey, encrypted_value: EncryptedNum
     Returns:
         The decrypted integer value
     """
-    decrypted = private_key.decrypt(encrypted_value)
-    return int(decrypted)
+    if encrypted_value.public_key != private_key.public_key:
+        raise ValueError("encrypted_value was encrypted against a different key!")
+    
+    plaintext = raw_decrypt(private_key, encrypted_value.ciphertext(be_secure=False))
+    encoded = EncodedNumber(private_key.public_key, plaintext, encrypted_value.exponent)
+    return int(encoded.decode())
+
+
+def raw_decrypt(private_key: PaillierPrivateKey, ciphertext: int) -> int:
+    """
+    Decrypt a raw ciphertext to its plaintext integer mod n.
+    
+    CRT decryption, as in phe's raw_decrypt, on the active backend.
+    
+    Args:
+        private_key: The Paillier private key
+        ciphertext: The raw ciphertext
+        
+    Returns:
+        The plaintext in [0, n)
+    """
+    backend = get_backend()
+    p, q = private_key.p, private_key.q
+    decrypt_to_p = backend.mulmod(
+        (backend.powmod(ciphertext, p - 1, private_key.psquare) - 1) // p, private_key.hp, p
+    )
+    decrypt_to_q = backend.mulmod(
+        (backend.powmod(ciphertext, q - 1, private_key.qsquare) - 1) // q, private_key.hq, q
+    )
+    u = backend.mulmod(decrypt_to_q - decrypt_to_p, private_key.p_inverse, q)
+    return decrypt_to_p + u * p
+
+
+def _zero_test_chunk(p: int, q: int, ciphertexts: List[int]) -> List[bool]:
+    """
+    Zero-test raw ciphertexts given the private primes.
+    
+    Module-level so it can run inside worker processes.
+    
+    Args:
+        p: First private prime
+        q: Second private prime
+        ciphertexts: Raw ciphertexts to test
+        
+    Returns:
+        List of booleans, True where the plaintext is 0
+    """
+    powmod = get_backend().powmod
+    psquare, qsquare = p * p, q * q
+    return [powmod(c, p - 1, psquare) == 1 and powmod(c, q - 1, qsquare) == 1
+            for c in ciphertexts]
+
+
+def _zero_test_one(p: int, q: int, ciphertext: int) -> bool:
+    """Zero-test a single raw ciphertext (worker-process entry point)."""
+    return _zero_test_chunk(p, q, [ciphertext])[0]
+
+
+class ZeroTestDecryptor:
+    """
+    Decides whether a ciphertext encrypts zero, without full decryption.
+    
+    Hit checks only need to know whether the blinded plaintext m is 0.
+    Using the CRT precomputations on the private key, m = 0 mod p exactly
+    when c^(p-1) mod p^2 == 1, so no L-function, CRT recombination or
+    EncodedNumber decoding is needed, and a miss usually returns after
+    the p half alone. Every call's latency is recorded.
+    """
+    
+    def __init__(self, private_key: PaillierPrivateKey, history_size: int = 1024):
+        """
+        Initialize the zero-test decryptor.
+        
+        Args:
+            private_key: The Paillier private key
+            history_size: Number of recent call latencies kept for stats
+        """
+        self.private_key = private_key
+        self._p_minus_1 = private_key.p - 1
+        self._q_minus_1 = private_key.q - 1
+        self._psquare = private_key.psquare
+        self._qsquare = private_key.qsquare
+        self.last_latency_ns = 0
+        self.calls = 0
+        self.latencies_ns: deque = deque(maxlen=history_size)
+        # Latencies of submitted tests are recorded from executor callback threads
+        self._stats_lock = threading.Lock()
+    
+    def _record_latency(self, latency_ns: int) -> None:
+        """Record the latency of one call."""
+        with self._stats_lock:
+            self.last_latency_ns = latency_ns
+            self.latencies_ns.append(latency_ns)
+            self.calls += 1
+    
+    def is_zero(self, encrypted_value: EncryptedNumber) -> bool:
+        """
+        Check whether an encrypted value decrypts to zero.
+        
+        Args:
+            encrypted_value: The encrypted number to test
+            
+        Returns:
+            True if the plaintext is 0 (a HIT for hit-check results)
+        """
+        if encrypted_value.public_key != self.private_key.public_key:
+            raise ValueError("encrypted_value was encrypted against a different key!")
+        
+        start = time.perf_counter_ns()
+        ciphertext = encrypted_value.ciphertext(be_secure=False)
+        powmod = get_backend().powmod
+        is_zero = (powmod(ciphertext, self._p_minus_1, self._psquare) == 1
+                   and powmod(ciphertext, self._q_minus_1, self._qsquare) == 1)
+        self._record_latency(time.perf_counter_ns() - start)
+        return is_zero
+    
+    def submit_is_zero(self, encrypted_value: EncryptedNumber, executor: Executor) -> Future:
+        """
+        Start a zero test on an executor without waiting for it.
+        
+        The latency recorded for the call runs from submission until the
+        worker returns the result.
+        
+        Args:
+            encrypted_value: The encrypted number to test
+            executor: Executor (typically a process pool) to run the test on
+            
+        Returns:
+            A future resolving to True if the plaintext is 0
+        """
+        if encrypted_value.public_key != self.private_key.public_key:
+            raise ValueError("encrypted_value was encrypted against a different key!")
+        
+        start = time.perf_counter_ns()
+        future = executor.submit(_zero_test_one, self.private_key.p, self.private_key.q,
+                                 encrypted_value.ciphertext(be_secure=False))
+        
+        def record_latency(done: Future) -> None:
+            if not done.cancelled():
+                self._record_latency(time.perf_counter_ns() - start)
+        
+        future.add_done_callback(record_latency)
+        return future
+    
+    def is_zero_many(self, encrypted_values: List[EncryptedNumber],
+                     executor: Optional[Executor] = None,
+                     chunk_size: int = 8) -> List[bool]:
+        """
+        Zero-test a batch of ciphertexts, optionally on an executor.
+        
+        The whole batch counts as one call for latency statistics.
+        
+        Args:
+            encrypted_values: The encrypted numbers to test
+            executor: Optional process pool to spread the tests over
+            chunk_size: Number of ciphertexts sent to a worker at a time
+            
+        Returns:
+            List of booleans, True where the plaintext is 0
+        """
+        for encrypted_value in encrypted_values:
+            if encrypted_value.public_key != self.private_key.public_key:
+                raise ValueError("encrypted_value was encrypted against a different key!")
+        
+        start = time.perf_counter_ns()
+        ciphertexts = [value.ciphertext(be_secure=False) for value in encrypted_values]
+        if executor is None or len(ciphertexts) <= 1:
+            results = _zero_test_chunk(self.private_key.p, self.private_key.q, ciphertexts)
+        else:
+            futures = [
+                executor.submit(_zero_test_chunk, self.private_key.p, self.private_key.q,
+                                ciphertexts[i:i + chunk_size])
+                for i in range(0, len(ciphertexts), chunk_size)
+            ]
+            results = [result for future in futures for result in future.result()]
+        self._record_latency(time.perf_counter_ns() - start)
+        return results
+    
+    def stats(self) -> Dict:
+        """
+        Get latency statistics over the recent calls.
+        
+        Returns:
+            Dictionary with call count and latency percentiles in nanoseconds
+        """
+        with self._stats_lock:
+            latencies = sorted(self.latencies_ns)
+            calls, last_latency_ns = self.calls, self.last_latency_ns
+        if not latencies:
+            return {"calls": calls, "last_ns": 0, "mean_ns": 0,
+                    "p50_ns": 0, "p99_ns": 0, "max_ns": 0}
+        return {
+            "calls": calls,
+            "last_ns": last_latency_ns,
+            "mean_ns": sum(latencies) // len(latencies),
+            "p50_ns": latencies[len(latencies) // 2],
+            "p99_ns": latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)],
+            "max_ns": latencies[-1],
+        }
+
+
+class ObfuscatorPool:
+    """
+    Pool of precomputed Paillier obfuscators for a single public key.
+    
+    Nearly all of the cost of a Paillier encryption is the obfuscator
+    r^n mod n^2. A background thread computes these ahead of time so the
+    online encrypt and re-randomize paths only do one modular multiply.
+    Whenever the pool drops below the low watermark the thread refills it
+    up to the high watermark; if the pool is empty, obfuscators are
+    computed inline and counted as misses.
+    
+    With a FixedBaseCache, obfuscators are computed as h^s for the key's
+    fixed n-th residue h and a random s < n, using a windowed table for h
+    that is shared by every pool (and game) using the same key.
+    """
+    
+    def __init__(self, public_key: PaillierPublicKey, size: int = 256,
+                 low_watermark: Optional[int] = None,
+                 high_watermark: Optional[int] = None,
+                 start: bool = True,
+                 fixed_base_cache: Optional[FixedBaseCache] = None):
+        """
+        Initialize the obfuscator pool.
+        
+        Args:
+            public_key: The Paillier public key the obfuscators are for
+            size: Maximum number of precomputed obfuscators held
+            low_watermark: Refill is triggered below this level (default size // 2)
+            high_watermark: Refill stops at this level (default size)
+            start: Whether to start the background refill thread immediately
+            fixed_base_cache: Optional cache for fixed-base obfuscator tables
+        """
+        if high_watermark is None:
+            high_watermark = size
+        if low_watermark is None:
+            low_watermark = size // 2
+        if not 0 <= low_watermark <= high_watermark <= size:
+            raise ValueError("Watermarks must satisfy 0 <= low <= high <= size")
+        
+        self.public_key = public_key
+        self.size = size
+        self.low_watermark = low_watermark
+        self.high_watermark = high_watermark
+        self.fixed_base_cache = fixed_base_cache
+        self.hits = 0
+        self.misses = 0
+        self._pool: deque = deque(maxlen=size)
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        if start:
+            self.start()
+    
+    def _compute_obfuscator(self) -> int:
+        """Compute a fresh r^n mod n^2 for a random r < n (or h^s with a fixed-base table)."""
+        r = self.public_key.get_random_lt_n()
+        if self.fixed_base_cache is not None:
+            table = self._obfuscator_table()
+            if table is not None:
+                return table.pow(r)
+        return get_backend().powmod(r, self.public_key.n, self.public_key.nsquare)
+    
+    def _obfuscator_table(self) -> Optional[FixedBaseTable]:
+        """Get the fixed-base table of the key's obfuscator base, building it if needed."""
+        base = obfuscator_base(self.public_key)
+        table = self.fixed_base_cache.get(base, self.public_key.nsquare)
+        if table is None:
+            table = self.fixed_base_cache.build(base, self.public_key.nsquare,
+                                                self.public_key.n.bit_length())
+        return table
+    
+    def start(self) -> None:
+        """Start the background refill thread if it is not running."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._refill_loop, daemon=True,
+                                            name="obfuscator-pool")
+            self._thread.start()
+    
+    def _refill_loop(self) -> None:
+        """Wait for the pool to drain below the low watermark, then refill it."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._closed or len(self._pool) < self.low_watermark
+                )
+                if self._closed:
+                    return
+            self.fill()
+    
+    def fill(self, target: Optional[int] = None) -> None:
+        """
+        Synchronously fill the pool up to the target level.
+        
+        Args:
+            target: Number of obfuscators to hold (default high watermark)
+        """
+        target = self.high_watermark if target is None else min(target, self.size)
+        while True:
+            with self._condition:
+                if self._closed or len(self._pool) >= target:
+                    return
+            obfuscator = self._compute_obfuscator()
+            with self._condition:
+                self._pool.append(obfuscator)
+    
+    def take(self) -> int:
+        """
+        Take one obfuscator from the pool, computing it inline if empty.
+        
+        Returns:
+            An obfuscator r^n mod n^2
+        """
+        with self._condition:
+            if self._pool:
+                obfuscator = self._pool.popleft()
+                self.hits += 1
+            else:
+                obfuscator = None
+                self.misses += 1
+            if len(self._pool) < self.low_watermark:
+                self._condition.notify()
+        if obfuscator is None:
+            obfuscator = self._compute_obfuscator()
+        return obfuscator
+    
+    def encrypt(self, value: int) -> EncryptedNumber:
+        """
+        Encrypt a value using a pooled obfuscator.
+        
+        Args:
+            value: The plaintext integer to encrypt
+            
+        Returns:
+            An encrypted number
+        """
+        return _encrypt_with_obfuscator(self.public_key, value, self.take())
+    
+    def encrypt_cells(self, public_key: PaillierPublicKey,
+                      cells: Dict[Tuple[int, int], int]) -> Dict[Tuple[int, int], EncryptedNumber]:
+        """
+        Encrypt a mapping of coordinates to plaintext cell values.
+        
+        Lets the pool be passed to Board.encrypt_board as an engine.
+        
+        Args:
+            public_key: The Paillier public key (must match the pool's key)
+            cells: Dictionary mapping coordinates to plaintext values
+            
+        Returns:
+            Dictionary mapping coordinates to encrypted cell values
+        """
+        if public_key != self.public_key:
+            raise ValueError("Obfuscator pool belongs to a different public key")
+        return {coord: self.encrypt(value) for coord, value in cells.items()}
+    
+    def rerandomize(self, encrypted_value: EncryptedNumber) -> EncryptedNumber:
+        """
+        Return a fresh-looking encryption of the same plaintext.
+        
+        Args:
+            encrypted_value: The encrypted number to re-randomize
+            
+        Returns:
+            A new encrypted number with a pooled obfuscator applied
+        """
+        if encrypted_value.public_key != self.public_key:
+            raise ValueError("Obfuscator pool belongs to a different public key")
+        ciphertext = get_backend().mulmod(encrypted_value.ciphertext(be_secure=False),
+                                          self.take(), self.public_key.nsquare)
+        return make_encrypted_number(self.public_key, ciphertext, encrypted_value.exponent)
+    
+    def stats(self) -> Dict:
+        """
+        Get pool usage statistics.
+        
+        Returns:
+            Dictionary with hit/miss counts, hit rate and current fill level
+        """
+        with self._condition:
+            taken = self.hits + self.misses
+            return {
+                "size": self.size,
+                "available": len(self._pool),
+                "low_watermark": self.low_watermark,
+                "high_watermark": self.high_watermark,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / taken if taken else 0.0,
+                "miss_rate": self.misses / taken if taken else 0.0,
+            }
+    
+    def close(self) -> None:
+        """Stop the background refill thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+def obfuscator_base(public_key: PaillierPublicKey) -> int:
+    """
+    Get the fixed obfuscator base of a public key.
+    
+    The base is a random n-th residue h = r^n mod n^2, so every h^s is
+    a valid obfuscator. Bases of the OBFUSCATOR_BASE_CACHE_SIZE most
+    recently used keys are kept; a key whose base was evicted simply gets
+    a new one.
+    
+    Args:
+        public_key: The Paillier public key
+        
+    Returns:
+        The obfuscator base h
+    """
+    with _obfuscator_bases_lock:
+        base = _obfuscator_bases.get(public_key.n)
+        if base is not None:
+            _obfuscator_bases.move_to_end(public_key.n)
+            return base
+    base = get_backend().powmod(public_key.get_random_lt_n(), public_key.n, public_key.nsquare)
+    with _obfuscator_bases_lock:
+        base = _obfuscator_bases.setdefault(public_key.n, base)
+        _obfuscator_bases.move_to_end(public_key.n)
+        while len(_obfuscator_bases) > OBFUSCATOR_BASE_CACHE_SIZE:
+            _obfuscator_bases.popitem(last=False)
+    return base
 
 
 def perform_homomorphic_hit_check(
     encrypted_cell: EncryptedNumber,
-    guess_value: int
+    guess_value: int,
+    obfuscator_pool: Optional[ObfuscatorPool] = None
 ) -> EncryptedNumber:
     """
     Perform homomorphic hit checking without revealing the cell value.
@@ -70,22 +564,132 @@ def perform_homomorphic_hit_check(
     Args:
         encrypted_cell: The encrypted cell value (0 or 1)
         guess_value: The guessed value (typically 1)
+        obfuscator_pool: Optional pool used to re-randomize the result
         
     Returns:
         The encrypted blinded result
     """
     # Compute encrypted difference
-    encrypted_difference = encrypted_cell - guess_value
+    encrypted_difference = make_hit_probe(encrypted_cell, guess_value)
+    return blind_hit_probe(encrypted_difference, obfuscator_pool)
+
+
+def make_hit_probe(encrypted_cell: EncryptedNumber, guess_value: int = 1) -> EncryptedNumber:
+    """
+    Compute the unblinded hit-check probe of a cell.
     
+    The probe encrypted_cell - guess_value is 0 exactly on a hit. It
+    does not depend on the shot, so it can be computed ahead of time
+    (see HitProbeTable) and blinded with blind_hit_probe when fired at.
+    
+    Args:
+        encrypted_cell: The encrypted cell value (0 or 1)
+        guess_value: The guessed value (typically 1)
+        
+    Returns:
+        The encrypted difference
+    """
+    return encrypted_cell - guess_value
+
+
+def blind_hit_probe(
+    probe: EncryptedNumber,
+    obfuscator_pool: Optional[ObfuscatorPool] = None,
+    fixed_base_cache: Optional[FixedBaseCache] = None
+) -> EncryptedNumber:
+    """
+    Blind a hit-check probe with a fresh random factor.
+    
+    Args:
+        probe: The encrypted difference from make_hit_probe
+        obfuscator_pool: Optional pool used to re-randomize the result
+        fixed_base_cache: Optional cache holding a fixed-base table for the probe
+        
+    Returns:
+        The encrypted blinded result
+    """
     # Apply random blinding to hide miss values
     # If difference is 0 (hit): 0 * random = 0
     # If difference is non-zero (miss): non-zero * random = random junk
-    blinding_factor = random.randint(1, 999999)
-    encrypted_result = encrypted_difference * blinding_factor
+    blinding_factor = random.randint(1, BLINDING_FACTOR_MAX)
+    public_key = probe.public_key
+    if fixed_base_cache is not None:
+        ciphertext = fixed_base_cache.pow(probe.ciphertext(be_secure=False),
+                                          public_key.nsquare, blinding_factor)
+    else:
+        ciphertext = get_backend().powmod(probe.ciphertext(be_secure=False),
+                                          blinding_factor, public_key.nsquare)
+    encrypted_result = EncryptedNumber(public_key, ciphertext, probe.exponent)
+    
+    if obfuscator_pool is not None:
+        encrypted_result = obfuscator_pool.rerandomize(encrypted_result)
     
     return encrypted_result
 
 
+def perform_packed_hit_check(
+    encrypted_packed: EncryptedNumber,
+    slot: int,
+    slot_bits: int,
+    num_slots: int,
+    guess_value: int = 1
+) -> EncryptedNumber:
+    """
+    Perform a homomorphic hit check on one slot of a packed ciphertext.
+    
+    The packed plaintext holds num_slots cells of slot_bits bits each.
+    The logic:
+    - Add a guard bit above the top slot so the plaintext stays positive
+    - Subtract guess_value in the target slot → slot is 0 on a HIT and
+      wraps to all ones (borrowing from the guard) on a MISS
+    - Add random noise to every other slot to isolate the target slot
+      (cells are 0/1 and noise stays below 2^slot_bits - 1, so nothing
+      carries into the target slot)
+    
+    Args:
+        encrypted_packed: The encrypted packed plaintext
+        slot: Index of the slot to check
+        slot_bits: Width of each slot in bits
+        num_slots: Number of slots in the packed plaintext
+        guess_value: The guessed value (typically 1)
+        
+    Returns:
+        The encrypted result, to be read with decrypt_packed_slot
+    """
+    if not 0 <= slot < num_slots:
+        raise ValueError(f"Slot {slot} out of range")
+    
+    slot_max_noise = (1 << slot_bits) - 2
+    offset = (1 << (slot_bits * num_slots)) - (guess_value << (slot_bits * slot))
+    for other_slot in range(num_slots):
+        if other_slot != slot:
+            offset += random.randint(0, slot_max_noise) << (slot_bits * other_slot)
+    
+    return encrypted_packed + offset
+
+
+def decrypt_packed_slot(
+    private_key: PaillierPrivateKey,
+    encrypted_result: EncryptedNumber,
+    slot: int,
+    slot_bits: int
+) -> int:
+    """
+    Decrypt a packed hit-check result and extract a single slot.
+    
+    Args:
+        private_key: The Paillier private key
+        encrypted_result: Result of perform_packed_hit_check
+        slot: Index of the slot to extract
+        slot_bits: Width of each slot in bits
+        
+    Returns:
+        The slot value (0 means HIT, see check_hit)
+    """
+    plaintext = raw_decrypt(private_key, encrypted_result.ciphertext(be_secure=False))
+    return (plaintext >> (slot * slot_bits)) & ((1 << slot_bits) - 1)
+
+
 def check_hit(decrypted_result: int) -> bool:
     """
     Determine if a guess was a hit or miss based on the decrypted result.
@@ -0,0 +1,133 @@
+"""
+Parallel encryption engine for Battleship boards.
+
+Spreads the per-cell Paillier encryptions of a board across a pool of
+worker processes so that match setup scales with the available cores.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from phe.paillier import PaillierPublicKey, EncryptedNumber
+from src.crypto import encrypt_value, make_encrypted_number, ZeroTestDecryptor
+
+
+def _encrypt_chunk(n: int, values: List[int]) -> List[Tuple[int, int]]:
+    """
+    Encrypt a chunk of plaintext values inside a worker process.
+
+    Only the modulus crosses the process boundary; the public key is
+    rebuilt here and raw (ciphertext, exponent) pairs are sent back.
+
+    Args:
+        n: The Paillier modulus of the public key
+        values: Plaintext values to encrypt
+
+    Returns:
+        List of (ciphertext, exponent) tuples in input order
+    """
+    public_key = PaillierPublicKey(n)
+    results = []
+    for value in values:
+        encrypted = encrypt_value(public_key, value)
+        results.append((encrypted.ciphertext(be_secure=False), encrypted.exponent))
+    return results
+
+
+class EncryptionEngine:
+    """
+    Encrypts board cells in parallel using a process pool.
+
+    The pool is created lazily on first use and reused across boards,
+    so a single engine can be shared by many matches.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, chunks_per_worker: int = 4):
+        """
+        Initialize the encryption engine.
+
+        Args:
+            max_workers: Number of worker processes (defaults to the CPU count).
+                With a single worker, cells are encrypted in-process.
+            chunks_per_worker: How many chunks each worker receives per board,
+                which smooths out uneven scheduling between workers
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if chunks_per_worker < 1:
+            raise ValueError("chunks_per_worker must be at least 1")
+
+        self.max_workers = max_workers
+        self.chunks_per_worker = chunks_per_worker
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Create the worker pool on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def encrypt_cells(self, public_key: PaillierPublicKey,
+                      cells: Dict[Tuple[int, int], int]) -> Dict[Tuple[int, int], EncryptedNumber]:
+        """
+        Encrypt a mapping of coordinates to plaintext cell values.
+
+        Args:
+            public_key: The Paillier public key for encryption
+            cells: Dictionary mapping coordinates to plaintext values
+
+        Returns:
+            Dictionary mapping coordinates to encrypted cell values
+        """
+        coords = list(cells)
+        values = [cells[coord] for coord in coords]
+
+        if self.max_workers == 1 or len(coords) < 2:
+            return {coord: encrypt_value(public_key, value) for coord, value in zip(coords, values)}
+
+        # Split the cells into contiguous chunks, a few per worker
+        num_chunks = min(len(values), self.max_workers * self.chunks_per_worker)
+        chunk_size = -(-len(values) // num_chunks)
+        executor = self._get_executor()
+        futures = [
+            executor.submit(_encrypt_chunk, public_key.n, values[start:start + chunk_size])
+            for start in range(0, len(values), chunk_size)
+        ]
+
+        encrypted_board = {}
+        coord_iter = iter(coords)
+        for future in futures:
+            for ciphertext, exponent in future.result():
+                encrypted_board[next(coord_iter)] = make_encrypted_number(
+                    public_key, ciphertext, exponent
+                )
+        return encrypted_board
+
+    def zero_test_many(self, decryptor: ZeroTestDecryptor,
+                       encrypted_values: List[EncryptedNumber]) -> List[bool]:
+        """
+        Zero-test a batch of hit-check results on the worker pool.
+
+        Args:
+            decryptor: The defender's zero-test decryptor
+            encrypted_values: The encrypted results to test
+
+        Returns:
+            List of booleans, True where the plaintext is 0
+        """
+        executor = self._get_executor() if self.max_workers > 1 else None
+        return decryptor.is_zero_many(encrypted_values, executor)
+
+    def shutdown(self) -> None:
+        """Shut down the worker pool, if it was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "EncryptionEngine":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.shutdown()
@@ -0,0 +1,239 @@
+"""
+Fixed-base windowed exponentiation for Homomorphic Battleship.
+
+Some bases are raised to many different exponents, such as the
+obfuscator base h of a public key, which every encryption under that key
+raises to a fresh random exponent. For such a base, a table of base^(d * 2^(w * i)) for every w-bit digit d
+turns an exponentiation into one modular multiply per non-zero digit of
+the exponent, with no squarings.
+
+Tables are large (one residue per entry), so they live in a
+FixedBaseCache with a memory budget that evicts the least recently used
+tables, letting tables for keys from finished games make room for new
+ones.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from src.backend import get_backend
+
+
+class FixedBaseTable:
+    """Windowed powers of one base modulo a fixed modulus."""
+
+    __slots__ = ("base", "modulus", "exponent_bits", "window_bits", "_rows")
+
+    def __init__(self, base: int, modulus: int, exponent_bits: int, window_bits: int = 4):
+        """
+        Precompute the table.
+
+        Args:
+            base: The fixed base
+            modulus: The modulus (n^2 for Paillier ciphertexts)
+            exponent_bits: Largest exponent bit length served from the table
+            window_bits: Bits of the exponent consumed per table row
+        """
+        if exponent_bits < 1 or window_bits < 1:
+            raise ValueError("exponent_bits and window_bits must be positive")
+        self.base = base
+        self.modulus = modulus
+        self.exponent_bits = exponent_bits
+        self.window_bits = window_bits
+
+        # Row i holds base^(d * 2^(window_bits * i)) for d = 0 .. 2^window_bits - 1
+        rows: List[Tuple[int, ...]] = []
+        row_base = base % modulus
+        for _ in range(-(-exponent_bits // window_bits)):
+            row = [1, row_base]
+            for _ in range(2, 1 << window_bits):
+                row.append(row[-1] * row_base % modulus)
+            rows.append(tuple(row))
+            row_base = row[-1] * row_base % modulus
+        self._rows = rows
+
+    @staticmethod
+    def estimate_nbytes(modulus: int, exponent_bits: int, window_bits: int = 4) -> int:
+        """Estimate the memory held by a table, counting each entry at the modulus size."""
+        rows = -(-exponent_bits // window_bits)
+        return rows * (1 << window_bits) * ((modulus.bit_length() + 7) // 8)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the table."""
+        return self.estimate_nbytes(self.modulus, self.exponent_bits, self.window_bits)
+
+    def pow(self, exponent: int) -> int:
+        """
+        Compute base^exponent mod modulus.
+
+        Exponents longer than the table fall back to a plain modular
+        exponentiation.
+
+        Args:
+            exponent: Non-negative exponent
+
+        Returns:
+            The modular power
+        """
+        if exponent < 0:
+            raise ValueError("exponent must be non-negative")
+        if exponent.bit_length() > self.exponent_bits:
+            return get_backend().powmod(self.base, exponent, self.modulus)
+
+        modulus = self.modulus
+        mask = (1 << self.window_bits) - 1
+        result = 1
+        for row in self._rows:
+            if not exponent:
+                break
+            digit = exponent & mask
+            if digit:
+                result = result * row[digit] % modulus
+            exponent >>= self.window_bits
+        return result % modulus
+
+
+class FixedBaseCache:
+    """
+    Least-recently-used store of FixedBaseTables under a memory budget.
+
+    Lookups never build tables, so online paths stay cheap: a base
+    without a table falls back to a plain exponentiation. Tables are
+    built ahead of time with build, typically from background threads.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, window_bits: int = 4):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Memory budget for all tables together
+            window_bits: Window size of the tables built by this cache
+        """
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative")
+        self.max_bytes = max_bytes
+        self.window_bits = window_bits
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._tables: "OrderedDict[Tuple[int, int], FixedBaseTable]" = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, base: int, modulus: int) -> Optional[FixedBaseTable]:
+        """
+        Look up the table of a base and mark it recently used.
+
+        Args:
+            base: The fixed base
+            modulus: The modulus
+
+        Returns:
+            The table, or None if it is not cached
+        """
+        with self._lock:
+            table = self._tables.get((modulus, base))
+            if table is None:
+                self.misses += 1
+                return None
+            self._tables.move_to_end((modulus, base))
+            self.hits += 1
+            return table
+
+    def build(self, base: int, modulus: int, exponent_bits: int) -> Optional[FixedBaseTable]:
+        """
+        Get the table of a base, building and caching it if needed.
+
+        Least recently used tables are evicted to stay within the
+        memory budget. A table larger than the whole budget is not built.
+
+        Args:
+            base: The fixed base
+            modulus: The modulus
+            exponent_bits: Largest exponent bit length the table must serve
+
+        Returns:
+            The table, or None if it does not fit in the budget
+        """
+        key = (modulus, base)
+        with self._lock:
+            table = self._tables.get(key)
+            if table is not None and table.exponent_bits >= exponent_bits:
+                self._tables.move_to_end(key)
+                return table
+        if FixedBaseTable.estimate_nbytes(modulus, exponent_bits, self.window_bits) > self.max_bytes:
+            return None
+
+        # Build outside the lock; lookups from other threads keep running
+        table = FixedBaseTable(base, modulus, exponent_bits, self.window_bits)
+        with self._lock:
+            previous = self._tables.pop(key, None)
+            if previous is not None:
+                self._nbytes -= previous.nbytes
+            self._tables[key] = table
+            self._nbytes += table.nbytes
+            while self._nbytes > self.max_bytes:
+                _, evicted = self._tables.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+                self.evictions += 1
+        return table
+
+    def pow(self, base: int, modulus: int, exponent: int) -> int:
+        """
+        Compute base^exponent mod modulus, using a cached table if there is one.
+
+        Args:
+            base: The base
+            modulus: The modulus
+            exponent: Non-negative exponent
+
+        Returns:
+            The modular power
+        """
+        table = self.get(base, modulus)
+        if table is None:
+            return get_backend().powmod(base, exponent, modulus)
+        return table.pow(exponent)
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def clear(self) -> None:
+        """Drop every table."""
+        with self._lock:
+            self._tables.clear()
+            self._nbytes = 0
+
+    def stats(self) -> Dict:
+        """
+        Get cache usage statistics.
+
+        Returns:
+            Dictionary with table count, memory use and hit/miss/eviction counts
+        """
+        with self._lock:
+            looked_up = self.hits + self.misses
+            return {
+                "tables": len(self._tables),
+                "bytes": self._nbytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / looked_up if looked_up else 0.0,
+            }
+
+
+_default_cache: Optional[FixedBaseCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> FixedBaseCache:
+    """Get the process-wide FixedBaseCache shared by games."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = FixedBaseCache()
+        return _default_cache
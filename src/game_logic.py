@@ -4,11 +4,140 @@ Core game logic for Homomorphic Battleship.
 Handles turn management, hit checking, and game state.
 """
 
-from typing import Dict, Tuple, Optional
+import uuid
+from array import array
+from typing import Dict, Iterator, List, Tuple, Optional, Union
 from dataclasses import dataclass, field
-from phe.paillier import PaillierPublicKey, PaillierPrivateKey
+from phe.paillier import PaillierPublicKey, PaillierPrivateKey, EncryptedNumber
 from src.board import Board
-from src.crypto import perform_homomorphic_hit_check, check_hit, decrypt_value
+from src.crypto import (perform_homomorphic_hit_check, blind_hit_probe, check_hit,
+                        ObfuscatorPool, ZeroTestDecryptor)
+from src.packed_board import PackedEncryptedBoard
+from src.lazy_board import LazyEncryptedBoard
+from src.hit_probes import HitProbeTable
+
+
+class GameHistory:
+    """
+    Compact columnar log of every guess in a game.
+    
+    Each turn is stored as one entry in parallel typed arrays instead of
+    a dict, and player and ship names are interned. Indexing and
+    iteration build the familiar history dicts on demand.
+    """
+    
+    __slots__ = ("_turns", "_players", "_xs", "_ys", "_flags", "_sunk", "_names", "_name_ids")
+    
+    _HIT = 1
+    _DUPLICATE = 2
+    
+    def __init__(self):
+        """Initialize an empty history."""
+        self._turns = array("I")
+        # Name ids are 16-bit: Board.MAX_BOARD_SIZE caps each fleet well below 65535 ships
+        self._players = array("H")
+        self._xs = array("H")
+        self._ys = array("H")
+        self._flags = array("B")
+        self._sunk = array("H")  # 0 = no ship sunk, otherwise name id + 1
+        self._names: List[str] = []
+        self._name_ids: Dict[str, int] = {}
+    
+    def _intern(self, name: str) -> int:
+        """Get the id of a player or ship name, registering it if new."""
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = len(self._names)
+            self._names.append(name)
+            self._name_ids[name] = name_id
+        return name_id
+    
+    def record(self, turn: int, player: str, x: int, y: int,
+               is_hit: bool, ship_sunk: Optional[str], is_duplicate: bool) -> None:
+        """
+        Record one guess.
+        
+        Args:
+            turn: Turn number
+            player: Name of the guessing player
+            x: X coordinate
+            y: Y coordinate
+            is_hit: Whether the guess hit a ship
+            ship_sunk: Name of the ship sunk by this guess, if any
+            is_duplicate: Whether the cell had already been guessed
+        """
+        row = (
+            (self._turns, turn),
+            (self._players, self._intern(player)),
+            (self._xs, x),
+            (self._ys, y),
+            (self._flags, (self._HIT if is_hit else 0) | (self._DUPLICATE if is_duplicate else 0)),
+            (self._sunk, 0 if ship_sunk is None else self._intern(ship_sunk) + 1),
+        )
+        # Append the whole row or nothing, so a bad value never leaves the columns ragged
+        appended = []
+        try:
+            for column, value in row:
+                column.append(value)
+                appended.append(column)
+        except (TypeError, OverflowError):
+            for column in appended:
+                column.pop()
+            raise
+    
+    def append(self, entry: Dict) -> None:
+        """
+        Record one guess given in the history dict shape.
+        
+        Args:
+            entry: Dictionary with turn, player, coordinate, is_hit,
+                ship_sunk and is_duplicate keys
+        """
+        x, y = entry["coordinate"]
+        self.record(entry["turn"], entry["player"], x, y,
+                    entry["is_hit"], entry["ship_sunk"], entry["is_duplicate"])
+    
+    def _entry(self, index: int) -> Dict:
+        """Build the history dict for one row."""
+        flags = self._flags[index]
+        sunk = self._sunk[index]
+        return {
+            "turn": self._turns[index],
+            "player": self._names[self._players[index]],
+            "coordinate": (self._xs[index], self._ys[index]),
+            "is_hit": bool(flags & self._HIT),
+            "ship_sunk": self._names[sunk - 1] if sunk else None,
+            "is_duplicate": bool(flags & self._DUPLICATE)
+        }
+    
+    def __len__(self) -> int:
+        return len(self._turns)
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict, List[Dict]]:
+        if isinstance(index, slice):
+            return [self._entry(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("history index out of range")
+        return self._entry(index)
+    
+    def __iter__(self) -> Iterator[Dict]:
+        for index in range(len(self)):
+            yield self._entry(index)
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (GameHistory, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"<GameHistory {len(self)} turns>"
+    
+    def nbytes(self) -> int:
+        """Get the size of the column buffers in bytes."""
+        columns = (self._turns, self._players, self._xs, self._ys, self._flags, self._sunk)
+        return sum(column.itemsize * len(column) for column in columns)
 
 
 @dataclass
@@ -18,7 +147,7 @@ class GameState:
     winner: Optional[str] = None
     current_turn: str = "Alice"
     total_turns: int = 0
-    history: list = field(default_factory=list)
+    history: GameHistory = field(default_factory=GameHistory)
     
     def switch_turn(self) -> None:
         """Switch to the other player's turn."""
@@ -27,22 +156,67 @@ class GameState:
 
 
 class GameLogic:
-    """Manages the game flow and rules."""
+    """
+    Manages the game flow and rules.
+    
+    With encrypted=False no keys are needed and guesses are resolved on
+    the plaintext boards alone (see PlaintextGameLogic).
+    """
     
     def __init__(self, alice_board: Board, bob_board: Board,
-                 alice_public_key: PaillierPublicKey, bob_public_key: PaillierPublicKey,
-                 alice_private_key: PaillierPrivateKey, bob_private_key: PaillierPrivateKey):
+                 alice_public_key: Optional[PaillierPublicKey],
+                 bob_public_key: Optional[PaillierPublicKey],
+                 alice_private_key: Optional[PaillierPrivateKey],
+                 bob_private_key: Optional[PaillierPrivateKey],
+                 encryption_engine=None, packed_boards: bool = False,
+                 alice_encrypted_board=None, bob_encrypted_board=None,
+                 lazy_boards: bool = False, prefetch_lazy_boards: bool = False,
+                 board_store=None, precompute_probes: bool = False,
+                 fixed_base_cache=None, encrypted: bool = True):
         """
         Initialize the game logic.
         
         Args:
             alice_board: Alice's board
             bob_board: Bob's board
-            alice_public_key: Alice's public key
-            bob_public_key: Bob's public key
-            alice_private_key: Alice's private key
-            bob_private_key: Bob's private key
+            alice_public_key: Alice's public key (None if not encrypted)
+            bob_public_key: Bob's public key (None if not encrypted)
+            alice_private_key: Alice's private key (None if not encrypted)
+            bob_private_key: Bob's private key (None if not encrypted)
+            encryption_engine: Optional EncryptionEngine used to encrypt the boards
+            packed_boards: Pack many cells into each ciphertext (PackedEncryptedBoard)
+            alice_encrypted_board: Alice's board if already encrypted (skips re-encryption)
+            bob_encrypted_board: Bob's board if already encrypted (skips re-encryption)
+            lazy_boards: Encrypt each cell on first use (LazyEncryptedBoard)
+            prefetch_lazy_boards: Pre-encrypt lazy boards in a background thread
+            board_store: Optional EncryptedBoardStore; encrypted boards are moved
+                to memory-mapped files so only probed cells are paged in
+            precompute_probes: Prepare every cell's hit-check probe in a
+                background thread so online hit checks only blind it; not
+                available with lazy boards, whose every cell it would encrypt
+            fixed_base_cache: Optional FixedBaseCache; per-cell boards are
+                encrypted with obfuscators from a windowed table of each key's
+                obfuscator base, built once per key and shared across games
+            encrypted: Encrypt the boards and run every guess through the
+                homomorphic hit check; if False, the encryption options must be unset
         """
+        if not encrypted and (encryption_engine is not None or packed_boards or lazy_boards
+                              or board_store is not None or precompute_probes
+                              or fixed_base_cache is not None
+                              or alice_encrypted_board is not None
+                              or bob_encrypted_board is not None):
+            raise ValueError("Board encryption options require encrypted=True")
+        if packed_boards and lazy_boards:
+            raise ValueError("packed_boards and lazy_boards cannot be combined")
+        if board_store is not None and (packed_boards or lazy_boards):
+            raise ValueError("board_store requires fully encrypted per-cell boards")
+        if precompute_probes and (packed_boards or lazy_boards or board_store is not None):
+            raise ValueError("precompute_probes requires fully encrypted in-memory per-cell boards")
+        if fixed_base_cache is not None and (packed_boards or encryption_engine is not None):
+            raise ValueError("fixed_base_cache requires per-cell boards encrypted in-process")
+        if alice_board.board_size != bob_board.board_size:
+            raise ValueError("Both boards must have the same size")
+        
         self.alice_board = alice_board
         self.bob_board = bob_board
         self.alice_public_key = alice_public_key
@@ -50,44 +224,281 @@ class GameLogic:
         self.alice_private_key = alice_private_key
         self.bob_private_key = bob_private_key
         
-        # Encrypt boards and store encrypted versions
-        self.alice_encrypted_board = alice_board.encrypt_board(alice_public_key)
-        self.bob_encrypted_board = bob_board.encrypt_board(bob_public_key)
+        self.encrypted = encrypted
+        
+        # Defender-side zero tests for hit-check results
+        self.zero_testers: Dict[str, ZeroTestDecryptor] = {}
+        if encrypted:
+            self.zero_testers = {
+                "Alice": ZeroTestDecryptor(alice_private_key),
+                "Bob": ZeroTestDecryptor(bob_private_key),
+            }
+        
+        # Board encryption options
+        self.encryption_engine = encryption_engine
+        self.packed_boards = packed_boards
+        self.lazy_boards = lazy_boards
+        self.prefetch_lazy_boards = prefetch_lazy_boards
+        self.fixed_base_cache = fixed_base_cache
+        
+        # Encrypt boards (unless already encrypted) and store encrypted versions
+        self.alice_encrypted_board = alice_encrypted_board
+        self.bob_encrypted_board = bob_encrypted_board
+        self.board_store = board_store
+        self.store_names: List[str] = []
+        if board_store is not None:
+            # Boards live in memory-mapped files; plaintext boards are streamed
+            # straight to disk so big boards are never fully held in RAM
+            store_prefix = uuid.uuid4().hex
+            self.alice_encrypted_board = self._store_board(
+                board_store, f"{store_prefix}-alice", alice_board,
+                self.alice_encrypted_board, alice_public_key
+            )
+            self.bob_encrypted_board = self._store_board(
+                board_store, f"{store_prefix}-bob", bob_board,
+                self.bob_encrypted_board, bob_public_key
+            )
+        if encrypted and self.alice_encrypted_board is None:
+            self.alice_encrypted_board = self._encrypt_board(alice_board, alice_public_key)
+        if encrypted and self.bob_encrypted_board is None:
+            self.bob_encrypted_board = self._encrypt_board(bob_board, bob_public_key)
+        
+        # Precomputed hit-check probes, keyed by the defending player
+        self.probe_tables: Dict[str, HitProbeTable] = {}
+        if precompute_probes:
+            self.probe_tables = {
+                "Alice": HitProbeTable(self.alice_encrypted_board),
+                "Bob": HitProbeTable(self.bob_encrypted_board),
+            }
         
         # Game state
         self.game_state = GameState()
     
+    def _encrypt_board(self, board: Board, public_key: PaillierPublicKey):
+        """Encrypt a board in the configured format."""
+        if self.packed_boards:
+            return PackedEncryptedBoard.from_board(board, public_key)
+        pool = self._obfuscator_pool(public_key)
+        if self.lazy_boards:
+            return LazyEncryptedBoard(board, public_key, pool.encrypt if pool else None,
+                                      background=self.prefetch_lazy_boards)
+        return board.encrypt_board(public_key, pool or self.encryption_engine)
+    
+    def _obfuscator_pool(self, public_key: PaillierPublicKey) -> Optional[ObfuscatorPool]:
+        """Get an inline obfuscator pool on the key's fixed-base table, if a cache is configured."""
+        if self.fixed_base_cache is None:
+            return None
+        return ObfuscatorPool(public_key, start=False, fixed_base_cache=self.fixed_base_cache)
+    
+    def _store_board(self, board_store, name: str, board: Board,
+                     encrypted_board, public_key: PaillierPublicKey):
+        """Move an encrypted board into the store, encrypting it on the way if needed."""
+        self.store_names.append(name)
+        if encrypted_board is None:
+            return board_store.put_board(name, board, public_key,
+                                         self._obfuscator_pool(public_key) or self.encryption_engine)
+        return board_store.put(name, encrypted_board, public_key)
+    
+    def advise_idle(self) -> None:
+        """Let the OS drop the resident pages of memory-mapped boards."""
+        for encrypted_board in (self.alice_encrypted_board, self.bob_encrypted_board):
+            if hasattr(encrypted_board, "advise_idle"):
+                encrypted_board.advise_idle()
+    
+    def close(self) -> None:
+        """
+        Release the game's encrypted boards.
+        
+        Stops background precomputation and removes the game's boards
+        from the board store. Call once the game will not be played any
+        further; calling it again does nothing.
+        """
+        for probe_table in self.probe_tables.values():
+            probe_table.close()
+        for encrypted_board in (self.alice_encrypted_board, self.bob_encrypted_board):
+            if isinstance(encrypted_board, LazyEncryptedBoard):
+                encrypted_board.close()
+        while self.store_names:
+            self.board_store.remove(self.store_names.pop())
+    
+    @property
+    def board_size(self) -> int:
+        """Width and height of both boards."""
+        return self.alice_board.board_size
+    
     def make_guess(self, guessing_player: str, x: int, y: int) -> Tuple[bool, Optional[str], bool]:
         """
         Process a guess from one player against the opponent's board.
         
         Args:
             guessing_player: "Alice" or "Bob"
-            x: X coordinate (0-9)
-            y: Y coordinate (0-9)
+            x: X coordinate (0 to board_size - 1)
+            y: Y coordinate (0 to board_size - 1)
+            
+        Returns:
+            Tuple of (is_hit, ship_name_if_sunk, is_duplicate)
+        """
+        if self.game_state.game_over:
+            raise RuntimeError("Game is already over!")
+        
+        target_board, target_encrypted_board, target_private_key, target_zero_tester = \
+            self._get_target(guessing_player)
+        
+        self._check_coordinate(target_board, x, y)
+        
+        if isinstance(target_encrypted_board, PackedEncryptedBoard):
+            is_hit = self._packed_hit_check(target_encrypted_board, target_private_key, x, y)
+            self._check_hits(target_board, [(x, y)], [is_hit])
+        elif self.encrypted:
+            encrypted_result = self._encrypted_hit_check(guessing_player, target_encrypted_board, x, y)
+            
+            # Target player (defender) only needs to know if the result is zero
+            is_hit = target_zero_tester.is_zero(encrypted_result)
+            self._check_hits(target_board, [(x, y)], [is_hit])
+        
+        return self._record_guess(guessing_player, target_board, x, y)
+    
+    def prepare_guess(self, guessing_player: str, x: int, y: int) -> EncryptedNumber:
+        """
+        Validate a guess and compute its blinded hit-check ciphertext.
+        
+        This is the attacker-side half of make_guess. It does not touch
+        the game state, so it can run ahead of earlier, unresolved shots.
+        Only per-cell encrypted boards are supported.
+        
+        Args:
+            guessing_player: "Alice" or "Bob"
+            x: X coordinate
+            y: Y coordinate
+            
+        Returns:
+            The blinded hit-check ciphertext, under the defender's key
+        """
+        if self.game_state.game_over:
+            raise RuntimeError("Game is already over!")
+        
+        target_board, target_encrypted_board, _, _ = self._get_target(guessing_player)
+        self._check_coordinate(target_board, x, y)
+        if not self.encrypted or isinstance(target_encrypted_board, PackedEncryptedBoard):
+            raise ValueError("prepare_guess requires per-cell encrypted boards")
+        return self._encrypted_hit_check(guessing_player, target_encrypted_board, x, y)
+    
+    def complete_guess(self, guessing_player: str, x: int, y: int,
+                       is_hit: Optional[bool] = None) -> Tuple[bool, Optional[str], bool]:
+        """
+        Record a guess whose hit check has been decided by the defender.
+        
+        This is the bookkeeping half of make_guess.
+        
+        Args:
+            guessing_player: "Alice" or "Bob"
+            x: X coordinate
+            y: Y coordinate
+            is_hit: The defender's zero-test result, checked against the board if given
             
         Returns:
             Tuple of (is_hit, ship_name_if_sunk, is_duplicate)
         """
         if self.game_state.game_over:
             raise RuntimeError("Game is already over!")
+        target_board = self._get_target(guessing_player)[0]
+        self._check_coordinate(target_board, x, y)
+        if is_hit is not None:
+            self._check_hits(target_board, [(x, y)], [is_hit])
+        return self._record_guess(guessing_player, target_board, x, y)
+    
+    def make_salvo(self, guessing_player: str,
+                   coordinates: List[Tuple[int, int]]) -> List[Tuple[bool, Optional[str], bool]]:
+        """
+        Process several guesses from one player in a single call.
+        
+        All blinded hit checks are computed together and the defender
+        decrypts them as one batch (on the encryption engine's process
+        pool if one is configured). The decrypted hits are checked against
+        the plaintext boards before anything is recorded, then shots are
+        recorded in order with the same duplicate and sunk-ship rules as
+        make_guess; shots after the game ends are not recorded.
+        
+        Args:
+            guessing_player: "Alice" or "Bob"
+            coordinates: List of (x, y) coordinates to fire at
+            
+        Returns:
+            List of (is_hit, ship_name_if_sunk, is_duplicate), one per recorded shot
+        """
+        if self.game_state.game_over:
+            raise RuntimeError("Game is already over!")
+        
+        target_board, target_encrypted_board, target_private_key, target_zero_tester = \
+            self._get_target(guessing_player)
+        
+        # Validate the whole salvo before touching any state
+        for x, y in coordinates:
+            self._check_coordinate(target_board, x, y)
+        
+        if isinstance(target_encrypted_board, PackedEncryptedBoard):
+            hits = [self._packed_hit_check(target_encrypted_board, target_private_key, x, y)
+                    for x, y in coordinates]
+        elif self.encrypted:
+            encrypted_results = [self._encrypted_hit_check(guessing_player, target_encrypted_board, x, y)
+                                 for x, y in coordinates]
+            if self.encryption_engine is not None:
+                hits = self.encryption_engine.zero_test_many(target_zero_tester, encrypted_results)
+            else:
+                hits = target_zero_tester.is_zero_many(encrypted_results)
+        else:
+            hits = None
+        
+        return self.complete_salvo(guessing_player, coordinates, hits)
+    
+    def complete_salvo(self, guessing_player: str, coordinates: List[Tuple[int, int]],
+                       hits: Optional[List[bool]] = None) -> List[Tuple[bool, Optional[str], bool]]:
+        """
+        Record a salvo whose hit checks have been decided by the defender.
+        
+        This is the bookkeeping half of make_salvo: every hit is checked
+        against the board before any shot is recorded.
+        
+        Args:
+            guessing_player: "Alice" or "Bob"
+            coordinates: List of (x, y) coordinates fired at
+            hits: The defender's zero-test results, checked against the board if given
+            
+        Returns:
+            List of (is_hit, ship_name_if_sunk, is_duplicate), one per recorded shot
+        """
+        if self.game_state.game_over:
+            raise RuntimeError("Game is already over!")
+        target_board = self._get_target(guessing_player)[0]
+        for x, y in coordinates:
+            self._check_coordinate(target_board, x, y)
+        if hits is not None:
+            self._check_hits(target_board, coordinates, hits)
         
+        outcomes = []
+        for x, y in coordinates:
+            if self.game_state.game_over:
+                break
+            outcomes.append(self._record_guess(guessing_player, target_board, x, y))
+        return outcomes
+    
+    def _get_target(self, guessing_player: str) -> Tuple[Board, object, PaillierPrivateKey, ZeroTestDecryptor]:
+        """Get the board, encrypted board, private key and zero tester being attacked."""
         if guessing_player not in ["Alice", "Bob"]:
             raise ValueError("Invalid player name")
         
-        # Determine which board is being attacked
         if guessing_player == "Alice":
-            target_board = self.bob_board
-            target_encrypted_board = self.bob_encrypted_board
-            target_private_key = self.bob_private_key
-        else:
-            target_board = self.alice_board
-            target_encrypted_board = self.alice_encrypted_board
-            target_private_key = self.alice_private_key
-        
-        # Get the encrypted cell
-        if not (0 <= x < 10 and 0 <= y < 10):
-            raise ValueError(f"Coordinate ({x}, {y}) out of bounds")
+            return (self.bob_board, self.bob_encrypted_board,
+                    self.bob_private_key, self.zero_testers.get("Bob"))
+        return (self.alice_board, self.alice_encrypted_board,
+                self.alice_private_key, self.zero_testers.get("Alice"))
+    
+    def _encrypted_hit_check(self, guessing_player: str, target_encrypted_board, x: int, y: int):
+        """Compute the blinded hit-check ciphertext for one cell."""
+        probes = self.probe_tables.get("Bob" if guessing_player == "Alice" else "Alice")
+        if probes is not None:
+            # The difference was precomputed; only the blinding is left
+            return blind_hit_probe(probes[(x, y)])
         
         encrypted_cell = target_encrypted_board[(x, y)]
         
@@ -95,14 +506,38 @@ class GameLogic:
         # We compute: (encrypted_cell - 1) * random_blinding
         # If cell is 1 (ship): 0 * random = 0 (HIT)
         # If cell is 0 (water): (-1) * random = random_junk (MISS)
-        encrypted_result = perform_homomorphic_hit_check(encrypted_cell, 1)
-        
-        # Target player (defender) decrypts the result
-        decrypted_result = decrypt_value(target_private_key, encrypted_result)
-        
-        # Determine if it's a hit
-        is_hit = check_hit(decrypted_result)
-        
+        return perform_homomorphic_hit_check(encrypted_cell, 1)
+    
+    @staticmethod
+    def _packed_hit_check(target_encrypted_board: PackedEncryptedBoard,
+                          target_private_key: PaillierPrivateKey, x: int, y: int) -> bool:
+        """Run the slot hit check on a packed board and decrypt it (defender side)."""
+        # Packed boards isolate the cell's slot homomorphically
+        encrypted_result = target_encrypted_board.hit_check(x, y)
+        decrypted_result = target_encrypted_board.decrypt_hit_check(
+            target_private_key, encrypted_result, x, y
+        )
+        return check_hit(decrypted_result)
+    
+    @staticmethod
+    def _check_coordinate(target_board: Board, x: int, y: int) -> None:
+        """Reject a coordinate that is not a pair of in-bounds integers."""
+        if isinstance(x, bool) or isinstance(y, bool) or not isinstance(x, int) or not isinstance(y, int):
+            raise ValueError(f"Coordinate ({x!r}, {y!r}) must be integers")
+        if not target_board.in_bounds(x, y):
+            raise ValueError(f"Coordinate ({x}, {y}) out of bounds")
+    
+    @staticmethod
+    def _check_hits(target_board: Board, coordinates: List[Tuple[int, int]],
+                    hits: List[bool]) -> None:
+        """Ensure the decrypted hit checks agree with the plaintext board."""
+        for (x, y), is_hit in zip(coordinates, hits):
+            if is_hit != (target_board.board[(x, y)] == 1):
+                raise RuntimeError(f"Encrypted hit check at ({x}, {y}) disagrees with the board")
+    
+    def _record_guess(self, guessing_player: str, target_board: Board,
+                      x: int, y: int) -> Tuple[bool, Optional[str], bool]:
+        """Record a guess on the plaintext board, update game state and history."""
         # Record the hit on the target board
         is_hit, is_duplicate = target_board.record_hit_on_board(x, y)
         
@@ -119,14 +554,10 @@ class GameLogic:
             self.game_state.winner = guessing_player
         
         # Record in history
-        self.game_state.history.append({
-            "turn": self.game_state.total_turns,
-            "player": guessing_player,
-            "coordinate": (x, y),
-            "is_hit": is_hit,
-            "ship_sunk": ship_sunk_name,
-            "is_duplicate": is_duplicate
-        })
+        self.game_state.history.record(
+            self.game_state.total_turns, guessing_player, x, y,
+            is_hit, ship_sunk_name, is_duplicate
+        )
         
         return is_hit, ship_sunk_name, is_duplicate
     
@@ -141,8 +572,10 @@ class GameLogic:
         Returns:
             True if valid, raises ValueError otherwise
         """
-        if not (0 <= x < 10 and 0 <= y < 10):
-            raise ValueError(f"Coordinate ({x}, {y}) out of bounds. Use 0-9.")
+        if isinstance(x, bool) or isinstance(y, bool) or not isinstance(x, int) or not isinstance(y, int):
+            raise ValueError(f"Coordinate ({x!r}, {y!r}) must be integers")
+        if not self.alice_board.in_bounds(x, y):
+            raise ValueError(f"Coordinate ({x}, {y}) out of bounds. Use 0-{self.board_size - 1}.")
         return True
     
     def get_game_status(self) -> Dict:
@@ -161,6 +594,35 @@ class GameLogic:
             "bob_status": self.bob_board.get_game_status(),
         }
     
-    def get_history(self) -> list:
-        """Get the game history."""
+    def get_decryption_stats(self) -> Dict:
+        """
+        Get zero-test decryption latency statistics per defender.
+        
+        Returns:
+            Dictionary mapping player name to latency statistics
+        """
+        return {player: tester.stats() for player, tester in self.zero_testers.items()}
+    
+    def get_history(self) -> GameHistory:
+        """Get the game history (a lazy view yielding one dict per turn)."""
         return self.game_state.history
+
+
+class PlaintextGameLogic(GameLogic):
+    """
+    GameLogic without any encryption, for fast headless simulation.
+    
+    Guesses are resolved on the plaintext boards with the same rules,
+    state and history as GameLogic; no keys are generated or needed.
+    Pass BitBoards for the fastest hit and sunk-ship checks.
+    """
+    
+    def __init__(self, alice_board: Board, bob_board: Board):
+        """
+        Initialize the game logic.
+        
+        Args:
+            alice_board: Alice's board
+            bob_board: Bob's board
+        """
+        super().__init__(alice_board, bob_board, None, None, None, None, encrypted=False)
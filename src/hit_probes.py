@@ -0,0 +1,122 @@
+"""
+Precomputed hit-check probes for Homomorphic Battleship.
+
+The hit check for a cell is (encrypted_cell - 1) * blinding_factor. The
+difference does not depend on the shot, so it can be prepared for every
+cell once the board is encrypted, leaving only the blinding
+exponentiation for the online hit check.
+"""
+
+import threading
+from collections.abc import Mapping
+from typing import Dict, Iterator, Optional, Tuple
+from phe.paillier import EncryptedNumber
+from src.crypto import make_hit_probe
+
+
+class HitProbeTable(Mapping):
+    """
+    Read-only mapping of coordinates to unblinded hit-check probes.
+
+    Wraps an encrypted board (a dict, LazyEncryptedBoard or any other
+    coordinate mapping). A background thread computes the probe of every
+    cell; a probe that is not ready yet is computed on first access and
+    counted as a miss.
+    """
+
+    def __init__(self, encrypted_board: Mapping, guess_value: int = 1,
+                 background: bool = True):
+        """
+        Initialize the probe table.
+
+        Args:
+            encrypted_board: Mapping of coordinates to encrypted cells
+            guess_value: The guessed value subtracted from each cell
+            background: Whether to precompute all probes in a background thread
+        """
+        self.encrypted_board = encrypted_board
+        self.guess_value = guess_value
+        self.hits = 0
+        self.misses = 0
+        self._probes: Dict[Tuple[int, int], EncryptedNumber] = {}
+        self._lock = threading.Lock()
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+        if background:
+            self._thread = threading.Thread(target=self._precompute, daemon=True,
+                                            name="hit-probe-precompute")
+            self._thread.start()
+
+    def __getitem__(self, coord: Tuple[int, int]) -> EncryptedNumber:
+        """Get the probe of a cell, computing it now if it is not ready."""
+        probe = self._probes.get(coord)
+        if probe is not None:
+            with self._lock:
+                self.hits += 1
+            return probe
+
+        encrypted_cell = self.encrypted_board[coord]  # Raises KeyError for unknown coordinates
+        with self._lock:
+            probe = self._probes.get(coord)
+            if probe is None:
+                probe = make_hit_probe(encrypted_cell, self.guess_value)
+                self._probes[coord] = probe
+            self.misses += 1
+        return probe
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return iter(self.encrypted_board)
+
+    def __len__(self) -> int:
+        return len(self.encrypted_board)
+
+    def __contains__(self, coord) -> bool:
+        return coord in self.encrypted_board
+
+    def _precompute(self) -> None:
+        """Compute the probe of every cell that has not been accessed yet."""
+        for coord in self.encrypted_board:
+            if self._stopped:
+                return
+            if coord in self._probes:
+                continue
+            probe = make_hit_probe(self.encrypted_board[coord], self.guess_value)
+            with self._lock:
+                self._probes.setdefault(coord, probe)
+
+    def precomputed_count(self) -> int:
+        """Get the number of probes computed so far."""
+        return len(self._probes)
+
+    def stats(self) -> Dict:
+        """
+        Get probe usage statistics.
+
+        Returns:
+            Dictionary with hit/miss counts and the number of ready probes
+        """
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        looked_up = hits + misses
+        return {
+            "cells": len(self),
+            "ready": self.precomputed_count(),
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / looked_up if looked_up else 0.0,
+        }
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for background precomputation to finish.
+
+        Args:
+            timeout: Maximum number of seconds to wait
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def close(self) -> None:
+        """Stop background precomputation."""
+        self._stopped = True
+        self.wait()
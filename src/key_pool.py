@@ -0,0 +1,120 @@
+"""
+Background Paillier key generation for Homomorphic Battleship.
+
+Keeps a queue of keypairs being generated ahead of time in worker
+processes, so new players receive a keypair without waiting on prime
+generation.
+"""
+
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+from phe.paillier import PaillierPublicKey, PaillierPrivateKey
+from src.crypto import generate_keypair
+
+
+class KeyPool:
+    """
+    Pool of pre-generated Paillier keypairs.
+
+    Keypairs are generated in background processes and handed out in
+    FIFO order. Every acquired keypair is immediately replaced by a new
+    background job, keeping the pool at its target depth, unless refill
+    is off; then the pool only generates its first target_depth keypairs
+    and generates further ones on demand.
+    """
+
+    def __init__(self, target_depth: int = 4, n_length: int = 2048,
+                 max_workers: Optional[int] = None, refill: bool = True):
+        """
+        Initialize the key pool and start generating keypairs.
+
+        Args:
+            target_depth: Number of keypairs kept ready or in progress
+            n_length: Bit length of the RSA modulus for generated keys
+            max_workers: Number of worker processes (defaults to target_depth)
+            refill: Whether to replace acquired keypairs in the background
+        """
+        if target_depth < 1:
+            raise ValueError("target_depth must be at least 1")
+
+        self.target_depth = target_depth
+        self.n_length = n_length
+        self.refill = refill
+        self.ready_hits = 0
+        self.waits = 0
+        self._executor = ProcessPoolExecutor(max_workers=max_workers or target_depth)
+        self._pending: deque = deque()
+        self._lock = threading.Lock()
+        self._closed = False
+        with self._lock:
+            self._refill()
+
+    def _refill(self) -> None:
+        """Submit keygen jobs until the pool is back at its target depth."""
+        while len(self._pending) < self.target_depth:
+            self._pending.append(self._executor.submit(generate_keypair, self.n_length))
+
+    def acquire(self) -> Tuple[PaillierPublicKey, PaillierPrivateKey]:
+        """
+        Take the oldest keypair from the pool.
+
+        If that keypair is still being generated, this blocks until it
+        is done; the pool is refilled either way (if refill is on). An
+        empty pool generates a keypair on demand.
+
+        Returns:
+            Tuple of (public_key, private_key)
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Key pool is closed")
+            if not self._pending:
+                self._pending.append(self._executor.submit(generate_keypair, self.n_length))
+            future: Future = self._pending.popleft()
+            if future.done():
+                self.ready_hits += 1
+            else:
+                self.waits += 1
+            if self.refill:
+                self._refill()
+        return future.result()
+
+    def ready_count(self) -> int:
+        """Get the number of keypairs that can be acquired without waiting."""
+        with self._lock:
+            return sum(1 for future in self._pending if future.done())
+
+    def stats(self) -> Dict:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with depth, ready count and acquire hit/wait counts
+        """
+        return {
+            "target_depth": self.target_depth,
+            "n_length": self.n_length,
+            "ready": self.ready_count(),
+            "ready_hits": self.ready_hits,
+            "waits": self.waits,
+        }
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Cancel outstanding keygen jobs and shut down the worker processes.
+
+        Args:
+            wait: Whether to wait for keygen jobs already running in a worker
+        """
+        with self._lock:
+            self._closed = True
+            self._pending.clear()
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def __enter__(self) -> "KeyPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,97 @@
+"""
+Lazily encrypted boards for Homomorphic Battleship.
+
+A typical game only probes part of each board, so cells are encrypted
+the first time they are accessed instead of all at once up front.
+"""
+
+import threading
+from functools import partial
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterator, Optional, Tuple
+from phe.paillier import PaillierPublicKey, EncryptedNumber
+from src.crypto import encrypt_value
+
+
+class LazyEncryptedBoard(Mapping):
+    """
+    Read-only mapping of coordinates to encrypted cells, filled on demand.
+
+    Behaves like the dict returned by Board.encrypt_board, but each cell
+    is encrypted the first time it is looked up. A background thread can
+    optionally pre-encrypt the remaining cells while the game runs.
+    """
+
+    def __init__(self, board, public_key: PaillierPublicKey,
+                 encryptor: Optional[Callable[[int], EncryptedNumber]] = None,
+                 background: bool = False):
+        """
+        Initialize the lazy encrypted board.
+
+        Args:
+            board: The Board whose cells will be encrypted
+            public_key: The Paillier public key for encryption
+            encryptor: Optional function encrypting one value (e.g.
+                ObfuscatorPool.encrypt); defaults to encrypt_value
+            background: Whether to pre-encrypt all cells in a background thread
+        """
+        self.public_key = public_key
+        self._cells: Dict[Tuple[int, int], int] = dict(board.board)
+        self._encrypt = encryptor or partial(encrypt_value, public_key)
+        self._encrypted: Dict[Tuple[int, int], EncryptedNumber] = {}
+        self._lock = threading.Lock()
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+        if background:
+            self._thread = threading.Thread(target=self._prefetch, daemon=True,
+                                            name="lazy-board-prefetch")
+            self._thread.start()
+
+    def __getitem__(self, coord: Tuple[int, int]) -> EncryptedNumber:
+        """Get the encrypted cell, encrypting it on first access."""
+        encrypted = self._encrypted.get(coord)
+        if encrypted is not None:
+            return encrypted
+
+        value = self._cells[coord]  # Raises KeyError for unknown coordinates
+        with self._lock:
+            encrypted = self._encrypted.get(coord)
+            if encrypted is None:
+                encrypted = self._encrypt(value)
+                self._encrypted[coord] = encrypted
+        return encrypted
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return iter(self._cells)
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def __contains__(self, coord) -> bool:
+        return coord in self._cells
+
+    def _prefetch(self) -> None:
+        """Encrypt every cell that has not been accessed yet."""
+        for coord in self._cells:
+            if self._stopped:
+                return
+            self[coord]
+
+    def materialized_count(self) -> int:
+        """Get the number of cells encrypted so far."""
+        return len(self._encrypted)
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for background pre-encryption to finish.
+
+        Args:
+            timeout: Maximum number of seconds to wait
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def close(self) -> None:
+        """Stop background pre-encryption."""
+        self._stopped = True
+        self.wait()
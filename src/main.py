@@ -6,7 +6,9 @@ two players communicating through a simulated server.
 """
 
 import sys
-from src.crypto import generate_keypair
+from typing import List, Optional, Tuple
+from src.backend import backend_report
+from src.key_pool import KeyPool
 from src.board import Board
 from src.game_logic import GameLogic
 from src.server import GameServer, PlayerInstance
@@ -58,7 +60,7 @@ def place_player_board(player_name: str, board: Board) -> None:
         board.place_ships_manual()
     else:
         board.place_ships()
-        print(f"   [OK] {player_name}'s board created with 5 ships (random placement)")
+        print(f"   [OK] {player_name}'s board created with {len(board.ships)} ships (random placement)")
 
 
 def print_game_status(server: GameServer) -> None:
@@ -87,12 +89,13 @@ def print_game_status(server: GameServer) -> None:
     print()
 
 
-def get_player_guess(player_name: str) -> tuple:
+def get_player_guess(player_name: str, board_size: int = Board.BOARD_SIZE) -> tuple:
     """
     Get a guess from a player.
     
     Args:
         player_name: Name of the player
+        board_size: Width and height of the board
         
     Returns:
         Tuple of (x, y) coordinates
@@ -107,14 +110,14 @@ def get_player_guess(player_name: str) -> tuple:
             
             x, y = int(parts[0]), int(parts[1])
             
-            if not (0 <= x < 10 and 0 <= y < 10):
-                print("Coordinates out of bounds. Please use 0-9.")
+            if not (0 <= x < board_size and 0 <= y < board_size):
+                print(f"Coordinates out of bounds. Please use 0-{board_size - 1}.")
                 continue
             
             return x, y
         
         except ValueError:
-            print("Invalid input. Please enter two integers (0-9).")
+            print(f"Invalid input. Please enter two integers (0-{board_size - 1}).")
 
 
 def process_guess_result(result: dict, player_name: str, opponent_name: str) -> None:
@@ -147,27 +150,26 @@ def process_guess_result(result: dict, player_name: str, opponent_name: str) ->
         print(f"\n[Server Result] {player_name}'s guess at ({x}, {y}) - MISS")
 
 
-def play_game() -> None:
-    """Main game loop."""
-    print_header()
-    
-    print("Setting up the game...")
-    print("=" * 60)
-    
-    # SETUP PHASE
-    print("\n1. Generating keypairs for both players...")
-    alice_public_key, alice_private_key = generate_keypair()
-    bob_public_key, bob_private_key = generate_keypair()
-    print("   [OK] Alice's keypair generated")
-    print("   [OK] Bob's keypair generated")
-    
-    print("\n2. Creating boards and placing ships...")
-    alice_board = Board(player_name="Alice")
-    place_player_board("Alice", alice_board)
+def setup_game_logic(alice_board: Board, bob_board: Board,
+                     alice_public_key, bob_public_key,
+                     alice_private_key, bob_private_key) -> GameLogic:
+    """
+    Encrypt both boards and create the game logic.
     
-    bob_board = Board(player_name="Bob")
-    place_player_board("Bob", bob_board)
+    Each board is encrypted exactly once; the encrypted boards are handed
+    to GameLogic instead of being encrypted again.
     
+    Args:
+        alice_board: Alice's board with ships placed
+        bob_board: Bob's board with ships placed
+        alice_public_key: Alice's public key
+        bob_public_key: Bob's public key
+        alice_private_key: Alice's private key
+        bob_private_key: Bob's private key
+        
+    Returns:
+        The initialized GameLogic
+    """
     print("\n3. Encrypting boards...")
     alice_encrypted = alice_board.encrypt_board(alice_public_key)
     print(f"   [OK] Alice's board encrypted ({len(alice_encrypted)} cells)")
@@ -179,9 +181,57 @@ def play_game() -> None:
     game_logic = GameLogic(
         alice_board, bob_board,
         alice_public_key, bob_public_key,
-        alice_private_key, bob_private_key
+        alice_private_key, bob_private_key,
+        alice_encrypted_board=alice_encrypted,
+        bob_encrypted_board=bob_encrypted
     )
     print("   [OK] Game logic initialized")
+    return game_logic
+
+
+def play_game(board_size: Optional[int] = None,
+              fleet: Optional[List[Tuple[str, int]]] = None) -> None:
+    """
+    Main game loop.
+    
+    Args:
+        board_size: Width and height of both boards (defaults to Board.BOARD_SIZE)
+        fleet: List of (ship_name, ship_size) for each player (defaults to the standard fleet)
+    """
+    print_header()
+    print(backend_report())
+    print()
+    
+    print("Setting up the game...")
+    print("=" * 60)
+    
+    # SETUP PHASE
+    print("\n1. Generating keypairs for both players...")
+    # Both keys are generated in the background while the players place ships
+    key_pool = KeyPool(target_depth=2, refill=False)
+    print("   [OK] Background key generation started")
+    
+    try:
+        print("\n2. Creating boards and placing ships...")
+        alice_board = Board(player_name="Alice", board_size=board_size, fleet=fleet)
+        place_player_board("Alice", alice_board)
+        
+        bob_board = Board(player_name="Bob", board_size=board_size, fleet=fleet)
+        place_player_board("Bob", bob_board)
+        
+        alice_public_key, alice_private_key = key_pool.acquire()
+        bob_public_key, bob_private_key = key_pool.acquire()
+    finally:
+        # Quitting during placement must not wait for keys nobody will use
+        key_pool.close(wait=False)
+    print("   [OK] Alice's keypair generated")
+    print("   [OK] Bob's keypair generated")
+    
+    game_logic = setup_game_logic(
+        alice_board, bob_board,
+        alice_public_key, bob_public_key,
+        alice_private_key, bob_private_key
+    )
     
     print("\n5. Creating game server...")
     server = GameServer(game_logic)
@@ -197,49 +247,52 @@ def play_game() -> None:
     print("\n" + "=" * 60)
     print("Game ready! Let the battle begin!\n")
     
-    # GAME LOOP
-    turn_count = 0
-    max_turns = 200  # Safety limit
-    
-    while not server.is_game_over() and turn_count < max_turns:
-        print_game_status(server)
+    try:
+        # GAME LOOP
+        turn_count = 0
+        max_turns = 2 * alice_board.board_size ** 2  # Safety limit: every cell of both boards
         
-        current_player_name = server.get_whose_turn()
-        opponent_name = "Bob" if current_player_name == "Alice" else "Alice"
-        current_player = alice_player if current_player_name == "Alice" else bob_player
+        while not server.is_game_over() and turn_count < max_turns:
+            print_game_status(server)
+            
+            current_player_name = server.get_whose_turn()
+            opponent_name = "Bob" if current_player_name == "Alice" else "Alice"
+            current_player = alice_player if current_player_name == "Alice" else bob_player
+            
+            # Get guess from current player
+            x, y = get_player_guess(current_player_name, alice_board.board_size)
+            
+            # Process through server
+            result = current_player.make_guess(x, y)
+            process_guess_result(result, current_player_name, opponent_name)
+            
+            # Check for game over
+            if result.get("game_over"):
+                winner = result.get("winner")
+                print(f"\n{'=' * 60}")
+                print(f"GAME OVER! {winner} wins after {server.get_game_state()['total_turns']} turns!")
+                print(f"{'=' * 60}\n")
+                break
+            
+            turn_count += 1
         
-        # Get guess from current player
-        x, y = get_player_guess(current_player_name)
+        if turn_count >= max_turns:
+            print(f"Game ended due to turn limit ({max_turns} turns reached)")
         
-        # Process through server
-        result = current_player.make_guess(x, y)
-        process_guess_result(result, current_player_name, opponent_name)
+        # Print final statistics
+        print("\nFinal Game Statistics:")
+        print("=" * 60)
+        history = server.get_game_history()
+        print(f"Total turns: {len(history)}")
         
-        # Check for game over
-        if result.get("game_over"):
-            winner = result.get("winner")
-            print(f"\n{'=' * 60}")
-            print(f"GAME OVER! {winner} wins after {server.get_game_state()['total_turns']} turns!")
-            print(f"{'=' * 60}\n")
-            break
+        alice_hits = sum(1 for turn in history if turn['player'] == 'Alice' and turn['is_hit'])
+        bob_hits = sum(1 for turn in history if turn['player'] == 'Bob' and turn['is_hit'])
         
-        turn_count += 1
-    
-    if turn_count >= max_turns:
-        print(f"Game ended due to turn limit ({max_turns} turns reached)")
-    
-    # Print final statistics
-    print("\nFinal Game Statistics:")
-    print("=" * 60)
-    history = server.get_game_history()
-    print(f"Total turns: {len(history)}")
-    
-    alice_hits = sum(1 for turn in history if turn['player'] == 'Alice' and turn['is_hit'])
-    bob_hits = sum(1 for turn in history if turn['player'] == 'Bob' and turn['is_hit'])
-    
-    print(f"Alice's hits: {alice_hits}")
-    print(f"Bob's hits: {bob_hits}")
-    print()
+        print(f"Alice's hits: {alice_hits}")
+        print(f"Bob's hits: {bob_hits}")
+        print()
+    finally:
+        game_logic.close()
 
 
 def debug_show_boards(alice_board: Board, bob_board: Board) -> None:
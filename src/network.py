@@ -0,0 +1,307 @@
+"""
+Asyncio network server for Homomorphic Battleship.
+
+Exposes a GameServer over TCP using newline-delimited JSON messages, so
+player instances can run on separate machines. The defender's zero tests
+run on a process pool so the event loop keeps serving other connections;
+only the cheap attacker-side blinding runs on the loop itself.
+
+Protocol (one JSON object per line):
+    request:  {"id": 1, "method": "process_player_guess",
+               "params": {"player_name": "Alice", "x": 3, "y": 4}}
+    response: {"id": 1, "result": {...}}  or  {"id": 1, "error": "..."}
+
+Coordinates are sent as two-element JSON lists.
+"""
+
+import asyncio
+import json
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+from src.server import GameServer
+
+
+MAX_MESSAGE_SIZE = 64 * 1024  # Longest request line accepted, in bytes
+
+
+class AsyncGameServer:
+    """
+    Serves a GameServer to remote clients over asyncio TCP.
+
+    Guesses on per-cell encrypted boards are split: the blinded hit check
+    is computed on the loop, the zero test runs on a worker process, and
+    the result is recorded back on the loop. Other game modes run the
+    whole guess in a worker thread. All calls into the GameServer are
+    serialized by a lock so the game state is never touched by two
+    requests at once.
+    """
+
+    # Methods that perform homomorphic work and must not block the event loop
+    OFFLOADED_METHODS = {"process_player_guess", "process_player_salvo"}
+
+    def __init__(self, game_server: GameServer, host: str = "127.0.0.1", port: int = 0,
+                 executor: Optional[Executor] = None, backlog: int = 1024):
+        """
+        Initialize the network server.
+
+        Args:
+            game_server: The GameServer handling the game
+            host: Interface to listen on
+            port: TCP port to listen on (0 picks a free port)
+            executor: Executor for zero tests (defaults to one worker process)
+            backlog: Maximum number of pending connections
+        """
+        self.game_server = game_server
+        self.host = host
+        self.port = port
+        self.backlog = backlog
+        self._executor = executor or ProcessPoolExecutor(max_workers=1)
+        self._owns_executor = executor is None
+        self._game_lock = asyncio.Lock()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self.active_connections = 0
+
+    async def start(self) -> None:
+        """Start listening for connections."""
+        self._server = await asyncio.start_server(
+            self._handle_client, self.host, self.port,
+            backlog=self.backlog, limit=MAX_MESSAGE_SIZE
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Start the server (if needed) and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop accepting connections and release the executor."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+
+    async def _handle_client(self, reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter) -> None:
+        """Serve requests from one connection until it closes."""
+        self.active_connections += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    break  # Message too long; drop the connection
+                except ConnectionError:
+                    break
+                if not line:
+                    break
+
+                response = await self._dispatch(line)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        finally:
+            self.active_connections -= 1
+            writer.close()
+
+    async def _dispatch(self, line: bytes) -> Dict:
+        """Decode one request line and run the requested method."""
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            method = request["method"]
+            params = request.get("params", {})
+        except (ValueError, KeyError, AttributeError, TypeError):
+            return {"id": None, "error": "Malformed request"}
+
+        handler = self._get_handler(method)
+        if handler is None:
+            return {"id": request_id, "error": f"Unknown method: {method}"}
+
+        try:
+            if not isinstance(params, dict):
+                raise TypeError("params must be a JSON object")
+            async with self._game_lock:
+                if method in self.OFFLOADED_METHODS:
+                    result = await handler(**params)
+                else:
+                    result = handler(**params)
+        except (RuntimeError, TypeError, ValueError) as e:
+            return {"id": request_id, "error": str(e)}
+
+        return {"id": request_id, "result": result}
+
+    def _get_handler(self, method: str):
+        """Map a protocol method name to the GameServer call."""
+        handlers = {
+            "start_game": self.game_server.start_game,
+            "process_player_guess": self._process_player_guess,
+            "process_player_salvo": self._process_player_salvo,
+            "get_game_state": self.game_server.get_game_state,
+            "get_game_history": lambda: list(self.game_server.get_game_history()),
+            "get_whose_turn": self.game_server.get_whose_turn,
+        }
+        return handlers.get(method)
+
+    async def _process_player_guess(self, player_name: str, x: int, y: int) -> Dict:
+        """Process a guess, running the defender's zero test off the loop."""
+        _check_player(player_name)
+        x, y = _check_coordinate([x, y])
+        if not self._splits_zero_tests():
+            return await asyncio.to_thread(self.game_server.process_player_guess, player_name, x, y)
+
+        game_logic = self.game_server.game_logic
+        try:
+            game_logic.validate_guess(x, y)
+            encrypted_result = game_logic.prepare_guess(player_name, x, y)
+            is_hit = await self._zero_test(player_name, encrypted_result)
+            outcome = game_logic.complete_guess(player_name, x, y, is_hit)
+        except ValueError as e:
+            return {"status": "error", "message": str(e), "player": player_name}
+        return self.game_server.finish_guess(player_name, x, y, outcome)
+
+    async def _process_player_salvo(self, player_name: str, coordinates: list) -> Dict:
+        """Process a salvo, running the defender's zero tests off the loop."""
+        _check_player(player_name)
+        if not isinstance(coordinates, list):
+            raise TypeError("coordinates must be a list of [x, y] pairs")
+        coordinates = [_check_coordinate(coordinate) for coordinate in coordinates]
+        if not self._splits_zero_tests():
+            return await asyncio.to_thread(self.game_server.process_player_salvo,
+                                           player_name, coordinates)
+
+        game_logic = self.game_server.game_logic
+        try:
+            for x, y in coordinates:
+                game_logic.validate_guess(x, y)
+            encrypted_results = [game_logic.prepare_guess(player_name, x, y)
+                                 for x, y in coordinates]
+            hits = await asyncio.gather(*(self._zero_test(player_name, encrypted_result)
+                                          for encrypted_result in encrypted_results))
+            outcomes = game_logic.complete_salvo(player_name, coordinates, hits)
+        except ValueError as e:
+            return {"status": "error", "message": str(e), "player": player_name}
+        return self.game_server.finish_salvo(player_name, coordinates, outcomes)
+
+    def _splits_zero_tests(self) -> bool:
+        """Whether guesses can be split around an offloaded zero test."""
+        if not self.game_server.game_started:
+            raise RuntimeError("Game not started")
+        game_logic = self.game_server.game_logic
+        return game_logic.encrypted and not game_logic.packed_boards
+
+    async def _zero_test(self, player_name: str, encrypted_result) -> bool:
+        """Run the defender's zero test for one blinded hit check on the executor."""
+        defender = "Bob" if player_name == "Alice" else "Alice"
+        zero_tester = self.game_server.game_logic.zero_testers[defender]
+        return await asyncio.wrap_future(zero_tester.submit_is_zero(encrypted_result, self._executor))
+
+
+def _check_player(player_name: Any) -> None:
+    """Reject a player name that is not a string."""
+    if not isinstance(player_name, str):
+        raise TypeError("player_name must be a string")
+
+
+def _check_coordinate(coordinate: Any) -> Tuple[int, int]:
+    """Check that a wire coordinate is a pair of integers and return it as a tuple."""
+    if (not isinstance(coordinate, list) or len(coordinate) != 2
+            or any(isinstance(value, bool) or not isinstance(value, int) for value in coordinate)):
+        raise TypeError(f"Coordinates must be pairs of integers, got {coordinate!r}")
+    return coordinate[0], coordinate[1]
+
+
+class LoopbackClient:
+    """
+    Minimal asyncio client for AsyncGameServer.
+
+    Used for local testing and as a reference for remote player clients.
+    One request is in flight per client at a time.
+    """
+
+    def __init__(self, host: str, port: int):
+        """
+        Initialize the client.
+
+        Args:
+            host: Server host
+            port: Server port
+        """
+        self.host = host
+        self.port = port
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock = asyncio.Lock()
+        self._next_id = 0
+
+    async def connect(self) -> "LoopbackClient":
+        """Open the connection to the server."""
+        self._reader, self._writer = await asyncio.open_connection(
+            self.host, self.port, limit=MAX_MESSAGE_SIZE
+        )
+        return self
+
+    async def call(self, method: str, **params) -> Any:
+        """
+        Call a server method and wait for its result.
+
+        Args:
+            method: Protocol method name
+            **params: Method parameters
+
+        Returns:
+            The method's result
+
+        Raises:
+            RuntimeError: if the server returned an error
+        """
+        async with self._lock:
+            self._next_id += 1
+            request = {"id": self._next_id, "method": method, "params": params}
+            self._writer.write(json.dumps(request).encode() + b"\n")
+            await self._writer.drain()
+            line = await self._reader.readline()
+
+        if not line:
+            raise ConnectionError("Server closed the connection")
+        response = json.loads(line)
+        if "error" in response:
+            raise RuntimeError(response["error"])
+        return response["result"]
+
+    async def start_game(self) -> Dict:
+        """Start the game."""
+        return await self.call("start_game")
+
+    async def process_player_guess(self, player_name: str, x: int, y: int) -> Dict:
+        """Send a guess for a player."""
+        return await self.call("process_player_guess", player_name=player_name, x=x, y=y)
+
+    async def process_player_salvo(self, player_name: str, coordinates: list) -> Dict:
+        """Send a salvo of guesses for a player."""
+        return await self.call("process_player_salvo", player_name=player_name,
+                               coordinates=[list(coordinate) for coordinate in coordinates])
+
+    async def get_game_state(self) -> Dict:
+        """Get the current game state."""
+        return await self.call("get_game_state")
+
+    async def get_game_history(self) -> list:
+        """Get the complete game history."""
+        return await self.call("get_game_history")
+
+    async def close(self) -> None:
+        """Close the connection."""
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+            self._writer = None
+
+    async def __aenter__(self) -> "LoopbackClient":
+        return await self.connect()
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
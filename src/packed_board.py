@@ -0,0 +1,148 @@
+"""
+Plaintext-packed encrypted boards for Homomorphic Battleship.
+
+Instead of one ciphertext per cell, several cells share one Paillier
+plaintext as fixed-width slots. A 10x10 board then needs only a few
+ciphertexts, which cuts encryption time, memory and wire size.
+"""
+
+from typing import List, Tuple
+from phe.paillier import PaillierPublicKey, PaillierPrivateKey, EncryptedNumber
+from src.crypto import encrypt_value, perform_packed_hit_check, decrypt_packed_slot
+
+
+DEFAULT_SLOT_BITS = 40  # Width of each cell slot; noise hides other slots to ~2^-40
+
+
+def slots_per_ciphertext(public_key: PaillierPublicKey, slot_bits: int = DEFAULT_SLOT_BITS) -> int:
+    """
+    Get how many cell slots fit into one plaintext for a public key.
+
+    One slot width is reserved for the guard bit used by the hit check,
+    and two bits are kept free so plaintexts stay below phe's max_int.
+
+    Args:
+        public_key: The Paillier public key
+        slot_bits: Width of each slot in bits
+
+    Returns:
+        Number of usable slots per ciphertext
+    """
+    slots = (public_key.n.bit_length() - 2) // slot_bits - 1
+    if slots < 1:
+        raise ValueError(f"Key too small for {slot_bits}-bit slots")
+    return slots
+
+
+class PackedEncryptedBoard:
+    """
+    An encrypted board with many cells packed into each ciphertext.
+
+    Cell (x, y) has linear index x * board_size + y; index i lives in
+    ciphertext i // num_slots at slot i % num_slots.
+    """
+
+    def __init__(self, public_key: PaillierPublicKey, ciphertexts: List[EncryptedNumber],
+                 board_size: int, slot_bits: int = DEFAULT_SLOT_BITS):
+        """
+        Initialize a packed encrypted board.
+
+        Args:
+            public_key: The Paillier public key the board is encrypted with
+            ciphertexts: The packed ciphertexts, in slot order
+            board_size: Width and height of the board
+            slot_bits: Width of each slot in bits
+        """
+        self.public_key = public_key
+        self.ciphertexts = ciphertexts
+        self.board_size = board_size
+        self.slot_bits = slot_bits
+        self.num_slots = slots_per_ciphertext(public_key, slot_bits)
+
+    @classmethod
+    def from_board(cls, board, public_key: PaillierPublicKey,
+                   slot_bits: int = DEFAULT_SLOT_BITS) -> "PackedEncryptedBoard":
+        """
+        Pack and encrypt a plaintext board.
+
+        Args:
+            board: The Board to encrypt
+            public_key: The Paillier public key for encryption
+            slot_bits: Width of each slot in bits
+
+        Returns:
+            The packed encrypted board
+        """
+        size = board.board_size
+        num_slots = slots_per_ciphertext(public_key, slot_bits)
+        cells = [board.board[(x, y)] for x in range(size) for y in range(size)]
+
+        ciphertexts = []
+        for start in range(0, len(cells), num_slots):
+            packed = 0
+            for slot, value in enumerate(cells[start:start + num_slots]):
+                packed |= value << (slot * slot_bits)
+            ciphertexts.append(encrypt_value(public_key, packed))
+
+        return cls(public_key, ciphertexts, size, slot_bits)
+
+    def locate(self, x: int, y: int) -> Tuple[int, int]:
+        """
+        Find the ciphertext and slot holding a cell.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+
+        Returns:
+            Tuple of (ciphertext_index, slot)
+        """
+        if not (0 <= x < self.board_size and 0 <= y < self.board_size):
+            raise ValueError(f"Coordinate ({x}, {y}) out of bounds")
+        return divmod(x * self.board_size + y, self.num_slots)
+
+    def hit_check(self, x: int, y: int, guess_value: int = 1) -> EncryptedNumber:
+        """
+        Homomorphically check a single cell without decrypting the board.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            guess_value: The guessed value (typically 1)
+
+        Returns:
+            The encrypted result for the defender to decrypt
+        """
+        index, slot = self.locate(x, y)
+        return perform_packed_hit_check(self.ciphertexts[index], slot,
+                                        self.slot_bits, self.num_slots, guess_value)
+
+    def decrypt_hit_check(self, private_key: PaillierPrivateKey,
+                          encrypted_result: EncryptedNumber, x: int, y: int) -> int:
+        """
+        Decrypt a hit-check result for a cell (defender side).
+
+        Args:
+            private_key: The defender's private key
+            encrypted_result: Result of hit_check for the same cell
+            x: X coordinate
+            y: Y coordinate
+
+        Returns:
+            The slot value (0 means HIT, see check_hit)
+        """
+        _, slot = self.locate(x, y)
+        return decrypt_packed_slot(private_key, encrypted_result, slot, self.slot_bits)
+
+    def __len__(self) -> int:
+        """Get the number of cells on the board."""
+        return self.board_size * self.board_size
+
+    def ciphertext_count(self) -> int:
+        """Get the number of ciphertexts the board is stored in."""
+        return len(self.ciphertexts)
+
+    def wire_size(self) -> int:
+        """Get the total ciphertext size in bytes when sent over the wire."""
+        ciphertext_bytes = (self.public_key.nsquare.bit_length() + 7) // 8
+        return ciphertext_bytes * len(self.ciphertexts)
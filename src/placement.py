@@ -0,0 +1,243 @@
+"""
+Constraint-based random ship placement.
+
+Every straight-line placement of each ship size is enumerated once per
+(board size, fleet) and stored as an integer bitmask, with bit
+x * board_size + y set for cell (x, y) (the BitBoard layout). Sampling
+then only tests candidate masks against the occupied cells, and a
+complete randomized backtracking search finds a result whenever one
+exists.
+"""
+
+import random
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+
+class PlacementEngine:
+    """
+    Samples random non-overlapping fleet placements for one board configuration.
+
+    Engines are immutable and cheap to share; use get_placement_engine
+    to reuse the precomputed candidate tables.
+    """
+
+    # Random candidate picks per ship before falling back to filtering
+    FAST_ATTEMPTS = 8
+
+    def __init__(self, board_size: int, ship_sizes: Sequence[int]):
+        """
+        Precompute every candidate placement for the fleet.
+
+        Args:
+            board_size: Width and height of the board
+            ship_sizes: Size of each ship, in fleet order
+
+        Raises:
+            ValueError: if a ship cannot fit on the board at all
+        """
+        self.board_size = board_size
+        self.ship_sizes = tuple(ship_sizes)
+        self._masks: Dict[int, List[int]] = {}
+        self._coordinates: Dict[int, List[List[Tuple[int, int]]]] = {}
+        for size in set(self.ship_sizes):
+            if not (1 <= size <= board_size):
+                raise ValueError(f"Ship of size {size} does not fit a {board_size}x{board_size} board")
+            self._masks[size], self._coordinates[size] = self._enumerate(size)
+
+        self._starts_by_size = None
+
+    def _enumerate(self, size: int) -> Tuple[List[int], List[List[Tuple[int, int]]]]:
+        """List the mask and cells of every horizontal and vertical placement of a ship."""
+        masks = []
+        coordinates = []
+        n = self.board_size
+        directions = [(1, 0), (0, 1)] if size > 1 else [(1, 0)]
+        for dx, dy in directions:
+            for x in range(n - dx * (size - 1)):
+                for y in range(n - dy * (size - 1)):
+                    cells = [(x + dx * i, y + dy * i) for i in range(size)]
+                    mask = 0
+                    for cx, cy in cells:
+                        mask |= 1 << (cx * n + cy)
+                    masks.append(mask)
+                    coordinates.append(cells)
+        return masks, coordinates
+
+    def candidate_count(self, size: int) -> int:
+        """Get the number of placements of a ship size on an empty board."""
+        return len(self._masks[size])
+
+    def cells(self, size: int, index: int) -> List[Tuple[int, int]]:
+        """
+        Get the cells of one candidate placement.
+
+        Args:
+            size: Ship size
+            index: Candidate index, as returned by sample_indices
+
+        Returns:
+            The (x, y) cells the ship occupies
+        """
+        return list(self._coordinates[size][index])
+
+    def sample_indices(self, rng=random) -> List[int]:
+        """
+        Sample a placement for the whole fleet.
+
+        Each ship picks uniformly among the candidates that do not overlap
+        the ships placed before it. If that greedy pass dead-ends, a
+        randomized backtracking search over the full fleet is used instead.
+
+        Args:
+            rng: Random source (the random module or a random.Random)
+
+        Returns:
+            Candidate index of each ship, in fleet order
+
+        Raises:
+            ValueError: if no placement of the fleet exists
+        """
+        occupied = 0
+        chosen = []
+        randrange = rng.randrange
+        for size in self.ship_sizes:
+            masks = self._masks[size]
+            for _ in range(self.FAST_ATTEMPTS):
+                index = randrange(len(masks))
+                if not masks[index] & occupied:
+                    break
+            else:
+                free = [i for i, mask in enumerate(masks) if not mask & occupied]
+                if not free:
+                    return self._backtrack(rng)
+                index = free[randrange(len(free))]
+            chosen.append(index)
+            occupied |= masks[index]
+        return chosen
+
+    def _starts(self) -> Dict[int, Dict[int, List[int]]]:
+        """Get the candidates of each ship size keyed by their lowest cell index."""
+        if self._starts_by_size is None:
+            starts: Dict[int, Dict[int, List[int]]] = {}
+            for size, masks in self._masks.items():
+                by_cell: Dict[int, List[int]] = {}
+                for index, mask in enumerate(masks):
+                    by_cell.setdefault((mask & -mask).bit_length() - 1, []).append(index)
+                starts[size] = by_cell
+            self._starts_by_size = starts
+        return self._starts_by_size
+
+    def _backtrack(self, rng) -> List[int]:
+        """
+        Complete randomized search for a fleet placement.
+
+        Cells are decided in index order: the first undecided cell is
+        either water or the first cell of a ship, so every placement is
+        reached exactly once, whatever the order of same-sized ships.
+        States (position, occupied cells ahead, ships left) proven to be
+        dead ends are remembered and never searched again.
+        """
+        cell_count = self.board_size * self.board_size
+        sizes = sorted(set(self.ship_sizes), reverse=True)
+        counts = [self.ship_sizes.count(size) for size in sizes]
+        if sum(self.ship_sizes) > cell_count:
+            raise self._unplaceable()
+        starts = self._starts()
+
+        failed = set()
+        # Each frame is [state key, position, occupied, water left, untried options, applied option]
+        frames: List[list] = []
+        position, occupied, water = 0, 0, cell_count - sum(self.ship_sizes)
+        while any(counts):
+            while occupied >> position & 1:
+                position += 1
+            key = (position, occupied >> position, tuple(counts))
+            options = []
+            if key not in failed:
+                if water:
+                    options.append(None)
+                for size_index, size in enumerate(sizes):
+                    if counts[size_index]:
+                        options.extend((size_index, index)
+                                       for index in starts[size].get(position, ())
+                                       if not self._masks[size][index] & occupied)
+                rng.shuffle(options)
+            frames.append([key, position, occupied, water, options, None])
+
+            # Take the next untried option, unwinding exhausted frames
+            while True:
+                frame = frames[-1]
+                if frame[5] is not None:
+                    counts[frame[5][0]] += 1
+                    frame[5] = None
+                if frame[4]:
+                    break
+                failed.add(frame[0])
+                frames.pop()
+                if not frames:
+                    raise self._unplaceable()
+            _, position, occupied, water, options, _ = frame
+            option = options.pop()
+            if option is None:
+                position += 1
+                water -= 1
+            else:
+                frame[5] = option
+                counts[option[0]] -= 1
+                occupied |= self._masks[sizes[option[0]]][option[1]]
+
+        # Hand the placed candidates to the fleet's ships of each size
+        placed: Dict[int, List[int]] = {size: [] for size in sizes}
+        for frame in frames:
+            if frame[5] is not None:
+                placed[sizes[frame[5][0]]].append(frame[5][1])
+        for indices in placed.values():
+            rng.shuffle(indices)
+        return [placed[size].pop() for size in self.ship_sizes]
+
+    def _unplaceable(self) -> ValueError:
+        """Build the error raised when the fleet cannot be placed."""
+        return ValueError(f"Fleet {list(self.ship_sizes)} cannot be placed on a "
+                          f"{self.board_size}x{self.board_size} board")
+
+    def sample_masks(self, rng=random) -> List[int]:
+        """
+        Sample a fleet placement as one bitmask per ship.
+
+        Args:
+            rng: Random source
+
+        Returns:
+            Cell bitmask of each ship, in fleet order
+        """
+        return [self._masks[size][index]
+                for size, index in zip(self.ship_sizes, self.sample_indices(rng))]
+
+    def sample(self, rng=random) -> List[List[Tuple[int, int]]]:
+        """
+        Sample a fleet placement as coordinate lists.
+
+        Args:
+            rng: Random source
+
+        Returns:
+            Cells of each ship, in fleet order
+        """
+        return [self.cells(size, index)
+                for size, index in zip(self.ship_sizes, self.sample_indices(rng))]
+
+
+@lru_cache(maxsize=64)
+def get_placement_engine(board_size: int, ship_sizes: Tuple[int, ...]) -> PlacementEngine:
+    """
+    Get a shared engine for a board configuration.
+
+    Args:
+        board_size: Width and height of the board
+        ship_sizes: Size of each ship, in fleet order
+
+    Returns:
+        The cached PlacementEngine
+    """
+    return PlacementEngine(board_size, ship_sizes)
@@ -0,0 +1,257 @@
+"""
+Compact binary wire format for encrypted Battleship data.
+
+Ciphertexts are stored as fixed-width big-endian integers in one
+contiguous buffer after a small header, so a decoder can read any cell
+straight out of a memoryview without copying the rest of the board.
+
+Layout (big-endian):
+    magic        4s   b"HBEB"
+    version      B
+    kind         B    1 = encrypted board, 2 = single encrypted number
+    fingerprint  8s   first 8 bytes of SHA-256 over the key modulus
+    width        H    board width (1 for a single number)
+    height       H    board height (1 for a single number)
+    exponent     i    shared EncodedNumber exponent
+    cell_size    H    bytes per ciphertext
+    count        I    number of ciphertexts
+    cells        count * cell_size bytes, cell (x, y) at index x * height + y
+"""
+
+import hashlib
+import struct
+from collections.abc import Mapping
+from typing import BinaryIO, Dict, Iterable, Iterator, Tuple, Union
+from phe.paillier import PaillierPublicKey, EncryptedNumber
+from src.crypto import make_encrypted_number
+
+
+MAGIC = b"HBEB"
+VERSION = 1
+KIND_BOARD = 1
+KIND_NUMBER = 2
+HEADER = struct.Struct(">4sBB8sHHiHI")
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def key_fingerprint(public_key: PaillierPublicKey) -> bytes:
+    """
+    Get a short fingerprint identifying a public key.
+
+    Args:
+        public_key: The Paillier public key
+
+    Returns:
+        8-byte fingerprint of the key modulus
+    """
+    n_bytes = public_key.n.to_bytes((public_key.n.bit_length() + 7) // 8, "big")
+    return hashlib.sha256(n_bytes).digest()[:8]
+
+
+def ciphertext_size(public_key: PaillierPublicKey) -> int:
+    """Get the fixed width in bytes of a ciphertext modulo n^2."""
+    return (public_key.nsquare.bit_length() + 7) // 8
+
+
+def _pack(public_key: PaillierPublicKey, kind: int, width: int, height: int,
+          exponent: int, ciphertexts) -> bytes:
+    """Write the header and fixed-width ciphertexts into one buffer."""
+    cell_size = ciphertext_size(public_key)
+    count = len(ciphertexts)
+    buffer = bytearray(HEADER.size + count * cell_size)
+    HEADER.pack_into(buffer, 0, MAGIC, VERSION, kind, key_fingerprint(public_key),
+                     width, height, exponent, cell_size, count)
+    offset = HEADER.size
+    for ciphertext in ciphertexts:
+        buffer[offset:offset + cell_size] = ciphertext.to_bytes(cell_size, "big")
+        offset += cell_size
+    return bytes(buffer)
+
+
+def _unpack_header(buffer: Buffer, public_key: PaillierPublicKey, kind: int) -> Tuple:
+    """Validate a header against the expected kind and key."""
+    view = memoryview(buffer)
+    if len(view) < HEADER.size:
+        raise ValueError("Buffer too short for header")
+    magic, version, found_kind, fingerprint, width, height, exponent, cell_size, count = \
+        HEADER.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise ValueError("Not an encrypted battleship buffer")
+    if version != VERSION:
+        raise ValueError(f"Unsupported format version {version}")
+    if found_kind != kind:
+        raise ValueError(f"Expected kind {kind}, found {found_kind}")
+    if fingerprint != key_fingerprint(public_key):
+        raise ValueError("Buffer was encrypted against a different key")
+    if len(view) < HEADER.size + count * cell_size:
+        raise ValueError("Buffer truncated")
+    return view, width, height, exponent, cell_size, count
+
+
+def serialize_encrypted_number(encrypted_value: EncryptedNumber) -> bytes:
+    """
+    Serialize a single encrypted number (e.g. a hit-check result).
+
+    The ciphertext is obfuscated first if it has not been already.
+
+    Args:
+        encrypted_value: The encrypted number
+
+    Returns:
+        The encoded bytes
+    """
+    return _pack(encrypted_value.public_key, KIND_NUMBER, 1, 1,
+                 encrypted_value.exponent, [encrypted_value.ciphertext()])
+
+
+def deserialize_encrypted_number(buffer: Buffer, public_key: PaillierPublicKey) -> EncryptedNumber:
+    """
+    Decode a single encrypted number.
+
+    Args:
+        buffer: Bytes produced by serialize_encrypted_number
+        public_key: The public key the number was encrypted with
+
+    Returns:
+        The encrypted number
+    """
+    view, _, _, exponent, cell_size, _ = _unpack_header(buffer, public_key, KIND_NUMBER)
+    ciphertext = int.from_bytes(view[HEADER.size:HEADER.size + cell_size], "big")
+    return make_encrypted_number(public_key, ciphertext, exponent)
+
+
+def serialize_encrypted_board(encrypted_board: Dict[Tuple[int, int], EncryptedNumber],
+                              public_key: PaillierPublicKey) -> bytes:
+    """
+    Serialize a full encrypted board.
+
+    Args:
+        encrypted_board: Mapping of coordinates to encrypted cells covering a full grid
+        public_key: The public key the board is encrypted with
+
+    Returns:
+        The encoded bytes
+    """
+    width = max(x for x, _ in encrypted_board) + 1
+    height = max(y for _, y in encrypted_board) + 1
+    if len(encrypted_board) != width * height:
+        raise ValueError("Encrypted board does not cover a full grid")
+
+    cells = [encrypted_board[(x, y)] for x in range(width) for y in range(height)]
+    exponent = cells[0].exponent
+    if any(cell.exponent != exponent for cell in cells):
+        raise ValueError("All cells must share the same exponent")
+    if any(cell.public_key != public_key for cell in cells):
+        raise ValueError("Encrypted board uses a different public key")
+
+    return _pack(public_key, KIND_BOARD, width, height, exponent,
+                 [cell.ciphertext() for cell in cells])
+
+
+def write_encrypted_board(stream: BinaryIO, cells: Iterable[EncryptedNumber],
+                          public_key: PaillierPublicKey, width: int, height: int) -> int:
+    """
+    Stream an encrypted board to a file without holding it in memory.
+
+    Produces the same bytes as serialize_encrypted_board, but consumes
+    the cells one at a time (e.g. from Board.iter_encrypted_cells).
+
+    Args:
+        stream: Binary file-like object to write to
+        cells: Encrypted cells in index order, cell (x, y) at x * height + y
+        public_key: The public key the board is encrypted with
+        width: Board width
+        height: Board height
+
+    Returns:
+        Number of bytes written
+    """
+    cell_size = ciphertext_size(public_key)
+    count = width * height
+    exponent = None
+    written = 0
+    for index, cell in enumerate(cells):
+        if index >= count:
+            raise ValueError("More cells than the board dimensions allow")
+        if cell.public_key != public_key:
+            raise ValueError("Encrypted board uses a different public key")
+        if exponent is None:
+            exponent = cell.exponent
+            written += stream.write(HEADER.pack(MAGIC, VERSION, KIND_BOARD, key_fingerprint(public_key),
+                                                width, height, exponent, cell_size, count))
+        elif cell.exponent != exponent:
+            raise ValueError("All cells must share the same exponent")
+        written += stream.write(cell.ciphertext().to_bytes(cell_size, "big"))
+    if written != HEADER.size + count * cell_size:
+        raise ValueError("Encrypted board does not cover a full grid")
+    return written
+
+
+class EncryptedBoardView(Mapping):
+    """
+    Read-only encrypted board decoded lazily from a buffer.
+
+    Cells are parsed from memoryview slices on lookup, so constructing
+    the view copies nothing and untouched cells are never decoded.
+    """
+
+    def __init__(self, buffer: Buffer, public_key: PaillierPublicKey):
+        """
+        Initialize the view.
+
+        Args:
+            buffer: Bytes produced by serialize_encrypted_board (or an mmap)
+            public_key: The public key the board is encrypted with
+        """
+        view, width, height, exponent, cell_size, count = \
+            _unpack_header(buffer, public_key, KIND_BOARD)
+        if count != width * height:
+            raise ValueError("Cell count does not match board dimensions")
+
+        self.public_key = public_key
+        self.width = width
+        self.height = height
+        self.exponent = exponent
+        self.cell_size = cell_size
+        self._cells = view[HEADER.size:HEADER.size + count * cell_size]
+
+    def ciphertext_bytes(self, x: int, y: int) -> memoryview:
+        """
+        Get the raw big-endian ciphertext of a cell without copying.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+
+        Returns:
+            A memoryview slice of the buffer
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise KeyError((x, y))
+        offset = (x * self.height + y) * self.cell_size
+        return self._cells[offset:offset + self.cell_size]
+
+    def __getitem__(self, coord: Tuple[int, int]) -> EncryptedNumber:
+        x, y = coord
+        ciphertext = int.from_bytes(self.ciphertext_bytes(x, y), "big")
+        return make_encrypted_number(self.public_key, ciphertext, self.exponent)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        for x in range(self.width):
+            for y in range(self.height):
+                yield (x, y)
+
+    def __len__(self) -> int:
+        return self.width * self.height
+
+    def __contains__(self, coord) -> bool:
+        try:
+            x, y = coord
+        except (TypeError, ValueError):
+            return False
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def release(self) -> None:
+        """Release the memoryview so the underlying buffer can be closed."""
+        self._cells.release()
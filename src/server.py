@@ -5,8 +5,8 @@ Simulates a centralized server that handles communication between
 two remote player instances without knowing their boards.
 """
 
-from typing import Dict, Optional
-from src.game_logic import GameLogic
+from typing import Dict, List, Optional, Tuple
+from src.game_logic import GameLogic, GameHistory
 from src.board import Board
 from phe.paillier import PaillierPublicKey, PaillierPrivateKey
 
@@ -40,8 +40,8 @@ class GameServer:
         return {
             "status": "Game started!",
             "message": "Alice will go first.",
-            "board_size": 10,
-            "ships_per_player": 5
+            "board_size": self.game_logic.board_size,
+            "ships_per_player": len(self.game_logic.alice_board.ship_sizes)
         }
     
     def process_player_guess(self, player_name: str, x: int, y: int) -> Dict:
@@ -53,8 +53,8 @@ class GameServer:
         
         Args:
             player_name: "Alice" or "Bob"
-            x: X coordinate (0-9)
-            y: Y coordinate (0-9)
+            x: X coordinate (0 to board_size - 1)
+            y: Y coordinate (0 to board_size - 1)
             
         Returns:
             Dictionary with the result of the guess
@@ -67,25 +67,72 @@ class GameServer:
             self.game_logic.validate_guess(x, y)
             
             # Process the guess through homomorphic logic
-            is_hit, ship_sunk, is_duplicate = self.game_logic.make_guess(player_name, x, y)
-            
-            # Prepare response
-            response = {
-                "status": "success",
-                "player": player_name,
-                "coordinate": (x, y),
-                "is_hit": is_hit,
-                "ship_sunk": ship_sunk,
-                "is_duplicate": is_duplicate,
-                "game_over": self.game_logic.game_state.game_over,
-                "winner": self.game_logic.game_state.winner
+            outcome = self.game_logic.make_guess(player_name, x, y)
+            return self.finish_guess(player_name, x, y, outcome)
+        
+        except ValueError as e:
+            return {
+                "status": "error",
+                "message": str(e),
+                "player": player_name
             }
+    
+    def finish_guess(self, player_name: str, x: int, y: int,
+                     outcome: Tuple[bool, Optional[str], bool]) -> Dict:
+        """
+        Build the response for a recorded guess and pass the turn.
+        
+        Args:
+            player_name: "Alice" or "Bob"
+            x: X coordinate
+            y: Y coordinate
+            outcome: (is_hit, ship_sunk, is_duplicate) from the game logic
+            
+        Returns:
+            Dictionary with the result of the guess
+        """
+        is_hit, ship_sunk, is_duplicate = outcome
+        
+        # Prepare response
+        response = {
+            "status": "success",
+            "player": player_name,
+            "coordinate": (x, y),
+            "is_hit": is_hit,
+            "ship_sunk": ship_sunk,
+            "is_duplicate": is_duplicate,
+            "game_over": self.game_logic.game_state.game_over,
+            "winner": self.game_logic.game_state.winner
+        }
+        
+        # Switch turn for next player
+        if not self.game_logic.game_state.game_over:
+            self.game_logic.game_state.switch_turn()
+        
+        return response
+    
+    def process_player_salvo(self, player_name: str, coordinates: List[Tuple[int, int]]) -> Dict:
+        """
+        Process a salvo of guesses from one player in a single round trip.
+        
+        Args:
+            player_name: "Alice" or "Bob"
+            coordinates: List of (x, y) coordinates (0 to board_size - 1)
             
-            # Switch turn for next player
-            if not self.game_logic.game_state.game_over:
-                self.game_logic.game_state.switch_turn()
+        Returns:
+            Dictionary with one result per recorded shot
+        """
+        if not self.game_started:
+            raise RuntimeError("Game not started")
+        
+        try:
+            # Validate every guess before firing
+            for x, y in coordinates:
+                self.game_logic.validate_guess(x, y)
             
-            return response
+            # Process the whole salvo through homomorphic logic
+            outcomes = self.game_logic.make_salvo(player_name, coordinates)
+            return self.finish_salvo(player_name, coordinates, outcomes)
         
         except ValueError as e:
             return {
@@ -94,6 +141,41 @@ class GameServer:
                 "player": player_name
             }
     
+    def finish_salvo(self, player_name: str, coordinates: List[Tuple[int, int]],
+                     outcomes: List[Tuple[bool, Optional[str], bool]]) -> Dict:
+        """
+        Build the response for a recorded salvo and pass the turn.
+        
+        Args:
+            player_name: "Alice" or "Bob"
+            coordinates: List of (x, y) coordinates fired at
+            outcomes: (is_hit, ship_sunk, is_duplicate) per recorded shot
+            
+        Returns:
+            Dictionary with one result per recorded shot
+        """
+        response = {
+            "status": "success",
+            "player": player_name,
+            "results": [
+                {
+                    "coordinate": coordinate,
+                    "is_hit": is_hit,
+                    "ship_sunk": ship_sunk,
+                    "is_duplicate": is_duplicate
+                }
+                for coordinate, (is_hit, ship_sunk, is_duplicate) in zip(coordinates, outcomes)
+            ],
+            "game_over": self.game_logic.game_state.game_over,
+            "winner": self.game_logic.game_state.winner
+        }
+        
+        # A salvo is one turn
+        if not self.game_logic.game_state.game_over:
+            self.game_logic.game_state.switch_turn()
+        
+        return response
+    
     def get_game_state(self) -> Dict:
         """
         Get the current game state (visible to both players).
@@ -107,7 +189,7 @@ class GameServer:
         """Get the name of the player whose turn it is."""
         return self.game_logic.game_state.current_turn
     
-    def get_game_history(self) -> list:
+    def get_game_history(self) -> GameHistory:
         """Get the complete game history."""
         return self.game_logic.get_history()
     
@@ -161,6 +243,18 @@ class PlayerInstance:
         """
         return self.server.process_player_guess(self.player_name, x, y)
     
+    def make_salvo(self, coordinates: List[Tuple[int, int]]) -> Dict:
+        """
+        Fire a salvo of guesses through the server.
+        
+        Args:
+            coordinates: List of (x, y) coordinates
+            
+        Returns:
+            Result dictionary from the server
+        """
+        return self.server.process_player_salvo(self.player_name, coordinates)
+    
     def get_board_status(self) -> Dict:
         """Get status of this player's own board."""
         return self.board.get_game_status()
@@ -0,0 +1,303 @@
+"""
+Multi-game session management for Homomorphic Battleship.
+
+Maps game IDs to running games so one host can serve many matches,
+sharing the key pool and encryption engine between them and evicting
+games that are idle or finished.
+"""
+
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+from src.board import Board
+from src.crypto import generate_keypair
+from src.game_logic import GameLogic
+from src.server import GameServer
+
+
+@dataclass
+class GameSession:
+    """A single hosted game, its activity timestamps and its turn lock."""
+    game_id: str
+    server: GameServer
+    created_at: float
+    last_activity: float
+    finished_at: Optional[float] = None
+    # Serializes turns, and turns against closing the game's boards
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+
+class SessionManager:
+    """
+    Hosts many games at once, keyed by game ID.
+
+    Keypairs come from a shared KeyPool (if given) and boards are
+    encrypted with a shared EncryptionEngine (if given). Games are
+    evicted after idle_timeout seconds without activity, or finished_ttl
+    seconds after they end. A game's encrypted boards are released as soon
+    as it ends, and memory-mapped boards of games idle for idle_advise_after
+    seconds are paged out on each eviction pass. Turns in the same game
+    are serialized; turns in different games run concurrently.
+    """
+
+    def __init__(self, key_pool=None, encryption_engine=None,
+                 max_games: Optional[int] = None, idle_timeout: float = 600.0,
+                 finished_ttl: float = 60.0, idle_advise_after: float = 60.0,
+                 n_length: int = 2048,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the session manager.
+
+        Args:
+            key_pool: Optional shared KeyPool for player keypairs
+            encryption_engine: Optional shared EncryptionEngine for board encryption
+            max_games: Maximum number of hosted games (None for unlimited)
+            idle_timeout: Seconds without activity before a game is evicted
+            finished_ttl: Seconds a finished game stays available for final queries
+            idle_advise_after: Seconds without activity before a game's mapped
+                boards are paged out
+            n_length: Key length used when no key pool is given
+            clock: Time source (monotonic seconds)
+        """
+        self.key_pool = key_pool
+        self.encryption_engine = encryption_engine
+        self.max_games = max_games
+        self.idle_timeout = idle_timeout
+        self.finished_ttl = finished_ttl
+        self.idle_advise_after = idle_advise_after
+        self.n_length = n_length
+        self._clock = clock
+        self._sessions: Dict[str, GameSession] = {}
+        self._pending = 0  # Games being created; they hold a capacity slot
+        self._lock = threading.Lock()
+        self.games_created = 0
+        self.games_evicted = 0
+
+    def _acquire_keypair(self):
+        """Get a keypair from the shared pool, or generate one."""
+        if self.key_pool is not None:
+            return self.key_pool.acquire()
+        return generate_keypair(self.n_length)
+
+    def create_game(self, alice_board: Optional[Board] = None,
+                    bob_board: Optional[Board] = None, board_size: Optional[int] = None,
+                    fleet: Optional[List[Tuple[str, int]]] = None, **game_options) -> str:
+        """
+        Create and start a new game.
+
+        Args:
+            alice_board: Alice's board (random placement if omitted)
+            bob_board: Bob's board (random placement if omitted)
+            board_size: Size of randomly placed boards (defaults to Board.BOARD_SIZE)
+            fleet: Fleet of randomly placed boards as (ship_name, ship_size) pairs
+            **game_options: Extra keyword arguments for GameLogic
+
+        Returns:
+            The new game's ID
+
+        Raises:
+            RuntimeError: if the host is at capacity
+        """
+        self.evict()
+        with self._lock:
+            hosted = len(self._sessions) + self._pending
+            if self.max_games is not None and hosted >= self.max_games:
+                raise RuntimeError(f"Server at capacity ({self.max_games} games)")
+            self._pending += 1
+
+        # The reserved slot is released even if setting up the game fails
+        server = None
+        game_id = uuid.uuid4().hex
+        try:
+            server = self._start_game(alice_board, bob_board, board_size, fleet, game_options)
+        finally:
+            with self._lock:
+                self._pending -= 1
+                if server is not None:
+                    now = self._clock()
+                    self._sessions[game_id] = GameSession(game_id, server, now, now)
+                    self.games_created += 1
+        return game_id
+
+    def _start_game(self, alice_board: Optional[Board], bob_board: Optional[Board],
+                    board_size: Optional[int], fleet: Optional[List[Tuple[str, int]]],
+                    game_options: Dict) -> GameServer:
+        """Set up the boards, keys and game logic of a new game and start it."""
+        if alice_board is None:
+            alice_board = Board("Alice", board_size=board_size, fleet=fleet)
+            alice_board.place_ships()
+        if bob_board is None:
+            bob_board = Board("Bob", board_size=board_size, fleet=fleet)
+            bob_board.place_ships()
+
+        alice_public_key, alice_private_key = self._acquire_keypair()
+        bob_public_key, bob_private_key = self._acquire_keypair()
+        game_options.setdefault("encryption_engine", self.encryption_engine)
+        game_logic = GameLogic(
+            alice_board, bob_board,
+            alice_public_key, bob_public_key,
+            alice_private_key, bob_private_key,
+            **game_options
+        )
+        server = GameServer(game_logic)
+        try:
+            server.start_game()
+        except Exception:
+            game_logic.close()
+            raise
+        return server
+
+    def get_server(self, game_id: str) -> GameServer:
+        """
+        Get a game's server and mark the game as active.
+
+        Args:
+            game_id: The game ID
+
+        Returns:
+            The GameServer for the game
+
+        Raises:
+            KeyError: if the game does not exist or was evicted
+        """
+        return self._get_session(game_id).server
+
+    def _get_session(self, game_id: str) -> GameSession:
+        """Get a game's session and mark the game as active."""
+        with self._lock:
+            session = self._sessions.get(game_id)
+            if session is None:
+                raise KeyError(f"Unknown game: {game_id}")
+            session.last_activity = self._clock()
+            return session
+
+    def process_player_guess(self, game_id: str, player_name: str, x: int, y: int) -> Dict:
+        """
+        Process a guess in one of the hosted games.
+
+        Args:
+            game_id: The game ID
+            player_name: "Alice" or "Bob"
+            x: X coordinate
+            y: Y coordinate
+
+        Returns:
+            Dictionary with the result of the guess
+        """
+        return self._play_turn(game_id, lambda server: server.process_player_guess(player_name, x, y))
+
+    def process_player_salvo(self, game_id: str, player_name: str,
+                             coordinates: List[Tuple[int, int]]) -> Dict:
+        """
+        Process a salvo in one of the hosted games.
+
+        Args:
+            game_id: The game ID
+            player_name: "Alice" or "Bob"
+            coordinates: List of (x, y) coordinates
+
+        Returns:
+            Dictionary with one result per recorded shot
+        """
+        return self._play_turn(game_id, lambda server: server.process_player_salvo(player_name, coordinates))
+
+    def _play_turn(self, game_id: str, turn: Callable[[GameServer], Dict]) -> Dict:
+        """Run one turn under the game's lock, releasing the game's boards if it ended."""
+        session = self._get_session(game_id)
+        with session.lock:
+            response = turn(session.server)
+            if session.server.is_game_over():
+                with self._lock:
+                    if session.finished_at is None:
+                        session.finished_at = self._clock()
+                session.server.game_logic.close()
+        return response
+
+    def end_game(self, game_id: str) -> None:
+        """
+        Remove a game immediately.
+
+        Args:
+            game_id: The game ID
+        """
+        with self._lock:
+            session = self._sessions.pop(game_id, None)
+            if session is not None:
+                self.games_evicted += 1
+        if session is not None:
+            with session.lock:
+                session.server.game_logic.close()
+
+    def evict(self) -> List[str]:
+        """
+        Remove idle and finished games and release their boards.
+
+        Games that are still hosted but idle have their memory-mapped
+        boards paged out.
+
+        Returns:
+            List of evicted game IDs
+        """
+        now = self._clock()
+        with self._lock:
+            evicted = []
+            idle_sessions = []
+            for game_id, session in self._sessions.items():
+                if session.finished_at is None and session.server.is_game_over():
+                    session.finished_at = now
+                idle_for = now - session.last_activity
+                expired = (session.finished_at is not None
+                           and now - session.finished_at >= self.finished_ttl)
+                if idle_for >= self.idle_timeout or expired:
+                    evicted.append(game_id)
+                elif idle_for >= self.idle_advise_after:
+                    idle_sessions.append(session)
+            evicted_sessions = [self._sessions.pop(game_id) for game_id in evicted]
+            self.games_evicted += len(evicted)
+
+        # Release boards outside the manager lock; closing may wait for
+        # background threads, and for a turn still running in the game
+        for session in evicted_sessions:
+            with session.lock:
+                session.server.game_logic.close()
+        for session in idle_sessions:
+            with session.lock:
+                session.server.game_logic.advise_idle()
+        return evicted
+
+    def metrics(self) -> Dict:
+        """
+        Get aggregate capacity metrics for the host.
+
+        Returns:
+            Dictionary with game counts, capacity and shared pool statistics
+        """
+        with self._lock:
+            active = len(self._sessions)
+            pending = self._pending
+            finished = sum(1 for session in self._sessions.values()
+                           if session.server.is_game_over())
+        return {
+            "active_games": active,
+            "finished_games": finished,
+            "in_progress_games": active - finished,
+            "max_games": self.max_games,
+            "capacity_remaining": (None if self.max_games is None
+                                   else self.max_games - active - pending),
+            "games_created": self.games_created,
+            "games_evicted": self.games_evicted,
+            "key_pool": self.key_pool.stats() if self.key_pool is not None else None,
+            "encryption_workers": (self.encryption_engine.max_workers
+                                   if self.encryption_engine is not None else 0),
+        }
+
+    def __len__(self) -> int:
+        """Get the number of hosted games."""
+        with self._lock:
+            return len(self._sessions)
+
+    def __contains__(self, game_id: str) -> bool:
+        with self._lock:
+            return game_id in self._sessions
@@ -0,0 +1,321 @@
+"""
+Headless self-play simulation for Homomorphic Battleship.
+
+Plays games between Strategy objects through GameServer and
+PlayerInstance, with no terminal input. Games can run in plaintext fast
+mode (PlaintextGameLogic) or with the full homomorphic pipeline, and
+can be spread over a process pool. The report gives games per second,
+turns per game and the time spent in each phase.
+
+Usage:
+    python -m src.simulation --games 1000 --workers 4
+    python -m src.simulation --games 20 --crypto --alice hunt_target
+"""
+
+import argparse
+import random
+import time
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+from src.bitboard import BitBoard
+from src.board import Board
+from src.crypto import generate_keypair
+from src.game_logic import GameLogic, PlaintextGameLogic
+from src.server import GameServer, PlayerInstance
+from src.strategies import STRATEGIES, RandomStrategy, Strategy
+from src.turn_pipeline import PipelinedTurnEngine
+
+
+PHASES = ("placement", "keygen", "encryption", "strategy", "turns")
+
+StrategyFactory = Callable[[], Strategy]
+
+# Keypairs reused across games in one process, keyed by key length
+_keypair_cache: Dict[int, Tuple] = {}
+
+
+@dataclass
+class GameResult:
+    """Outcome and timings of one simulated game."""
+    winner: Optional[str]
+    turns: int
+    timings: Dict[str, float] = field(default_factory=dict)  # Seconds per phase
+
+
+@dataclass
+class SimulationReport:
+    """Aggregate results of a simulation run."""
+    games: int
+    wall_time: float
+    crypto: bool
+    workers: int
+    wins: Dict[str, int]
+    turns: array  # Turns of each game, in game order
+    phase_totals: Dict[str, float]
+
+    @property
+    def games_per_second(self) -> float:
+        """Completed games per wall-clock second."""
+        return self.games / self.wall_time if self.wall_time > 0 else float("inf")
+
+    @property
+    def mean_turns(self) -> float:
+        """Mean number of shots per game."""
+        return sum(self.turns) / len(self.turns) if self.turns else 0.0
+
+    def phase_means(self) -> Dict[str, float]:
+        """Mean seconds per game spent in each phase."""
+        return {phase: total / self.games if self.games else 0.0
+                for phase, total in self.phase_totals.items()}
+
+    def summary(self) -> Dict:
+        """Get the report as a plain dictionary."""
+        return {
+            "games": self.games,
+            "mode": "crypto" if self.crypto else "plaintext",
+            "workers": self.workers,
+            "wall_time_s": self.wall_time,
+            "games_per_second": self.games_per_second,
+            "mean_turns": self.mean_turns,
+            "min_turns": min(self.turns) if self.turns else 0,
+            "max_turns": max(self.turns) if self.turns else 0,
+            "wins": dict(self.wins),
+            "phase_mean_s": self.phase_means(),
+        }
+
+
+def _get_keypairs(n_length: int, reuse_keys: bool) -> Tuple[Tuple, Tuple, bool]:
+    """Get Alice's and Bob's keypairs, and whether new keys were generated."""
+    if reuse_keys and n_length in _keypair_cache:
+        alice_keys, bob_keys = _keypair_cache[n_length]
+        return alice_keys, bob_keys, False
+    alice_keys, bob_keys = generate_keypair(n_length), generate_keypair(n_length)
+    if reuse_keys:
+        _keypair_cache[n_length] = (alice_keys, bob_keys)
+    return alice_keys, bob_keys, True
+
+
+def play_headless_game(alice_strategy: Strategy, bob_strategy: Strategy,
+                       board_size: Optional[int] = None,
+                       fleet: Optional[List[Tuple[str, int]]] = None,
+                       crypto: bool = False, n_length: int = 1024,
+                       reuse_keys: bool = True, seed=None,
+                       game_options: Optional[Dict] = None, pipelined: bool = False,
+                       pipeline_executor: Optional[Executor] = None) -> GameResult:
+    """
+    Play one game between two strategies through the game server.
+
+    Args:
+        alice_strategy: Strategy choosing Alice's shots
+        bob_strategy: Strategy choosing Bob's shots
+        board_size: Width and height of both boards
+        fleet: Fleet of both players as (ship_name, ship_size) pairs
+        crypto: Use the full homomorphic pipeline instead of plaintext mode
+        n_length: Key length in crypto mode
+        reuse_keys: Reuse this process's keypairs between crypto games
+        seed: Seed for board placement and strategy choices
+        game_options: Extra keyword arguments for GameLogic in crypto mode
+        pipelined: Overlap turns with a PipelinedTurnEngine (crypto mode only)
+        pipeline_executor: Executor for the pipelined zero tests (a new pool if omitted)
+
+    Returns:
+        The game result with per-phase timings
+    """
+    if pipelined and not crypto:
+        raise ValueError("Pipelined turns require crypto mode")
+    rng = random.Random(seed)
+    timings = dict.fromkeys(PHASES, 0.0)
+    clock = time.perf_counter
+
+    # Plaintext games run on bitmask boards; placement is identical for a given seed
+    board_cls = Board if crypto else BitBoard
+    start = clock()
+    alice_board = board_cls("Alice", board_size=board_size, fleet=fleet)
+    alice_board.place_ships(rng)
+    bob_board = board_cls("Bob", board_size=board_size, fleet=fleet)
+    bob_board.place_ships(rng)
+    timings["placement"] = clock() - start
+
+    if crypto:
+        start = clock()
+        (alice_pub, alice_priv), (bob_pub, bob_priv), _ = _get_keypairs(n_length, reuse_keys)
+        timings["keygen"] = clock() - start
+
+        start = clock()
+        game_logic = GameLogic(alice_board, bob_board, alice_pub, bob_pub,
+                               alice_priv, bob_priv, **(game_options or {}))
+        timings["encryption"] = clock() - start
+    else:
+        alice_pub = alice_priv = bob_pub = bob_priv = None
+        game_logic = PlaintextGameLogic(alice_board, bob_board)
+
+    server = GameServer(game_logic)
+    server.start_game()
+    players = {
+        "Alice": PlayerInstance("Alice", alice_board, alice_pub, alice_priv, server),
+        "Bob": PlayerInstance("Bob", bob_board, bob_pub, bob_priv, server),
+    }
+    strategies = {"Alice": alice_strategy, "Bob": bob_strategy}
+    alice_strategy.reset(bob_board.board_size, bob_board.fleet, rng)
+    bob_strategy.reset(alice_board.board_size, alice_board.fleet, rng)
+
+    max_turns = 2 * alice_board.board_size ** 2
+    if pipelined:
+        turns = _play_pipelined(server, strategies, max_turns, timings, pipeline_executor)
+        return GameResult(server.get_winner(), turns, timings)
+
+    turns = 0
+    while not server.is_game_over() and turns < max_turns:
+        player_name = server.get_whose_turn()
+        strategy = strategies[player_name]
+
+        start = clock()
+        x, y = strategy.next_shot()
+        timings["strategy"] += clock() - start
+
+        start = clock()
+        result = players[player_name].make_guess(x, y)
+        timings["turns"] += clock() - start
+        if result["status"] != "success":
+            raise RuntimeError(f"{player_name}'s strategy fired an invalid shot: {result['message']}")
+
+        start = clock()
+        strategy.observe(x, y, result["is_hit"], result["ship_sunk"])
+        timings["strategy"] += clock() - start
+        turns += 1
+
+    return GameResult(server.get_winner(), turns, timings)
+
+
+def _play_pipelined(server: GameServer, strategies: Dict[str, Strategy], max_turns: int,
+                    timings: Dict[str, float], executor: Optional[Executor]) -> int:
+    """Play the turns of a game through a PipelinedTurnEngine; returns the shots fired."""
+    clock = time.perf_counter
+
+    def choose_shot(player_name: str) -> Tuple[int, int]:
+        start = clock()
+        shot = strategies[player_name].next_shot()
+        timings["strategy"] += clock() - start
+        return shot
+
+    def on_result(player_name: str, response: Dict) -> None:
+        start = clock()
+        x, y = response["coordinate"]
+        strategies[player_name].observe(x, y, response["is_hit"], response["ship_sunk"])
+        timings["strategy"] += clock() - start
+
+    start = clock()
+    strategy_before = timings["strategy"]
+    with PipelinedTurnEngine(server, executor) as engine:
+        responses = engine.play(choose_shot, on_result, max_turns)
+    timings["turns"] = clock() - start - (timings["strategy"] - strategy_before)
+    return len(responses)
+
+
+def _play_games(alice_factory: StrategyFactory, bob_factory: StrategyFactory,
+                seeds: List[str], options: Dict) -> List[GameResult]:
+    """Play a batch of games (runs in a worker process)."""
+    return [play_headless_game(alice_factory(), bob_factory(), seed=seed, **options)
+            for seed in seeds]
+
+
+def run_simulation(games: int, alice_strategy: StrategyFactory = RandomStrategy,
+                   bob_strategy: StrategyFactory = RandomStrategy,
+                   workers: int = 1, crypto: bool = False,
+                   board_size: Optional[int] = None,
+                   fleet: Optional[List[Tuple[str, int]]] = None,
+                   n_length: int = 1024, reuse_keys: bool = True,
+                   seed=None, game_options: Optional[Dict] = None,
+                   batch_size: Optional[int] = None, pipelined: bool = False) -> SimulationReport:
+    """
+    Play many games and aggregate the results.
+
+    Strategy factories are called once per game; with workers > 1 they
+    must be picklable (e.g. Strategy subclasses).
+
+    Args:
+        games: Number of games to play
+        alice_strategy: Factory for Alice's strategy
+        bob_strategy: Factory for Bob's strategy
+        workers: Number of worker processes (1 plays in this process)
+        crypto: Use the full homomorphic pipeline instead of plaintext mode
+        board_size: Width and height of both boards
+        fleet: Fleet of both players as (ship_name, ship_size) pairs
+        n_length: Key length in crypto mode
+        reuse_keys: Generate keys once per process instead of once per game
+        seed: Seed making the run reproducible (random if omitted)
+        game_options: Extra keyword arguments for GameLogic in crypto mode
+        batch_size: Games per worker task (defaults to an even split)
+        pipelined: Overlap turns with a PipelinedTurnEngine (crypto mode only)
+
+    Returns:
+        The aggregated simulation report
+    """
+    if seed is None:
+        seed = random.SystemRandom().randrange(2 ** 63)
+    seeds = [f"{seed}:{game}" for game in range(games)]
+    options = {
+        "board_size": board_size, "fleet": fleet, "crypto": crypto,
+        "n_length": n_length, "reuse_keys": reuse_keys, "game_options": game_options,
+        "pipelined": pipelined,
+    }
+
+    start = time.perf_counter()
+    if workers > 1 and games > 1:
+        batch_size = batch_size or max(1, -(-games // (workers * 4)))
+        batches = [seeds[i:i + batch_size] for i in range(0, games, batch_size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_play_games, alice_strategy, bob_strategy, batch, options)
+                       for batch in batches]
+            results = [result for future in futures for result in future.result()]
+    else:
+        results = _play_games(alice_strategy, bob_strategy, seeds, options)
+    wall_time = time.perf_counter() - start
+
+    wins = {"Alice": 0, "Bob": 0, None: 0}
+    phase_totals = dict.fromkeys(PHASES, 0.0)
+    for result in results:
+        wins[result.winner] += 1
+        for phase, seconds in result.timings.items():
+            phase_totals[phase] += seconds
+    return SimulationReport(
+        games=games, wall_time=wall_time, crypto=crypto, workers=workers,
+        wins={"Alice": wins["Alice"], "Bob": wins["Bob"], "unfinished": wins[None]},
+        turns=array("I", (result.turns for result in results)),
+        phase_totals=phase_totals,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run a simulation from the command line and print the report."""
+    parser = argparse.ArgumentParser(description="Headless Battleship self-play")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--crypto", action="store_true", help="run the full homomorphic pipeline")
+    parser.add_argument("--pipelined", action="store_true", help="overlap turns (crypto mode only)")
+    parser.add_argument("--board-size", type=int, default=None)
+    parser.add_argument("--key-length", type=int, default=1024)
+    parser.add_argument("--alice", choices=sorted(STRATEGIES), default="random")
+    parser.add_argument("--bob", choices=sorted(STRATEGIES), default="random")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    report = run_simulation(
+        args.games, STRATEGIES[args.alice], STRATEGIES[args.bob],
+        workers=args.workers, crypto=args.crypto, board_size=args.board_size,
+        n_length=args.key_length, seed=args.seed, pipelined=args.pipelined,
+    )
+    summary = report.summary()
+    print(f"{summary['games']} {summary['mode']} games on {summary['workers']} worker(s) "
+          f"in {summary['wall_time_s']:.2f}s ({summary['games_per_second']:.1f} games/s)")
+    print(f"Turns per game: mean {summary['mean_turns']:.1f}, "
+          f"min {summary['min_turns']}, max {summary['max_turns']}")
+    print(f"Wins: {summary['wins']}")
+    for phase, seconds in summary["phase_mean_s"].items():
+        print(f"  {phase:10s} {seconds * 1000:9.3f} ms/game")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+"""
+Pluggable shot-selection strategies for automated players.
+
+A strategy is told the board size and fleet at the start of a game,
+asked for one shot at a time, and fed the server's result for every
+shot it fires.
+"""
+
+import abc
+import random
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+from src.placement import get_placement_engine
+
+
+class Strategy(abc.ABC):
+    """Base class for automated players."""
+
+    name = "strategy"
+
+    def reset(self, board_size: int, fleet: List[Tuple[str, int]], rng=random) -> None:
+        """
+        Prepare for a new game.
+
+        Args:
+            board_size: Width and height of the opponent's board
+            fleet: The opponent's fleet as (ship_name, ship_size) pairs
+            rng: Random source for any random choices
+        """
+        self.board_size = board_size
+        self.fleet = list(fleet)
+        self.rng = rng
+
+    @abc.abstractmethod
+    def next_shot(self) -> Tuple[int, int]:
+        """Choose the next cell to fire at."""
+
+    def observe(self, x: int, y: int, is_hit: bool, ship_sunk: Optional[str]) -> None:
+        """
+        Learn from the result of a shot.
+
+        Args:
+            x: X coordinate fired at
+            y: Y coordinate fired at
+            is_hit: Whether the shot hit a ship
+            ship_sunk: Name of the ship sunk by the shot, if any
+        """
+
+
+class RandomStrategy(Strategy):
+    """Fires at untried cells in uniformly random order."""
+
+    name = "random"
+
+    def reset(self, board_size: int, fleet: List[Tuple[str, int]], rng=random) -> None:
+        super().reset(board_size, fleet, rng)
+        self._order = [(x, y) for x in range(board_size) for y in range(board_size)]
+        rng.shuffle(self._order)
+
+    def next_shot(self) -> Tuple[int, int]:
+        return self._order.pop()
+
+
+class HuntTargetStrategy(Strategy):
+    """
+    Fires randomly on a checkerboard until it hits, then probes the
+    neighbours of unresolved hits until the ship is sunk.
+    """
+
+    name = "hunt_target"
+
+    def reset(self, board_size: int, fleet: List[Tuple[str, int]], rng=random) -> None:
+        super().reset(board_size, fleet, rng)
+        self._tried = set()
+        cells = [(x, y) for x in range(board_size) for y in range(board_size)]
+        rng.shuffle(cells)
+        # Hunt the parity cells first: every ship of size >= 2 covers one
+        cells.sort(key=lambda cell: (cell[0] + cell[1]) % 2 == 0)
+        self._hunt = cells
+        self._targets: List[Tuple[int, int]] = []
+
+    def next_shot(self) -> Tuple[int, int]:
+        while self._targets:
+            cell = self._targets.pop()
+            if cell not in self._tried:
+                return cell
+        while True:
+            cell = self._hunt.pop()
+            if cell not in self._tried:
+                return cell
+
+    def observe(self, x: int, y: int, is_hit: bool, ship_sunk: Optional[str]) -> None:
+        self._tried.add((x, y))
+        if is_hit and not ship_sunk:
+            for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                if 0 <= nx < self.board_size and 0 <= ny < self.board_size \
+                        and (nx, ny) not in self._tried:
+                    self._targets.append((nx, ny))
+
+
+@lru_cache(maxsize=128)
+def _placement_table(board_size: int, size: int) -> Tuple[Tuple[Tuple[int, ...], ...],
+                                                           Tuple[Tuple[int, ...], ...],
+                                                           Tuple[int, ...]]:
+    """
+    Get the placements of one ship size as linear cell indices.
+
+    Returns:
+        Tuple of (cells of each placement, placements covering each cell,
+        number of placements covering each cell)
+    """
+    engine = get_placement_engine(board_size, (size,))
+    placements = tuple(tuple(x * board_size + y for x, y in engine.cells(size, index))
+                       for index in range(engine.candidate_count(size)))
+    covering: List[List[int]] = [[] for _ in range(board_size * board_size)]
+    for index, cells in enumerate(placements):
+        for cell in cells:
+            covering[cell].append(index)
+    return placements, tuple(map(tuple, covering)), tuple(map(len, covering))
+
+
+class _ScoreBuckets:
+    """
+    Cells grouped by score, so the best-scoring cells are found without
+    scanning the board.
+
+    The top score is tracked lazily: it is raised when a cell moves
+    above it and lowered past empty buckets when the best cells are
+    requested, so a game costs at most the total of all score decreases.
+    """
+
+    def __init__(self, scores: List[int]):
+        self._buckets: Dict[int, Set[int]] = {}
+        for cell, score in enumerate(scores):
+            self._buckets.setdefault(score, set()).add(cell)
+        self._top = max(scores, default=0)
+
+    def discard(self, cell: int, score: int) -> None:
+        """Remove a cell with the given score."""
+        bucket = self._buckets[score]
+        bucket.discard(cell)
+        if not bucket:
+            del self._buckets[score]
+
+    def move(self, cell: int, old_score: int, new_score: int) -> None:
+        """Move a cell from one score to another."""
+        if old_score == new_score:
+            return
+        self.discard(cell, old_score)
+        self._buckets.setdefault(new_score, set()).add(cell)
+        if new_score > self._top:
+            self._top = new_score
+
+    def best(self) -> Tuple[int, Set[int]]:
+        """Get the top score and the cells that have it."""
+        while self._top > 0 and self._top not in self._buckets:
+            self._top -= 1
+        return self._top, self._buckets.get(self._top, set())
+
+
+class DensityStrategy(Strategy):
+    """
+    Fires at the cell covered by the most placements of the remaining fleet.
+
+    Every straight placement of each remaining ship size is tracked as
+    alive or dead. Misses and sunk ships kill the placements through
+    their cells, and the per-cell density is updated by subtracting only
+    the killed placements, so a shot costs work proportional to the
+    placements it touches rather than a full recount. Unshot cells are
+    kept in buckets by score, so choosing a shot does not scan the board
+    either. While hits are unresolved, only placements through those
+    hits are scored.
+    """
+
+    name = "density"
+
+    def reset(self, board_size: int, fleet: List[Tuple[str, int]], rng=random) -> None:
+        super().reset(board_size, fleet, rng)
+        cell_count = board_size * board_size
+        self._remaining = list(self.fleet)
+        self._multiplicity = {}
+        for _, size in self.fleet:
+            self._multiplicity[size] = self._multiplicity.get(size, 0) + 1
+
+        self._tables = {size: _placement_table(board_size, size) for size in self._multiplicity}
+        self._alive = {size: bytearray(b"\x01") * len(table[0]) for size, table in self._tables.items()}
+        self._hits_covered = {size: bytearray(len(table[0])) for size, table in self._tables.items()}
+        self._coverage = {size: list(table[2]) for size, table in self._tables.items()}
+        self._target_coverage = {size: [0] * cell_count for size in self._tables}
+
+        self._density = [0] * cell_count
+        for size, coverage in self._coverage.items():
+            weight = self._multiplicity[size]
+            self._density = [total + weight * count for total, count in zip(self._density, coverage)]
+        self._target_density = [0] * cell_count
+        self._unshot = set(range(cell_count))
+        self._unresolved_hits = set()
+        self._density_buckets = _ScoreBuckets(self._density)
+        self._target_buckets = _ScoreBuckets(self._target_density)
+
+    def density_map(self) -> List[int]:
+        """Get the current placement count of every cell, indexed x * board_size + y."""
+        return list(self._density)
+
+    def next_shot(self) -> Tuple[int, int]:
+        best, choices = 0, set()
+        if self._unresolved_hits:
+            best, choices = self._target_buckets.best()
+        if not best:
+            best, choices = self._density_buckets.best()
+        return divmod(self.rng.choice(sorted(choices)), self.board_size)
+
+    def observe(self, x: int, y: int, is_hit: bool, ship_sunk: Optional[str]) -> None:
+        cell = x * self.board_size + y
+        if cell not in self._unshot:
+            return  # Duplicate shot; nothing new to learn
+        self._unshot.discard(cell)
+        self._density_buckets.discard(cell, self._density[cell])
+        self._target_buckets.discard(cell, self._target_density[cell])
+        if not is_hit:
+            self._kill_through(cell)
+            return
+
+        self._unresolved_hits.add(cell)
+        for size, (placements, covering, _) in self._tables.items():
+            alive = self._alive[size]
+            hits_covered = self._hits_covered[size]
+            weight = self._multiplicity[size]
+            target_coverage = self._target_coverage[size]
+            for index in covering[cell]:
+                if alive[index]:
+                    hits_covered[index] += 1
+                    if hits_covered[index] == 1:
+                        for covered in placements[index]:
+                            target_coverage[covered] += 1
+                            self._shift_target_density(covered, weight)
+        if ship_sunk:
+            self._sink(cell, ship_sunk)
+
+    def _shift_density(self, cell: int, delta: int) -> None:
+        """Change a cell's density, keeping unshot cells in the right bucket."""
+        old = self._density[cell]
+        self._density[cell] = old + delta
+        if cell in self._unshot:
+            self._density_buckets.move(cell, old, old + delta)
+
+    def _shift_target_density(self, cell: int, delta: int) -> None:
+        """Change a cell's target density, keeping unshot cells in the right bucket."""
+        old = self._target_density[cell]
+        self._target_density[cell] = old + delta
+        if cell in self._unshot:
+            self._target_buckets.move(cell, old, old + delta)
+
+    def _kill(self, size: int, index: int) -> None:
+        """Mark one placement impossible and remove it from the densities."""
+        self._alive[size][index] = 0
+        weight = self._multiplicity[size]
+        coverage = self._coverage[size]
+        targeted = self._hits_covered[size][index] > 0
+        for cell in self._tables[size][0][index]:
+            coverage[cell] -= 1
+            self._shift_density(cell, -weight)
+            if targeted:
+                self._target_coverage[size][cell] -= 1
+                self._shift_target_density(cell, -weight)
+
+    def _kill_through(self, cell: int) -> None:
+        """Kill every live placement that covers a cell known not to hold a live ship."""
+        for size, table in self._tables.items():
+            alive = self._alive[size]
+            for index in table[1][cell]:
+                if alive[index]:
+                    self._kill(size, index)
+
+    def _sink(self, cell: int, ship_name: str) -> None:
+        """Resolve the hits of a sunk ship and drop it from the remaining fleet."""
+        size = next((size for name, size in self._remaining if name == ship_name), None)
+        if size is None:
+            return
+        self._remaining.remove((ship_name, size))
+
+        # The sunk ship is a line of unresolved hits through the last shot
+        sunk_cells = (cell,)
+        for index in self._tables[size][1][cell]:
+            cells = self._tables[size][0][index]
+            if all(covered in self._unresolved_hits for covered in cells):
+                sunk_cells = cells
+                break
+        for sunk_cell in sunk_cells:
+            self._unresolved_hits.discard(sunk_cell)
+            self._kill_through(sunk_cell)
+
+        # One fewer ship of this size: drop its share of the remaining placements
+        self._multiplicity[size] -= 1
+        for covered, count in enumerate(self._coverage[size]):
+            if count:
+                self._shift_density(covered, -count)
+        for covered, count in enumerate(self._target_coverage[size]):
+            if count:
+                self._shift_target_density(covered, -count)
+
+
+# Strategies selectable by name (e.g. from the simulation command line)
+STRATEGIES = {
+    RandomStrategy.name: RandomStrategy,
+    HuntTargetStrategy.name: HuntTargetStrategy,
+    DensityStrategy.name: DensityStrategy,
+}
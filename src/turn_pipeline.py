@@ -0,0 +1,129 @@
+"""
+Pipelined turn processing for Homomorphic Battleship.
+
+In a normal turn the attacker's subtract-and-blind, the defender's zero
+test and the plaintext bookkeeping run one after another. Alice's and
+Bob's boards use independent keys, and a player's next shot only
+depends on their own earlier results, so the next player's shot can be
+chosen and blinded while the defender of the current shot is still
+decrypting. With a two-worker process pool, the zero tests of
+consecutive shots also run side by side.
+
+Shots are always recorded in turn order. If a shot ends the game, the
+shot already in flight behind it is discarded without being recorded.
+"""
+
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+from src.packed_board import PackedEncryptedBoard
+from src.server import GameServer
+
+
+class PipelinedTurnEngine:
+    """
+    Plays alternating turns with two shots in flight.
+
+    While the defender zero-tests shot N on a worker, the main process
+    chooses and blinds shot N + 1 for the other player and submits it to
+    a second worker.
+    """
+
+    def __init__(self, server: GameServer, executor: Optional[Executor] = None):
+        """
+        Initialize the engine.
+
+        Args:
+            server: A started GameServer whose game uses per-cell encrypted boards
+            executor: Executor for defender zero tests (defaults to two worker processes)
+        """
+        game_logic = server.game_logic
+        if isinstance(game_logic.alice_encrypted_board, PackedEncryptedBoard) or \
+                isinstance(game_logic.bob_encrypted_board, PackedEncryptedBoard):
+            raise ValueError("Pipelined turns require per-cell encrypted boards")
+
+        self.server = server
+        self.game_logic = game_logic
+        self._executor = executor or ProcessPoolExecutor(max_workers=2)
+        self._owns_executor = executor is None
+        # Defender zero testers, keyed by the attacking player
+        self._defenders = {
+            "Alice": game_logic.zero_testers["Bob"],
+            "Bob": game_logic.zero_testers["Alice"],
+        }
+
+    def play(self, choose_shot: Callable[[str], Tuple[int, int]],
+             on_result: Optional[Callable[[str, Dict], None]] = None,
+             max_turns: Optional[int] = None) -> List[Dict]:
+        """
+        Play turns until the game ends or max_turns shots are recorded.
+
+        choose_shot is called for a player only after all of that
+        player's earlier shots have been recorded and reported through
+        on_result, so strategies see the same feedback as in sequential
+        play.
+
+        Args:
+            choose_shot: Returns the next (x, y) for a player name
+            on_result: Called with (player_name, response) for every recorded shot
+            max_turns: Maximum number of shots to record (None for no limit)
+
+        Returns:
+            The server-style response of every recorded shot, in turn order
+
+        Raises:
+            RuntimeError: if the game has not been started
+            ValueError: if a chosen shot is out of bounds
+        """
+        if not self.server.game_started:
+            raise RuntimeError("Game not started")
+
+        pending: Deque[Tuple[str, int, int, Future]] = deque()
+        responses: List[Dict] = []
+        submitted = 0
+        next_player = self.server.get_whose_turn()
+
+        def submit() -> None:
+            nonlocal submitted, next_player
+            player_name = next_player
+            x, y = choose_shot(player_name)
+            encrypted_result = self.game_logic.prepare_guess(player_name, x, y)
+            future = self._defenders[player_name].submit_is_zero(encrypted_result, self._executor)
+            pending.append((player_name, x, y, future))
+            submitted += 1
+            next_player = "Bob" if player_name == "Alice" else "Alice"
+
+        def can_submit() -> bool:
+            return max_turns is None or submitted < max_turns
+
+        if not self.server.is_game_over() and can_submit():
+            submit()
+        while pending:
+            # Blind the next shot while the defender of the oldest shot decrypts
+            if len(pending) < 2 and can_submit():
+                submit()
+
+            player_name, x, y, future = pending.popleft()
+            # Defender's zero test; checked against the plaintext board as it is recorded
+            outcome = self.game_logic.complete_guess(player_name, x, y, future.result())
+            response = self.server.finish_guess(player_name, x, y, outcome)
+            responses.append(response)
+            if on_result is not None:
+                on_result(player_name, response)
+
+            if response["game_over"]:
+                for _, _, _, stale in pending:
+                    stale.cancel()
+                pending.clear()
+        return responses
+
+    def close(self) -> None:
+        """Shut down the executor if the engine created it."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "PipelinedTurnEngine":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
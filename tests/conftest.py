@@ -12,8 +12,23 @@ collecting tests, making it the ideal place for this setup.
 
 import sys
 from pathlib import Path
+import pytest
 
 # Add src directory to path - only once, and only if not already present
 src_path = str(Path(__file__).parent.parent / "src")
 if src_path not in sys.path:
     sys.path.insert(0, src_path)
+
+
+@pytest.fixture(scope="session")
+def keypair():
+    """Generate one 1024-bit keypair shared by the whole test session."""
+    from crypto import generate_keypair
+    return generate_keypair(n_length=1024)
+
+
+@pytest.fixture(scope="session")
+def keypairs(keypair):
+    """Two distinct 1024-bit keypairs (Alice's and Bob's) shared by the test session."""
+    from crypto import generate_keypair
+    return keypair, generate_keypair(n_length=1024)
@@ -0,0 +1,130 @@
+"""
+Unit tests for the arithmetic backends.
+"""
+
+import pytest
+# The game modules import src.backend, so switch backends on that module object
+from src import backend
+from src.backend import (BACKENDS, ArithmeticBackend, available_backends, backend_report,
+                         get_backend, set_backend)
+from board import Board
+from crypto import (generate_keypair, encrypt_value, decrypt_value,
+                    perform_homomorphic_hit_check, check_hit, ZeroTestDecryptor)
+from encryption_engine import EncryptionEngine
+from lazy_board import LazyEncryptedBoard
+from packed_board import PackedEncryptedBoard
+
+
+class CountingBackend(ArithmeticBackend):
+    """Python backend that counts modular exponentiations."""
+
+    name = "counting"
+
+    def __init__(self):
+        self.powmods = 0
+
+    def powmod(self, base: int, exponent: int, modulus: int) -> int:
+        self.powmods += 1
+        return super().powmod(base, exponent, modulus)
+
+
+@pytest.fixture
+def restore_backend():
+    """Restore the active backend after a test that switches it."""
+    previous = get_backend().name
+    yield
+    set_backend(previous)
+
+
+class TestArithmeticBackends:
+    """Tests for backend selection and arithmetic."""
+
+    @pytest.mark.parametrize("name", available_backends())
+    def test_arithmetic(self, name):
+        """Test each installed backend against Python's built-in integers."""
+        arithmetic = BACKENDS[name]
+        modulus = 2 ** 127 - 1
+        assert arithmetic.powmod(3, 10 ** 30, modulus) == pow(3, 10 ** 30, modulus)
+        assert arithmetic.mulmod(2 ** 120, 2 ** 120, modulus) == 2 ** 240 % modulus
+        assert arithmetic.invert(5, modulus) * 5 % modulus == 1
+        assert arithmetic.is_prime(modulus)
+        assert not arithmetic.is_prime(modulus + 2)
+
+        prime = arithmetic.random_prime(64)
+        assert prime.bit_length() == 64
+        assert arithmetic.is_prime(prime)
+
+    def test_python_fallback_always_available(self):
+        """Test that the pure-Python backend can always be selected."""
+        assert "python" in available_backends()
+        assert isinstance(get_backend(), ArithmeticBackend)
+
+    def test_default_prefers_gmpy2(self):
+        """Test that gmpy2 is active by default exactly when it is installed."""
+        expected = "gmpy2" if backend.gmpy2 is not None else "python"
+        assert available_backends()[0] == expected
+
+    def test_set_backend_errors(self, restore_backend):
+        """Test that unknown or missing backends are rejected."""
+        with pytest.raises(ValueError):
+            set_backend("fortran")
+        if backend.gmpy2 is None:
+            with pytest.raises(ValueError):
+                set_backend("gmpy2")
+
+    def test_report_names_active_backend(self, restore_backend):
+        """Test that the startup report names the active backend."""
+        set_backend("python")
+        report = backend_report()
+        assert "Arithmetic backend: python" in report
+        if backend.gmpy2 is None:
+            assert "pure-Python fallback" in report
+
+    @pytest.mark.parametrize("name", available_backends())
+    def test_paillier_round_trip(self, name, restore_backend):
+        """Test keygen, encryption, hit check and decryption on each backend."""
+        set_backend(name)
+        public_key, private_key = generate_keypair(n_length=512)
+        assert public_key.n.bit_length() == 512
+
+        ship, water = encrypt_value(public_key, 1), encrypt_value(public_key, 0)
+        assert decrypt_value(private_key, ship) == 1
+        assert private_key.decrypt(water) == 0
+        assert decrypt_value(private_key, encrypt_value(public_key, -7)) == -7
+
+        zero_tester = ZeroTestDecryptor(private_key)
+        assert zero_tester.is_zero(perform_homomorphic_hit_check(ship, 1))
+        assert not zero_tester.is_zero(perform_homomorphic_hit_check(water, 1))
+        assert check_hit(decrypt_value(private_key, perform_homomorphic_hit_check(ship, 1)))
+
+    def test_board_encryption_uses_active_backend(self, restore_backend, monkeypatch):
+        """Test that board encryption and packed decryption go through the backend."""
+        public_key, private_key = generate_keypair(n_length=512)
+        board = Board("Alice")
+        board.place_ships()
+        counting = CountingBackend()
+        monkeypatch.setitem(BACKENDS, counting.name, counting)
+        set_backend(counting.name)
+
+        def powmods(operation):
+            before = counting.powmods
+            operation()
+            return counting.powmods - before
+
+        assert powmods(lambda: board.encrypt_board(public_key)) == 100
+        assert powmods(lambda: list(board.iter_encrypted_cells(public_key))) == 100
+        assert powmods(lambda: EncryptionEngine(max_workers=1).encrypt_cells(public_key, board.board)) == 100
+        assert powmods(lambda: LazyEncryptedBoard(board, public_key)[(0, 0)]) == 1
+
+        packed = PackedEncryptedBoard.from_board(board, public_key)
+        assert counting.powmods == 301 + len(packed.ciphertexts)
+        x, y = board.ships[0].coordinates[0]
+        result = packed.hit_check(x, y)
+        assert powmods(lambda: packed.decrypt_hit_check(private_key, result, x, y)) == 2
+
+    def test_decrypt_rejects_other_key(self):
+        """Test that decrypting under the wrong key raises ValueError."""
+        public_key, _ = generate_keypair(n_length=512)
+        _, other_private_key = generate_keypair(n_length=512)
+        with pytest.raises(ValueError):
+            decrypt_value(other_private_key, encrypt_value(public_key, 1))
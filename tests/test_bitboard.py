@@ -0,0 +1,105 @@
+"""
+Unit tests for the bitmask board backend.
+"""
+
+import pytest
+from board import Ship
+from bitboard import BitBoard
+
+
+class TestBitBoard:
+    """Tests for the BitBoard class."""
+    
+    def test_initialization(self):
+        """Test that a new bitboard looks like an empty Board."""
+        board = BitBoard("TestPlayer")
+        assert board.player_name == "TestPlayer"
+        assert len(board.board) == 100
+        assert all(val == 0 for val in board.board.values())
+        assert len(board.guesses) == 0
+        assert len(board.ships) == 0
+    
+    def test_place_ships(self):
+        """Test random placement keeps masks and ship lists consistent."""
+        board = BitBoard()
+        board.place_ships()
+        
+        assert sorted(ship.size for ship in board.ships) == [2, 2, 3, 4, 5]
+        assert sum(board.board.values()) == 16
+        seen = set()
+        for ship in board.ships:
+            is_valid, error = Ship.is_valid_line(ship.coordinates)
+            assert is_valid, error
+            for x, y in ship.coordinates:
+                assert board.get_cell(x, y) == 1
+                assert board.get_ship_at(x, y) is ship
+                assert (x, y) not in seen
+                seen.add((x, y))
+    
+    def test_record_hits_and_sinking(self):
+        """Test hit, duplicate, sunk and game-over detection."""
+        board = BitBoard()
+        board.place_ships()
+        water_cell = next(coord for coord, value in board.board.items() if value == 0)
+        
+        assert board.record_hit_on_board(*water_cell) == (False, False)
+        assert board.record_hit_on_board(*water_cell) == (False, True)
+        assert water_cell in board.guesses
+        
+        for index, ship in enumerate(board.ships):
+            assert not board.is_ship_sunk(index)
+            for x, y in ship.coordinates:
+                assert not board.all_ships_sunk()
+                assert board.record_hit_on_board(x, y) == (True, False)
+            assert board.is_ship_sunk(index)
+            assert ship.is_sunk()
+        
+        assert board.all_ships_sunk()
+        assert len(board.guesses) == 17
+        assert board.get_game_status()["all_sunk"]
+    
+    def test_place_ship_overlap(self):
+        """Test that overlapping ships are rejected."""
+        board = BitBoard()
+        board.place_ship(Ship(ship_id=0, name="A", size=2), [(0, 0), (1, 0)])
+        with pytest.raises(ValueError):
+            board.place_ship(Ship(ship_id=1, name="B", size=2), [(1, 0), (1, 1)])
+        assert board.get_ship_at(1, 1) is None
+    
+    def test_out_of_bounds(self):
+        """Test bounds checks match Board."""
+        board = BitBoard()
+        with pytest.raises(ValueError):
+            board.get_cell(10, 0)
+        with pytest.raises(ValueError):
+            board.record_hit_on_board(-1, 0)
+        assert (10, 0) not in board.guesses
+    
+    def test_manual_placement(self, monkeypatch):
+        """Test that manual placement keeps the masks in sync."""
+        inputs = iter([
+            "0 0", "1 0", "2 0", "3 0", "4 0",
+            "0 2", "0 3", "0 4", "0 5",
+            "5 5", "5 6", "5 7",
+            "9 0", "9 1",
+            "7 9", "8 9",
+        ])
+        monkeypatch.setattr("builtins.input", lambda prompt="": next(inputs))
+        board = BitBoard()
+        board.place_ships_manual()
+        
+        assert board.get_ship_at(2, 0).name == "Aircraft Carrier"
+        assert board.record_hit_on_board(9, 1) == (True, False)
+        assert not board.all_ships_sunk()
+    
+    def test_more_than_255_ships(self):
+        """Test that ship lookups work beyond 255 ships."""
+        fleet = [(f"Dinghy {index}", 1) for index in range(300)]
+        board = BitBoard(board_size=20, fleet=fleet)
+        board.place_ships()
+        
+        last_ship = board.ships[-1]
+        x, y = last_ship.coordinates[0]
+        assert board.get_ship_at(x, y) is last_ship
+        assert board.record_hit_on_board(x, y) == (True, False)
+        assert last_ship.is_sunk()
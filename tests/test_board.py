@@ -248,3 +248,97 @@ class TestBoard:
                 for i in range(1, len(x_values)):
                     assert x_values[i] == x_values[i-1] + 1, \
                         f"Ship {ship.name} has gap in horizontal line"
+
+    
+    def test_remaining_cells_counter(self):
+        """Test that hits through the board count down remaining ship cells."""
+        board = Board()
+        board.place_ships()
+        
+        ship_cells = [coord for ship in board.ships for coord in ship.coordinates]
+        for x, y in ship_cells[:-1]:
+            board.record_hit_on_board(x, y)
+            board.record_hit_on_board(x, y)  # Duplicates must not count twice
+            assert not board.all_ships_sunk()
+        
+        board.record_hit_on_board(*ship_cells[-1])
+        assert board.all_ships_sunk()
+    
+    def test_ship_index_follows_direct_changes(self):
+        """Test that ships added directly to board.ships are indexed on demand."""
+        board = Board()
+        board.place_ships()
+        
+        ship = Ship(ship_id=0, name="Raft", size=1, coordinates=[(0, 0)])
+        board.ships = [ship]
+        board.board[(0, 0)] = 1
+        
+        assert board.get_ship_at(0, 0) is ship
+        assert not board.all_ships_sunk()
+        assert board.record_hit_on_board(0, 0) == (True, False)
+        assert board.all_ships_sunk()
+
+
+class TestBoardConfiguration:
+    """Tests for configurable board sizes and fleets."""
+    
+    def test_default_configuration(self):
+        """Test that boards default to the standard 10x10 fleet."""
+        board = Board()
+        assert board.board_size == Board.BOARD_SIZE
+        assert board.fleet == list(zip(Board.SHIP_NAMES, Board.SHIP_SIZES))
+    
+    def test_custom_size_and_fleet(self):
+        """Test placement of a custom fleet on a small board."""
+        fleet = [("Cruiser", 3), ("Dinghy", 1)]
+        board = Board(board_size=4, fleet=fleet)
+        board.place_ships()
+        
+        assert len(board.board) == 16
+        assert [(ship.name, ship.size) for ship in board.ships] == fleet
+        assert sum(board.board.values()) == 4
+        assert board.in_bounds(3, 3)
+        assert not board.in_bounds(4, 0)
+        with pytest.raises(ValueError):
+            board.record_hit_on_board(4, 0)
+    
+    def test_large_board(self):
+        """Test random placement and hits on a 100x100 board."""
+        fleet = [(f"Ship {i}", 2 + i % 9) for i in range(40)]
+        board = Board(board_size=100, fleet=fleet)
+        board.place_ships()
+        
+        assert len(board.ships) == 40
+        for ship in board.ships:
+            for x, y in ship.coordinates:
+                assert board.in_bounds(x, y)
+        
+        ship_cells = [coord for ship in board.ships for coord in ship.coordinates]
+        for x, y in ship_cells:
+            board.record_hit_on_board(x, y)
+        assert board.all_ships_sunk()
+    
+    def test_invalid_configuration(self):
+        """Test that unplayable sizes and fleets are rejected."""
+        with pytest.raises(ValueError):
+            Board(board_size=0)
+        with pytest.raises(ValueError):
+            Board(board_size=Board.MAX_BOARD_SIZE + 1)
+        with pytest.raises(ValueError):
+            Board(board_size=5, fleet=[("Too Long", 6)])
+        with pytest.raises(ValueError):
+            Board(board_size=2, fleet=[("A", 2), ("B", 2), ("C", 1)])
+        with pytest.raises(ValueError):
+            Board(fleet=[])
+    
+    def test_valid_range_uses_board_size(self):
+        """Test that placement hints follow the board size."""
+        assert "0-49" in Ship.get_valid_range([], 3, board_size=50)
+        hint = Ship.get_valid_range([(0, 9), (1, 9)], 3, board_size=50)
+        assert "x must be 2" in hint
+    
+    def test_valid_range_defaults_to_board_size(self, monkeypatch):
+        """Test that placement hints default to Board.BOARD_SIZE."""
+        assert "0-9" in Ship.get_valid_range([], 3)
+        monkeypatch.setattr(Board, "BOARD_SIZE", 20)
+        assert "0-19" in Ship.get_valid_range([], 3)
@@ -0,0 +1,59 @@
+"""
+Unit tests for bulk board generation and corpus files.
+"""
+
+import pytest
+from board import Board
+from bitboard import BitBoard
+from board_corpus import BoardCorpus, generate_corpus
+
+
+class TestBoardCorpus:
+    """Tests for generate_corpus and BoardCorpus."""
+
+    def test_rows_are_valid_placements(self):
+        """Test that every row loads into a board with the full fleet."""
+        corpus = generate_corpus(200, seed=1, chunk_size=64)
+
+        assert len(corpus) == 200
+        assert len(corpus.row(0)) == 100
+        for index in range(len(corpus)):
+            board = corpus.to_board(index, "Alice")
+            assert [ship.size for ship in board.ships] == Board.SHIP_SIZES
+            assert sum(board.board.values()) == sum(Board.SHIP_SIZES)
+
+    def test_seeded_and_worker_independent(self):
+        """Test that a seed reproduces the same corpus with or without workers."""
+        single = generate_corpus(300, seed=99, chunk_size=100)
+        parallel = generate_corpus(300, seed=99, chunk_size=100, workers=2)
+        other = generate_corpus(300, seed=100, chunk_size=100)
+
+        assert bytes(single.row(-1)) == bytes(parallel.row(-1))
+        assert list(map(bytes, single)) == list(map(bytes, parallel))
+        assert list(map(bytes, single)) != list(map(bytes, other))
+
+    def test_save_and_load(self, tmp_path):
+        """Test that a corpus file round-trips and loads into BitBoards."""
+        fleet = [("Cruiser", 3), ("Dinghy", 1)]
+        corpus = generate_corpus(50, board_size=6, fleet=fleet, seed=5)
+        path = str(tmp_path / "fleets.corpus")
+        corpus.save(path)
+
+        loaded = BoardCorpus.load(path)
+        assert loaded.board_size == 6
+        assert loaded.fleet == fleet
+        assert list(map(bytes, loaded)) == list(map(bytes, corpus))
+
+        board = loaded.to_board(3, "Bob", board_cls=BitBoard)
+        plain = corpus.to_board(3, "Bob")
+        assert [ship.coordinates for ship in board.ships] == \
+            [ship.coordinates for ship in plain.ships]
+
+    def test_mismatched_row_rejected(self):
+        """Test that a row for another fleet cannot be loaded."""
+        corpus = generate_corpus(1, board_size=6, fleet=[("Cruiser", 3)], seed=0)
+        board = Board(board_size=6, fleet=[("Destroyer", 2)])
+        with pytest.raises(ValueError):
+            board.place_ships_from_row(corpus.row(0))
+        with pytest.raises(IndexError):
+            corpus.row(1)
@@ -0,0 +1,91 @@
+"""
+Unit tests for the memory-mapped encrypted board store.
+"""
+
+import os
+import pytest
+from board import Board
+from crypto import generate_keypair, decrypt_value
+from game_logic import GameLogic
+from board_store import EncryptedBoardStore, MmapEncryptedBoard
+from serialization import serialize_encrypted_board
+
+
+class TestEncryptedBoardStore:
+    """Tests for EncryptedBoardStore and MmapEncryptedBoard."""
+    
+    def test_put_and_read_back(self, keypair, tmp_path):
+        """Test that a stored board decrypts cell by cell."""
+        public_key, private_key = keypair
+        board = Board()
+        board.place_ships()
+        
+        with EncryptedBoardStore(str(tmp_path)) as store:
+            mapped = store.put("game1-alice", board.encrypt_board(public_key), public_key)
+            
+            assert isinstance(mapped, MmapEncryptedBoard)
+            assert os.path.exists(mapped.path)
+            assert len(mapped) == 100
+            for coord, value in board.board.items():
+                assert decrypt_value(private_key, mapped[coord]) == value
+            
+            mapped.advise_idle()
+            assert store.open("game1-alice", public_key) is mapped
+            
+            store.remove("game1-alice")
+            assert not os.path.exists(mapped.path)
+    
+    def test_temporary_store_cleanup(self, keypair):
+        """Test that a temporary store deletes its directory on close."""
+        public_key, _ = keypair
+        store = EncryptedBoardStore()
+        store.put("board", Board().encrypt_board(public_key), public_key)
+        directory = store.directory
+        
+        store.close()
+        assert not os.path.exists(directory)
+    
+    def test_put_board_streams_cells(self, keypair, tmp_path):
+        """Test that a board encrypted straight to disk matches the in-memory format."""
+        public_key, private_key = keypair
+        board = Board(board_size=6, fleet=[("Cruiser", 3), ("Dinghy", 1)])
+        board.place_ships()
+        
+        with EncryptedBoardStore(str(tmp_path)) as store:
+            mapped = store.put_board("streamed", board, public_key)
+            
+            assert (mapped.width, mapped.height) == (6, 6)
+            for coord, value in board.board.items():
+                assert decrypt_value(private_key, mapped[coord]) == value
+            
+            in_memory = serialize_encrypted_board(dict(mapped), public_key)
+            with open(mapped.path, "rb") as board_file:
+                assert board_file.read() == in_memory
+    
+    def test_invalid_name(self, tmp_path):
+        """Test that names cannot escape the store directory."""
+        store = EncryptedBoardStore(str(tmp_path))
+        with pytest.raises(ValueError):
+            store.open("../evil", None)
+    
+    def test_game_on_mapped_boards(self, keypair):
+        """Test that GameLogic plays on memory-mapped boards."""
+        alice_pub, alice_priv = keypair
+        bob_pub, bob_priv = generate_keypair(n_length=1024)
+        alice_board = Board("Alice")
+        alice_board.place_ships()
+        bob_board = Board("Bob")
+        bob_board.place_ships()
+        
+        with EncryptedBoardStore() as store:
+            game = GameLogic(alice_board, bob_board, alice_pub, bob_pub,
+                             alice_priv, bob_priv, board_store=store)
+            
+            assert isinstance(game.bob_encrypted_board, MmapEncryptedBoard)
+            target_ship = bob_board.ships[0]
+            results = [game.make_guess("Alice", x, y) for x, y in target_ship.coordinates]
+            assert results[-1] == (True, target_ship.name, False)
+            
+            game.close()
+            assert os.listdir(store.directory) == []
+            assert game.store_names == []
@@ -2,13 +2,18 @@
 Unit tests for the crypto module.
 """
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 import pytest
+from board import Board
 from crypto import (
     generate_keypair,
     encrypt_value,
     decrypt_value,
     perform_homomorphic_hit_check,
-    check_hit
+    check_hit,
+    ObfuscatorPool,
+    ZeroTestDecryptor
 )
 
 
@@ -147,3 +152,144 @@ class TestHomomorphicProperties:
         result = decrypt_value(private_key, enc_result)
         
         assert result == 10
+
+
+class TestObfuscatorPool:
+    """Tests for the precomputed obfuscator pool."""
+    
+    def test_pooled_encryption_roundtrip(self):
+        """Test that pooled encryptions decrypt correctly."""
+        public_key, private_key = generate_keypair(n_length=1024)
+        pool = ObfuscatorPool(public_key, size=8, start=False)
+        pool.fill()
+        
+        for value in [0, 1, -1, 42]:
+            encrypted = encrypt_value(public_key, value, obfuscator_pool=pool)
+            assert decrypt_value(private_key, encrypted) == value
+    
+    def test_hit_and_miss_stats(self):
+        """Test that pool hits and misses are counted."""
+        public_key, _ = generate_keypair(n_length=1024)
+        pool = ObfuscatorPool(public_key, size=2, low_watermark=0, start=False)
+        pool.fill()
+        
+        for _ in range(3):
+            pool.encrypt(1)
+        
+        stats = pool.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["available"] == 0
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+    
+    def test_background_refill(self):
+        """Test that the background thread refills a drained pool."""
+        public_key, _ = generate_keypair(n_length=1024)
+        pool = ObfuscatorPool(public_key, size=4, low_watermark=2)
+        try:
+            deadline = time.time() + 10
+            while pool.stats()["available"] < 4 and time.time() < deadline:
+                time.sleep(0.01)
+            assert pool.stats()["available"] == 4
+            
+            for _ in range(3):
+                pool.take()
+            while pool.stats()["available"] < 4 and time.time() < deadline:
+                time.sleep(0.01)
+            assert pool.stats()["available"] == 4
+        finally:
+            pool.close()
+    
+    def test_rerandomize_preserves_plaintext(self):
+        """Test that re-randomization changes the ciphertext but not the value."""
+        public_key, private_key = generate_keypair(n_length=1024)
+        pool = ObfuscatorPool(public_key, size=4, start=False)
+        
+        encrypted_cell = encrypt_value(public_key, 1)
+        rerandomized = pool.rerandomize(encrypted_cell)
+        assert rerandomized.ciphertext() != encrypted_cell.ciphertext()
+        assert decrypt_value(private_key, rerandomized) == 1
+        
+        encrypted_result = perform_homomorphic_hit_check(encrypted_cell, 1, obfuscator_pool=pool)
+        assert check_hit(decrypt_value(private_key, encrypted_result))
+    
+    def test_encrypt_board_with_pool(self):
+        """Test that a pool can be used as a board encryption engine."""
+        public_key, private_key = generate_keypair(n_length=1024)
+        pool = ObfuscatorPool(public_key, size=100, start=False)
+        board = Board()
+        board.place_ships()
+        
+        encrypted_board = board.encrypt_board(public_key, engine=pool)
+        
+        for coord, encrypted in encrypted_board.items():
+            assert decrypt_value(private_key, encrypted) == board.board[coord]
+    
+    def test_invalid_watermarks(self):
+        """Test that inconsistent watermarks are rejected."""
+        public_key, _ = generate_keypair(n_length=1024)
+        with pytest.raises(ValueError):
+            ObfuscatorPool(public_key, size=4, low_watermark=5, start=False)
+
+
+class TestZeroTestDecryptor:
+    """Tests for the CRT zero-test decryption path."""
+    
+    def test_zero_test_matches_check_hit(self):
+        """Test that the zero test agrees with full decryption."""
+        public_key, private_key = generate_keypair(n_length=1024)
+        decryptor = ZeroTestDecryptor(private_key)
+        
+        for cell_value in [0, 1, 0, 1]:
+            encrypted_cell = encrypt_value(public_key, cell_value)
+            encrypted_result = perform_homomorphic_hit_check(encrypted_cell, 1)
+            expected = check_hit(decrypt_value(private_key, encrypted_result))
+            assert decryptor.is_zero(encrypted_result) == expected
+            assert decryptor.is_zero(encrypted_result) == (cell_value == 1)
+    
+    def test_zero_test_on_fresh_encryptions(self):
+        """Test the zero test on freshly encrypted values."""
+        public_key, private_key = generate_keypair(n_length=1024)
+        decryptor = ZeroTestDecryptor(private_key)
+        
+        assert decryptor.is_zero(encrypt_value(public_key, 0))
+        for value in [1, -1, 12345]:
+            assert not decryptor.is_zero(encrypt_value(public_key, value))
+    
+    def test_latency_is_reported(self):
+        """Test that each call's latency is recorded."""
+        public_key, private_key = generate_keypair(n_length=1024)
+        decryptor = ZeroTestDecryptor(private_key, history_size=2)
+        
+        for _ in range(3):
+            decryptor.is_zero(encrypt_value(public_key, 0))
+        
+        stats = decryptor.stats()
+        assert stats["calls"] == 3
+        assert len(decryptor.latencies_ns) == 2
+        assert decryptor.last_latency_ns > 0
+        assert 0 < stats["p50_ns"] <= stats["max_ns"]
+    
+    def test_submitted_latencies_recorded_from_threads(self, keypair):
+        """Test that results and latencies of concurrently submitted tests are all kept."""
+        public_key, private_key = keypair
+        decryptor = ZeroTestDecryptor(private_key)
+        hit_checks = [perform_homomorphic_hit_check(encrypt_value(public_key, value % 2), 1)
+                      for value in range(16)]
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [decryptor.submit_is_zero(hit_check, executor) for hit_check in hit_checks]
+            results = [future.result() for future in futures]
+        
+        assert results == [value % 2 == 1 for value in range(16)]
+        assert decryptor.stats()["calls"] == 16
+        assert len(decryptor.latencies_ns) == 16
+    
+    def test_wrong_key_rejected(self):
+        """Test that ciphertexts under another key are rejected."""
+        _, private_key = generate_keypair(n_length=1024)
+        other_public_key, _ = generate_keypair(n_length=1024)
+        decryptor = ZeroTestDecryptor(private_key)
+        
+        with pytest.raises(ValueError):
+            decryptor.is_zero(encrypt_value(other_public_key, 0))
@@ -0,0 +1,67 @@
+"""
+Unit tests for the parallel encryption engine.
+"""
+
+import pytest
+from board import Board
+from crypto import decrypt_value, encrypt_value, ZeroTestDecryptor
+from encryption_engine import EncryptionEngine
+
+
+class TestEncryptionEngine:
+    """Tests for the EncryptionEngine class."""
+    
+    def test_parallel_encryption_matches_board(self, keypair):
+        """Test that every cell decrypts to the plaintext board value."""
+        public_key, private_key = keypair
+        board = Board()
+        board.place_ships()
+        
+        with EncryptionEngine(max_workers=2) as engine:
+            encrypted_board = board.encrypt_board(public_key, engine)
+        
+        assert set(encrypted_board) == set(board.board)
+        for coord, encrypted in encrypted_board.items():
+            assert encrypted.public_key == public_key
+            assert decrypt_value(private_key, encrypted) == board.board[coord]
+    
+    def test_single_worker_runs_in_process(self, keypair):
+        """Test that a single-worker engine never starts a process pool."""
+        public_key, private_key = keypair
+        board = Board()
+        board.place_ships()
+        
+        engine = EncryptionEngine(max_workers=1)
+        encrypted_board = engine.encrypt_cells(public_key, board.board)
+        
+        assert engine._executor is None
+        assert len(encrypted_board) == 100
+        ship_x, ship_y = board.ships[0].coordinates[0]
+        assert decrypt_value(private_key, encrypted_board[(ship_x, ship_y)]) == 1
+    
+    def test_ciphertexts_are_randomized(self, keypair):
+        """Test that equal plaintexts produce different ciphertexts."""
+        public_key, _ = keypair
+        
+        with EncryptionEngine(max_workers=2) as engine:
+            encrypted = engine.encrypt_cells(public_key, {(0, 0): 0, (0, 1): 0})
+        
+        assert encrypted[(0, 0)].ciphertext() != encrypted[(0, 1)].ciphertext()
+    
+    def test_parallel_zero_tests(self, keypair):
+        """Test batched zero tests on the worker pool."""
+        public_key, private_key = keypair
+        values = [0, 1, 0, 5, 0, -1, 2, 0, 0, 3]
+        encrypted_values = [encrypt_value(public_key, value) for value in values]
+        decryptor = ZeroTestDecryptor(private_key)
+        
+        with EncryptionEngine(max_workers=2) as engine:
+            results = engine.zero_test_many(decryptor, encrypted_values)
+        
+        assert results == [value == 0 for value in values]
+        assert decryptor.calls == 1
+    
+    def test_invalid_worker_count(self):
+        """Test that a non-positive worker count is rejected."""
+        with pytest.raises(ValueError):
+            EncryptionEngine(max_workers=0)
@@ -0,0 +1,153 @@
+"""
+Unit tests for fixed-base exponentiation tables.
+"""
+
+import random
+from collections import OrderedDict
+import pytest
+from phe.paillier import PaillierPublicKey
+import crypto
+from board import Board
+from crypto import (decrypt_value, encrypt_value, make_hit_probe, blind_hit_probe,
+                    check_hit, obfuscator_base, ObfuscatorPool)
+from fixed_base import FixedBaseCache, FixedBaseTable
+from game_logic import GameLogic
+
+
+class TestFixedBaseTable:
+    """Tests for FixedBaseTable."""
+
+    @pytest.mark.parametrize("window_bits", [1, 3, 4, 5])
+    def test_matches_pow(self, window_bits):
+        """Test that table powers equal the built-in modular power."""
+        rng = random.Random(window_bits)
+        modulus = rng.getrandbits(256) | 1
+        base = rng.randrange(2, modulus)
+        table = FixedBaseTable(base, modulus, 64, window_bits)
+
+        for exponent in [0, 1, 2 ** 64 - 1] + [rng.getrandbits(64) for _ in range(50)]:
+            assert table.pow(exponent) == pow(base, exponent, modulus)
+
+    def test_long_exponent_falls_back(self):
+        """Test that exponents longer than the table are still correct."""
+        table = FixedBaseTable(7, 1000003, 8)
+        assert table.pow(2 ** 40 + 5) == pow(7, 2 ** 40 + 5, 1000003)
+        with pytest.raises(ValueError):
+            table.pow(-1)
+
+    def test_nbytes(self):
+        """Test the memory estimate: rows * 2^window_bits entries of modulus size."""
+        table = FixedBaseTable(3, 2 ** 127 - 1, 20, window_bits=4)
+        assert table.nbytes == 5 * 16 * 16
+
+
+class TestFixedBaseCache:
+    """Tests for FixedBaseCache."""
+
+    def test_get_does_not_build(self):
+        """Test that lookups miss until a table is built."""
+        cache = FixedBaseCache()
+        assert cache.get(5, 1009) is None
+        assert cache.pow(5, 1009, 77) == pow(5, 77, 1009)
+
+        table = cache.build(5, 1009, 16)
+        assert cache.get(5, 1009) is table
+        assert cache.pow(5, 1009, 77) == pow(5, 77, 1009)
+        assert cache.stats()["hits"] == 2
+        assert cache.stats()["misses"] == 2
+
+    def test_lru_eviction_within_budget(self):
+        """Test that the least recently used tables are evicted to fit the budget."""
+        modulus = 2 ** 127 - 1
+        table_bytes = FixedBaseTable.estimate_nbytes(modulus, 20)
+        cache = FixedBaseCache(max_bytes=3 * table_bytes)
+        for base in (2, 3, 4):
+            cache.build(base, modulus, 20)
+        cache.get(2, modulus)  # 3 becomes the least recently used
+        cache.build(5, modulus, 20)
+
+        assert cache.get(3, modulus) is None
+        assert all(cache.get(base, modulus) is not None for base in (2, 4, 5))
+        stats = cache.stats()
+        assert stats["evictions"] == 1
+        assert stats["bytes"] <= stats["max_bytes"]
+        assert len(cache) == 3
+
+    def test_table_over_budget_not_built(self):
+        """Test that a table larger than the whole budget is refused."""
+        cache = FixedBaseCache(max_bytes=100)
+        assert cache.build(3, 2 ** 127 - 1, 20) is None
+        assert len(cache) == 0
+
+
+class TestFixedBaseCrypto:
+    """Tests for fixed-base tables in encryption and blinding."""
+
+    def test_obfuscator_bases_bounded(self, monkeypatch):
+        """Test that obfuscator bases are kept only for recently used keys."""
+        monkeypatch.setattr(crypto, "OBFUSCATOR_BASE_CACHE_SIZE", 2)
+        monkeypatch.setattr(crypto, "_obfuscator_bases", OrderedDict())
+        keys = [PaillierPublicKey(n) for n in (1000003 * 1000033, 1000037 * 1000039,
+                                               1000081 * 1000099)]
+        
+        first_base = obfuscator_base(keys[0])
+        obfuscator_base(keys[1])
+        assert obfuscator_base(keys[0]) == first_base  # Now most recently used
+        obfuscator_base(keys[2])
+        
+        assert list(crypto._obfuscator_bases) == [keys[0].n, keys[2].n]
+    
+    def test_obfuscator_pool_with_tables(self, keypair):
+        """Test that fixed-base obfuscators give valid, randomized encryptions."""
+        public_key, private_key = keypair
+        cache = FixedBaseCache()
+        pool = ObfuscatorPool(public_key, size=4, start=False, fixed_base_cache=cache)
+
+        first = encrypt_value(public_key, 1, obfuscator_pool=pool)
+        second = encrypt_value(public_key, 1, obfuscator_pool=pool)
+
+        assert decrypt_value(private_key, first) == decrypt_value(private_key, second) == 1
+        assert first.ciphertext() != second.ciphertext()
+        assert cache.stats()["tables"] == 1
+
+    def test_blinding_with_tables(self, keypair):
+        """Test that table blinding keeps hits at zero and misses non-zero."""
+        public_key, private_key = keypair
+        cache = FixedBaseCache()
+        for value in (0, 1):
+            probe = make_hit_probe(encrypt_value(public_key, value))
+            cache.build(probe.ciphertext(be_secure=False), public_key.nsquare, 20)
+            result = blind_hit_probe(probe, fixed_base_cache=cache)
+            assert check_hit(decrypt_value(private_key, result)) == (value == 1)
+        assert cache.stats()["hits"] == 2
+
+    @pytest.mark.parametrize("options", [{}, {"lazy_boards": True}, {"precompute_probes": True}])
+    def test_game_with_tables(self, keypair, options):
+        """Test that GameLogic encrypts boards from one shared table per key."""
+        public_key, private_key = keypair
+        fleet = [("Destroyer", 2)]
+        cache = FixedBaseCache()
+        for _ in range(2):
+            alice_board = Board("Alice", board_size=3, fleet=fleet)
+            alice_board.place_ships()
+            bob_board = Board("Bob", board_size=3, fleet=fleet)
+            bob_board.place_ships()
+            game = GameLogic(alice_board, bob_board, public_key, public_key, private_key,
+                             private_key, fixed_base_cache=cache, **options)
+
+            x, y = bob_board.ships[0].coordinates[0]
+            assert game.make_guess("Alice", x, y)[0]
+            assert decrypt_value(private_key, game.alice_encrypted_board[(0, 0)]) == \
+                alice_board.board[(0, 0)]
+
+        # Only the key's obfuscator base gets a table, reused by the second game
+        assert len(cache) == 1
+        assert cache.stats()["hits"] > 0
+
+    @pytest.mark.parametrize("options", [{"packed_boards": True}, {"encrypted": False}])
+    def test_tables_require_per_cell_boards(self, keypair, options):
+        """Test that a fixed-base cache is rejected where boards are not encrypted per cell."""
+        public_key, private_key = keypair
+        with pytest.raises(ValueError):
+            GameLogic(Board("Alice"), Board("Bob"), public_key, public_key,
+                      private_key, private_key, fixed_base_cache=FixedBaseCache(), **options)
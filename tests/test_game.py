@@ -5,7 +5,9 @@ Unit tests for the game logic module.
 import pytest
 from board import Board
 from crypto import generate_keypair
-from game_logic import GameLogic
+from game_logic import GameLogic, GameHistory
+from main import setup_game_logic
+from server import GameServer
 
 
 class TestGameLogic:
@@ -103,6 +105,17 @@ class TestGameLogic:
         assert not is_hit
         assert not is_duplicate
     
+    def test_make_guess_non_integer(self, game_setup):
+        """Test that non-integer coordinates are rejected before the board changes."""
+        game, alice_board, bob_board = game_setup
+        
+        for x, y in [(3.0, 0), (0, "1"), (True, 0)]:
+            with pytest.raises(ValueError, match="must be integers"):
+                game.make_guess("Alice", x, y)
+        
+        assert not bob_board.guesses
+        assert len(game.game_state.history) == 0
+    
     def test_ship_sinking(self, game_setup):
         """Test detecting when a ship sinks."""
         game, alice_board, bob_board = game_setup
@@ -201,6 +214,18 @@ class TestGameLogic:
         assert status["total_turns"] == 0
         assert "alice_status" in status
         assert "bob_status" in status
+    
+    def test_decryption_stats(self, game_setup):
+        """Test that defender decryption latency is tracked per player."""
+        game, _, bob_board = game_setup
+        
+        x, y = bob_board.ships[0].coordinates[0]
+        game.make_guess("Alice", x, y)
+        
+        stats = game.get_decryption_stats()
+        assert stats["Bob"]["calls"] == 1
+        assert stats["Bob"]["last_ns"] > 0
+        assert stats["Alice"]["calls"] == 0
 
 
 class TestGameLogicInvariants:
@@ -248,3 +273,251 @@ class TestGameLogicInvariants:
         # Both should be processed
         history = game.get_history()
         assert len(history) >= 1
+
+
+class TestGameHistory:
+    """Tests for the columnar GameHistory log."""
+    
+    def test_entries_have_dict_shape(self):
+        """Test that recorded turns read back as history dicts."""
+        history = GameHistory()
+        history.record(0, "Alice", 3, 4, True, None, False)
+        history.record(1, "Bob", 9, 9, False, None, True)
+        history.record(2, "Alice", 3, 5, True, "Destroyer", False)
+        
+        assert len(history) == 3
+        assert history[0] == {
+            "turn": 0, "player": "Alice", "coordinate": (3, 4),
+            "is_hit": True, "ship_sunk": None, "is_duplicate": False
+        }
+        assert history[1]["is_duplicate"]
+        assert history[-1]["ship_sunk"] == "Destroyer"
+        assert [entry["player"] for entry in history] == ["Alice", "Bob", "Alice"]
+        assert history[1:] == [history[1], history[2]]
+        with pytest.raises(IndexError):
+            history[3]
+    
+    def test_append_dict_compatibility(self):
+        """Test that dict entries can still be appended."""
+        history = GameHistory()
+        entry = {"turn": 5, "player": "Bob", "coordinate": (1, 2),
+                 "is_hit": False, "ship_sunk": None, "is_duplicate": False}
+        history.append(entry)
+        
+        assert history == [entry]
+    
+    def test_compact_storage(self):
+        """Test that each turn costs only a few bytes of column storage."""
+        history = GameHistory()
+        for turn in range(1000):
+            history.record(turn, "Alice" if turn % 2 else "Bob", turn % 10, turn // 100,
+                           turn % 3 == 0, None, False)
+        
+        assert history.nbytes() == 1000 * 13
+        assert not hasattr(history, "__dict__")
+    
+    def test_bad_record_leaves_history_intact(self):
+        """Test that a value that does not fit its column records nothing."""
+        history = GameHistory()
+        history.record(0, "Alice", 1, 2, True, None, False)
+        
+        with pytest.raises(TypeError):
+            history.record(1, "Bob", 3.0, 4, False, None, False)
+        with pytest.raises(OverflowError):
+            history.record(1, "Bob", 3, 70000, False, None, False)
+        
+        assert len(history) == 1
+        assert history.nbytes() == 13
+        history.record(1, "Bob", 3, 4, False, None, False)
+        assert history[1]["coordinate"] == (3, 4)
+    
+    def test_many_ship_names(self):
+        """Test that more than 255 distinct sunk ship names are kept apart."""
+        history = GameHistory()
+        for turn in range(300):
+            history.record(turn, "Alice", turn % 20, turn // 20, True, f"Dinghy {turn}", False)
+        history.record(300, "Bob", 0, 0, False, None, False)
+        
+        assert history[299]["ship_sunk"] == "Dinghy 299"
+        assert history[300]["player"] == "Bob"
+
+
+class TestSalvo:
+    """Tests for batched (salvo) guesses."""
+    
+    @pytest.fixture
+    def game_setup(self):
+        """Set up a game for testing."""
+        alice_pub, alice_priv = generate_keypair(n_length=1024)
+        bob_pub, bob_priv = generate_keypair(n_length=1024)
+        
+        alice_board = Board("Alice")
+        alice_board.place_ships()
+        
+        bob_board = Board("Bob")
+        bob_board.place_ships()
+        
+        game = GameLogic(
+            alice_board, bob_board,
+            alice_pub, bob_pub,
+            alice_priv, bob_priv
+        )
+        
+        return game, alice_board, bob_board
+    
+    def test_salvo_matches_single_guesses(self, game_setup):
+        """Test that a salvo reports hits, sinking and duplicates in order."""
+        game, _, bob_board = game_setup
+        target_ship = bob_board.ships[-1]
+        water_cell = next(coord for coord, value in bob_board.board.items() if value == 0)
+        coordinates = list(target_ship.coordinates) + [water_cell, target_ship.coordinates[0]]
+        
+        outcomes = game.make_salvo("Alice", coordinates)
+        
+        assert len(outcomes) == len(coordinates)
+        for is_hit, _, is_duplicate in outcomes[:target_ship.size]:
+            assert is_hit and not is_duplicate
+        assert outcomes[target_ship.size - 1][1] == target_ship.name
+        assert outcomes[-2] == (False, None, False)
+        assert outcomes[-1] == (True, None, True)
+        assert len(game.get_history()) == len(coordinates)
+    
+    def test_salvo_stops_at_game_over(self, game_setup):
+        """Test that shots after the winning shot are not recorded."""
+        game, _, bob_board = game_setup
+        ship_cells = [coord for ship in bob_board.ships for coord in ship.coordinates]
+        
+        outcomes = game.make_salvo("Alice", ship_cells + [(0, 0)])
+        
+        assert len(outcomes) == len(ship_cells)
+        assert game.game_state.game_over
+        assert game.game_state.winner == "Alice"
+    
+    def test_salvo_out_of_bounds(self, game_setup):
+        """Test that an invalid coordinate rejects the whole salvo."""
+        game, _, _ = game_setup
+        
+        with pytest.raises(ValueError):
+            game.make_salvo("Alice", [(0, 0), (10, 0)])
+        assert len(game.get_history()) == 0
+    
+    def test_salvo_rejects_disagreeing_hit_checks(self, game_setup, monkeypatch):
+        """Test that decrypted hits contradicting the board reject the salvo."""
+        game, _, bob_board = game_setup
+        water_cell = next(coord for coord, value in bob_board.board.items() if value == 0)
+        monkeypatch.setattr(game.zero_testers["Bob"], "is_zero_many",
+                            lambda encrypted_values: [True] * len(encrypted_values))
+        
+        with pytest.raises(RuntimeError):
+            game.make_salvo("Alice", [water_cell])
+        assert len(game.get_history()) == 0
+        assert water_cell not in bob_board.guesses
+    
+    def test_server_salvo_is_one_turn(self, game_setup):
+        """Test the server salvo response and turn switching."""
+        game, _, bob_board = game_setup
+        server = GameServer(game)
+        server.start_game()
+        x, y = bob_board.ships[0].coordinates[0]
+        
+        response = server.process_player_salvo("Alice", [(x, y), (x, y)])
+        
+        assert response["status"] == "success"
+        assert [r["is_duplicate"] for r in response["results"]] == [False, True]
+        assert response["results"][0]["is_hit"]
+        assert server.get_whose_turn() == "Bob"
+        
+        error = server.process_player_salvo("Bob", [(-1, 0)])
+        assert error["status"] == "error"
+
+
+class TestEncryptionCount:
+    """Regression benchmark for the number of encryptions per match."""
+    
+    @pytest.fixture
+    def encryption_counter(self, monkeypatch):
+        """Count every Paillier encryption made while the test runs."""
+        # Every encryption ends in src.crypto, the module the game code imports
+        from src import crypto as game_crypto
+        calls = []
+        original_encrypt = game_crypto._encrypt_with_obfuscator
+        
+        def counting_encrypt(public_key, *args, **kwargs):
+            calls.append(public_key)
+            return original_encrypt(public_key, *args, **kwargs)
+        
+        monkeypatch.setattr(game_crypto, "_encrypt_with_obfuscator", counting_encrypt)
+        return calls
+    
+    def test_each_board_encrypted_once(self, encryption_counter):
+        """Test that match setup encrypts each of the 200 cells exactly once."""
+        alice_pub, alice_priv = generate_keypair(n_length=1024)
+        bob_pub, bob_priv = generate_keypair(n_length=1024)
+        alice_board = Board("Alice")
+        alice_board.place_ships()
+        bob_board = Board("Bob")
+        bob_board.place_ships()
+        
+        game = setup_game_logic(alice_board, bob_board, alice_pub, bob_pub,
+                                alice_priv, bob_priv)
+        
+        assert len(encryption_counter) == 200
+        assert encryption_counter.count(alice_pub) == 100
+        assert encryption_counter.count(bob_pub) == 100
+        
+        # Playing a turn must not trigger any further board encryption
+        x, y = bob_board.ships[0].coordinates[0]
+        game.make_guess("Alice", x, y)
+        assert len(encryption_counter) == 200
+
+
+class TestCustomBoardSize:
+    """Tests for games on non-standard board sizes."""
+    
+    @pytest.fixture
+    def large_game(self):
+        """Set up a lazily encrypted game on a 100x100 board."""
+        alice_pub, alice_priv = generate_keypair(n_length=1024)
+        bob_pub, bob_priv = generate_keypair(n_length=1024)
+        fleet = [("Carrier", 5), ("Raft", 1)]
+        
+        alice_board = Board("Alice", board_size=100, fleet=fleet)
+        alice_board.place_ships()
+        bob_board = Board("Bob", board_size=100, fleet=fleet)
+        bob_board.place_ships()
+        
+        game = GameLogic(alice_board, bob_board, alice_pub, bob_pub,
+                         alice_priv, bob_priv, lazy_boards=True)
+        return game, bob_board
+    
+    def test_bounds_follow_board_size(self, large_game):
+        """Test that coordinates are checked against the configured size."""
+        game, bob_board = large_game
+        
+        assert game.validate_guess(99, 99)
+        with pytest.raises(ValueError, match="0-99"):
+            game.validate_guess(100, 0)
+        with pytest.raises(ValueError):
+            game.make_guess("Alice", 0, 100)
+        
+        x, y = bob_board.ships[-1].coordinates[0]
+        assert game.make_guess("Alice", x, y) == (True, "Raft", False)
+        
+        # Lazy boards only encrypt the probed cell, not the whole 100x100 grid
+        assert game.bob_encrypted_board.materialized_count() == 1
+    
+    def test_server_reports_configuration(self, large_game):
+        """Test that start_game reports the real board size and fleet."""
+        game, _ = large_game
+        start_info = GameServer(game).start_game()
+        
+        assert start_info["board_size"] == 100
+        assert start_info["ships_per_player"] == 2
+    
+    def test_mismatched_board_sizes(self):
+        """Test that both players must use the same board size."""
+        alice_pub, alice_priv = generate_keypair(n_length=1024)
+        
+        with pytest.raises(ValueError):
+            GameLogic(Board("Alice", board_size=8), Board("Bob"),
+                      alice_pub, alice_pub, alice_priv, alice_priv, lazy_boards=True)
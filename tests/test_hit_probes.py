@@ -0,0 +1,107 @@
+"""
+Unit tests for precomputed hit-check probes.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from board import Board
+from crypto import decrypt_value, blind_hit_probe, check_hit
+from game_logic import GameLogic
+from hit_probes import HitProbeTable
+from lazy_board import LazyEncryptedBoard
+
+
+def _small_board(player_name="Player"):
+    """Create a placed 4x4 board with two small ships."""
+    board = Board(player_name, board_size=4, fleet=[("Destroyer", 2), ("Submarine", 1)])
+    board.place_ships()
+    return board
+
+
+class TestHitProbeTable:
+    """Tests for the HitProbeTable class."""
+
+    def test_probes_are_cell_minus_guess(self, keypair):
+        """Test that every probe decrypts to the cell value minus one."""
+        public_key, private_key = keypair
+        board = _small_board()
+        probes = HitProbeTable(board.encrypt_board(public_key))
+        probes.wait(timeout=30)
+
+        assert probes.precomputed_count() == 16
+        for coord, value in board.board.items():
+            assert decrypt_value(private_key, probes[coord]) == value - 1
+        assert probes.stats()["hits"] == 16
+        assert probes.stats()["misses"] == 0
+
+    def test_on_demand_probe_counts_miss(self, keypair):
+        """Test that a probe is computed on first access without the background stage."""
+        public_key, private_key = keypair
+        board = _small_board()
+        probes = HitProbeTable(board.encrypt_board(public_key), background=False)
+
+        x, y = board.ships[0].coordinates[0]
+        blinded = blind_hit_probe(probes[(x, y)])
+
+        assert check_hit(decrypt_value(private_key, blinded))
+        assert probes[(x, y)] is probes[(x, y)]
+        assert probes.stats()["misses"] == 1
+        assert probes.precomputed_count() == 1
+        with pytest.raises(KeyError):
+            probes[(4, 0)]
+
+    def test_concurrent_lookups_counted(self, keypair):
+        """Test that lookups from many threads are all counted."""
+        public_key, _ = keypair
+        probes = HitProbeTable(_small_board().encrypt_board(public_key))
+        probes.wait(timeout=30)
+        coords = list(probes) * 250
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(probes.__getitem__, coords))
+
+        assert probes.stats()["hits"] == len(coords)
+
+    def test_wraps_lazy_board(self, keypair):
+        """Test that probes can be precomputed over a lazily encrypted board."""
+        public_key, private_key = keypair
+        board = _small_board()
+        probes = HitProbeTable(LazyEncryptedBoard(board, public_key))
+        probes.wait(timeout=30)
+
+        assert set(probes) == set(board.board)
+        assert probes.precomputed_count() == len(probes) == 16
+
+    def test_game_with_precomputed_probes(self, keypair):
+        """Test that games with precomputed probes resolve shots the same way."""
+        public_key, private_key = keypair
+        alice_board = _small_board("Alice")
+        bob_board = _small_board("Bob")
+        game = GameLogic(alice_board, bob_board, public_key, public_key,
+                         private_key, private_key, precompute_probes=True)
+
+        shots = 0
+        for x, y in sorted(bob_board.board):
+            if game.game_state.game_over:
+                break
+            assert game.make_guess("Alice", x, y)[0] == (bob_board.board[(x, y)] == 1)
+            shots += 1
+
+        assert game.game_state.winner == "Alice"
+        assert game.get_decryption_stats()["Bob"]["calls"] == shots
+        stats = game.probe_tables["Bob"].stats()
+        assert stats["hits"] + stats["misses"] == shots
+
+    def test_precompute_with_packed_boards_rejected(self, keypair):
+        """Test that probe precomputation requires per-cell boards."""
+        public_key, private_key = keypair
+        with pytest.raises(ValueError):
+            GameLogic(Board("Alice"), Board("Bob"), public_key, public_key,
+                      private_key, private_key, packed_boards=True, precompute_probes=True)
+
+    def test_precompute_with_lazy_boards_rejected(self, keypair):
+        """Test that probe precomputation is refused for lazily encrypted boards."""
+        public_key, private_key = keypair
+        with pytest.raises(ValueError, match="fully encrypted"):
+            GameLogic(Board("Alice"), Board("Bob"), public_key, public_key,
+                      private_key, private_key, lazy_boards=True, precompute_probes=True)
@@ -0,0 +1,68 @@
+"""
+Unit tests for the background key pool.
+"""
+
+import time
+import pytest
+from crypto import encrypt_value, decrypt_value
+from key_pool import KeyPool
+
+
+class TestKeyPool:
+    """Tests for the KeyPool class."""
+    
+    def test_acquire_returns_working_keypair(self):
+        """Test that acquired keypairs can encrypt and decrypt."""
+        with KeyPool(target_depth=1, n_length=1024) as pool:
+            public_key, private_key = pool.acquire()
+        
+        encrypted = encrypt_value(public_key, 1)
+        assert decrypt_value(private_key, encrypted) == 1
+    
+    def test_keypairs_are_distinct(self):
+        """Test that each player gets a fresh keypair."""
+        with KeyPool(target_depth=2, n_length=1024) as pool:
+            pub1, _ = pool.acquire()
+            pub2, _ = pool.acquire()
+            pub3, _ = pool.acquire()
+        
+        assert len({pub1.n, pub2.n, pub3.n}) == 3
+    
+    def test_pool_refills_to_target_depth(self):
+        """Test that acquired keypairs are replaced in the background."""
+        with KeyPool(target_depth=2, n_length=1024) as pool:
+            deadline = time.time() + 30
+            while pool.ready_count() < 2 and time.time() < deadline:
+                time.sleep(0.05)
+            assert pool.ready_count() == 2
+            
+            pool.acquire()
+            assert pool.stats()["ready_hits"] == 1
+            
+            while pool.ready_count() < 2 and time.time() < deadline:
+                time.sleep(0.05)
+            assert pool.ready_count() == 2
+    
+    def test_no_refill_generates_on_demand(self):
+        """Test that a pool without refill only generates the keys it is asked for."""
+        with KeyPool(target_depth=1, n_length=1024, refill=False) as pool:
+            pub1, _ = pool.acquire()
+            assert pool.ready_count() == 0
+            assert pool.stats()["waits"] + pool.stats()["ready_hits"] == 1
+            
+            pub2, _ = pool.acquire()
+            assert pool.ready_count() == 0
+        
+        assert pub1.n != pub2.n
+    
+    def test_acquire_after_close(self):
+        """Test that a closed pool refuses to hand out keys."""
+        pool = KeyPool(target_depth=1, n_length=1024)
+        pool.close()
+        with pytest.raises(RuntimeError):
+            pool.acquire()
+    
+    def test_invalid_depth(self):
+        """Test that a non-positive depth is rejected."""
+        with pytest.raises(ValueError):
+            KeyPool(target_depth=0)
@@ -0,0 +1,83 @@
+"""
+Unit tests for lazily encrypted boards.
+"""
+
+import pytest
+from board import Board
+from crypto import generate_keypair, decrypt_value
+from game_logic import GameLogic
+from lazy_board import LazyEncryptedBoard
+
+
+class TestLazyEncryptedBoard:
+    """Tests for the LazyEncryptedBoard class."""
+    
+    def test_cells_encrypted_on_first_access(self, keypair):
+        """Test that nothing is encrypted until a cell is looked up."""
+        public_key, private_key = keypair
+        board = Board()
+        board.place_ships()
+        lazy = LazyEncryptedBoard(board, public_key)
+        
+        assert lazy.materialized_count() == 0
+        assert len(lazy) == 100
+        
+        x, y = board.ships[0].coordinates[0]
+        encrypted = lazy[(x, y)]
+        assert lazy.materialized_count() == 1
+        assert decrypt_value(private_key, encrypted) == 1
+        
+        # Repeated lookups return the same ciphertext
+        assert lazy[(x, y)] is encrypted
+        assert lazy.materialized_count() == 1
+    
+    def test_behaves_like_dict(self, keypair):
+        """Test mapping behaviour matches Board.encrypt_board."""
+        public_key, _ = keypair
+        board = Board()
+        lazy = LazyEncryptedBoard(board, public_key)
+        
+        assert set(lazy) == set(board.board)
+        assert (0, 0) in lazy
+        assert (10, 0) not in lazy
+        with pytest.raises(KeyError):
+            lazy[(10, 0)]
+    
+    def test_background_prefetch(self, keypair):
+        """Test that background mode eventually encrypts every cell."""
+        public_key, private_key = keypair
+        board = Board()
+        board.place_ships()
+        lazy = LazyEncryptedBoard(board, public_key, background=True)
+        
+        lazy.wait(timeout=30)
+        
+        assert lazy.materialized_count() == 100
+        for coord, value in board.board.items():
+            assert decrypt_value(private_key, lazy[coord]) == value
+    
+    def test_game_with_lazy_boards(self, keypair):
+        """Test that GameLogic only encrypts the cells it probes."""
+        alice_pub, alice_priv = keypair
+        bob_pub, bob_priv = generate_keypair(n_length=1024)
+        alice_board = Board("Alice")
+        alice_board.place_ships()
+        bob_board = Board("Bob")
+        bob_board.place_ships()
+        
+        game = GameLogic(alice_board, bob_board, alice_pub, bob_pub,
+                         alice_priv, bob_priv, lazy_boards=True)
+        
+        x, y = bob_board.ships[0].coordinates[0]
+        is_hit, _, _ = game.make_guess("Alice", x, y)
+        
+        assert is_hit
+        assert game.bob_encrypted_board.materialized_count() == 1
+        assert game.alice_encrypted_board.materialized_count() == 0
+    
+    def test_lazy_and_packed_rejected(self, keypair):
+        """Test that incompatible board formats are rejected."""
+        public_key, private_key = keypair
+        with pytest.raises(ValueError):
+            GameLogic(Board("Alice"), Board("Bob"), public_key, public_key,
+                      private_key, private_key, packed_boards=True, lazy_boards=True)
@@ -0,0 +1,176 @@
+"""
+Unit tests for the asyncio network server.
+"""
+
+import asyncio
+import json
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from board import Board
+from game_logic import GameLogic, PlaintextGameLogic
+from server import GameServer
+from network import AsyncGameServer, LoopbackClient
+
+
+@pytest.fixture
+def game_server(keypairs):
+    """Create a fresh game server with random boards."""
+    (alice_pub, alice_priv), (bob_pub, bob_priv) = keypairs
+    alice_board = Board("Alice")
+    alice_board.place_ships()
+    bob_board = Board("Bob")
+    bob_board.place_ships()
+    game = GameLogic(alice_board, bob_board, alice_pub, bob_pub,
+                     alice_priv, bob_priv, lazy_boards=True)
+    return GameServer(game)
+
+
+async def _with_server(game_server, scenario):
+    """Run a scenario coroutine against a running AsyncGameServer."""
+    server = AsyncGameServer(game_server)
+    await server.start()
+    try:
+        return await scenario(server)
+    finally:
+        await server.close()
+
+
+class TestAsyncGameServer:
+    """Tests for AsyncGameServer and LoopbackClient."""
+    
+    def test_play_turn_over_network(self, game_server):
+        """Test starting a game and making a guess through the client."""
+        bob_board = game_server.game_logic.bob_board
+        x, y = bob_board.ships[0].coordinates[0]
+        
+        async def scenario(server):
+            async with LoopbackClient(server.host, server.port) as client:
+                start_info = await client.start_game()
+                result = await client.process_player_guess("Alice", x, y)
+                state = await client.get_game_state()
+                history = await client.get_game_history()
+            return start_info, result, state, history
+        
+        start_info, result, state, history = asyncio.run(_with_server(game_server, scenario))
+        
+        assert start_info["board_size"] == 10
+        assert result["status"] == "success"
+        assert result["is_hit"]
+        assert result["coordinate"] == [x, y]
+        assert state["current_turn"] == "Bob"
+        assert len(history) == 1
+    
+    def test_salvo_over_network(self, game_server):
+        """Test firing a salvo through the client."""
+        async def scenario(server):
+            async with LoopbackClient(server.host, server.port) as client:
+                await client.start_game()
+                return await client.process_player_salvo("Alice", [(0, 0), (1, 1)])
+        
+        result = asyncio.run(_with_server(game_server, scenario))
+        
+        assert result["status"] == "success"
+        assert len(result["results"]) == 2
+    
+    def test_errors_are_reported(self, game_server):
+        """Test unknown methods, bad parameters and malformed lines."""
+        async def scenario(server):
+            async with LoopbackClient(server.host, server.port) as client:
+                with pytest.raises(RuntimeError, match="Unknown method"):
+                    await client.call("drop_tables")
+                with pytest.raises(RuntimeError, match="Game not started"):
+                    await client.process_player_guess("Alice", 0, 0)
+                with pytest.raises(RuntimeError):
+                    await client.call("get_game_state", bogus=1)
+            
+            reader, writer = await asyncio.open_connection(server.host, server.port)
+            writer.write(b"not json\n")
+            await writer.drain()
+            response = json.loads(await reader.readline())
+            writer.close()
+            return response
+        
+        response = asyncio.run(_with_server(game_server, scenario))
+        assert response["error"] == "Malformed request"
+    
+    def test_bad_parameters_keep_connection(self, game_server):
+        """Test that non-integer coordinates are rejected without dropping the client."""
+        async def scenario(server):
+            async with LoopbackClient(server.host, server.port) as client:
+                await client.start_game()
+                with pytest.raises(RuntimeError, match="pairs of integers"):
+                    await client.process_player_guess("Alice", 3.5, 0)
+                with pytest.raises(RuntimeError, match="pairs of integers"):
+                    await client.process_player_guess("Alice", True, 0)
+                with pytest.raises(RuntimeError, match="pairs of integers"):
+                    await client.call("process_player_salvo", player_name="Alice",
+                                      coordinates=[[0, 0], [1]])
+                with pytest.raises(RuntimeError, match="player_name"):
+                    await client.process_player_guess(["Alice"], 0, 0)
+                return await client.get_game_state()
+        
+        state = asyncio.run(_with_server(game_server, scenario))
+        assert state["total_turns"] == 0
+        assert state["current_turn"] == "Alice"
+    
+    def test_zero_tests_run_on_executor(self, game_server):
+        """Test that guesses and salvos submit their zero tests to the executor."""
+        submitted = []
+        
+        class RecordingExecutor(ThreadPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                submitted.append(fn)
+                return super().submit(fn, *args, **kwargs)
+        
+        async def scenario():
+            with RecordingExecutor(max_workers=1) as executor:
+                server = AsyncGameServer(game_server, executor=executor)
+                await server.start()
+                try:
+                    async with LoopbackClient(server.host, server.port) as client:
+                        await client.start_game()
+                        await client.process_player_guess("Alice", 0, 0)
+                        return await client.process_player_salvo("Bob", [(0, 0), (1, 1)])
+                finally:
+                    await server.close()
+        
+        result = asyncio.run(scenario())
+        assert result["status"] == "success"
+        assert len(submitted) == 3
+    
+    def test_plaintext_game_over_network(self):
+        """Test that plaintext games run their guesses without the zero-test split."""
+        alice_board = Board("Alice")
+        alice_board.place_ships()
+        bob_board = Board("Bob")
+        bob_board.place_ships()
+        game_server = GameServer(PlaintextGameLogic(alice_board, bob_board))
+        
+        async def scenario(server):
+            async with LoopbackClient(server.host, server.port) as client:
+                await client.start_game()
+                guess = await client.process_player_guess("Alice", 0, 0)
+                salvo = await client.process_player_salvo("Bob", [(0, 0), (1, 1)])
+            return guess, salvo
+        
+        guess, salvo = asyncio.run(_with_server(game_server, scenario))
+        assert guess["status"] == "success"
+        assert len(salvo["results"]) == 2
+    
+    def test_many_concurrent_connections(self, game_server):
+        """Test that the server handles many simultaneous clients."""
+        num_clients = 200
+        
+        async def scenario(server):
+            clients = [LoopbackClient(server.host, server.port) for _ in range(num_clients)]
+            await asyncio.gather(*(client.connect() for client in clients))
+            states = await asyncio.gather(*(client.get_game_state() for client in clients))
+            peak_connections = server.active_connections
+            await asyncio.gather(*(client.close() for client in clients))
+            return peak_connections, states
+        
+        peak_connections, states = asyncio.run(_with_server(game_server, scenario))
+        
+        assert peak_connections == num_clients
+        assert len(states) == num_clients
+        assert all(state["total_turns"] == 0 for state in states)
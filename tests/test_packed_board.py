@@ -0,0 +1,72 @@
+"""
+Unit tests for plaintext-packed encrypted boards.
+"""
+
+import pytest
+from board import Board
+from crypto import generate_keypair, check_hit
+from game_logic import GameLogic
+from packed_board import PackedEncryptedBoard, slots_per_ciphertext
+
+
+class TestPackedEncryptedBoard:
+    """Tests for the PackedEncryptedBoard class."""
+    
+    def test_board_uses_few_ciphertexts(self, keypair):
+        """Test that 100 cells are packed into a handful of ciphertexts."""
+        public_key, _ = keypair
+        board = Board()
+        board.place_ships()
+        
+        packed = PackedEncryptedBoard.from_board(board, public_key)
+        
+        assert len(packed) == 100
+        assert packed.ciphertext_count() == -(-100 // slots_per_ciphertext(public_key))
+        assert packed.ciphertext_count() <= 5
+    
+    def test_hit_check_matches_every_cell(self, keypair):
+        """Test that the slot hit check agrees with the plaintext board."""
+        public_key, private_key = keypair
+        board = Board()
+        board.place_ships()
+        packed = PackedEncryptedBoard.from_board(board, public_key)
+        
+        for (x, y), value in board.board.items():
+            encrypted_result = packed.hit_check(x, y)
+            slot_value = packed.decrypt_hit_check(private_key, encrypted_result, x, y)
+            assert check_hit(slot_value) == (value == 1)
+    
+    def test_locate_out_of_bounds(self, keypair):
+        """Test that coordinates off the board are rejected."""
+        public_key, _ = keypair
+        packed = PackedEncryptedBoard.from_board(Board(), public_key)
+        with pytest.raises(ValueError):
+            packed.locate(10, 0)
+    
+    def test_small_key_rejected(self, keypair):
+        """Test that slots wider than the key are rejected."""
+        public_key, _ = keypair
+        with pytest.raises(ValueError):
+            slots_per_ciphertext(public_key, slot_bits=1024)
+
+
+class TestPackedGameLogic:
+    """Tests for playing a game on packed boards."""
+    
+    def test_sink_ship_with_packed_boards(self, keypair):
+        """Test that hits and sinking work with packed boards."""
+        alice_pub, alice_priv = keypair
+        bob_pub, bob_priv = generate_keypair(n_length=1024)
+        alice_board = Board("Alice")
+        alice_board.place_ships()
+        bob_board = Board("Bob")
+        bob_board.place_ships()
+        
+        game = GameLogic(alice_board, bob_board, alice_pub, bob_pub,
+                         alice_priv, bob_priv, packed_boards=True)
+        
+        target_ship = bob_board.ships[0]
+        results = [game.make_guess("Alice", x, y) for x, y in target_ship.coordinates]
+        
+        assert all(is_hit for is_hit, _, _ in results)
+        assert results[-1][1] == target_ship.name
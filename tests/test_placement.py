@@ -0,0 +1,107 @@
+"""
+Unit tests for the constraint-based placement engine.
+"""
+
+import random
+import time
+import pytest
+from board import Board, Ship
+from bitboard import BitBoard
+from placement import PlacementEngine, get_placement_engine
+
+
+class TestPlacementEngine:
+    """Tests for PlacementEngine and its use by Board.place_ships."""
+
+    def test_candidate_counts(self):
+        """Test that every straight placement is enumerated once."""
+        engine = PlacementEngine(10, (5, 1))
+        assert engine.candidate_count(5) == 2 * 6 * 10
+        assert engine.candidate_count(1) == 100
+
+    def test_samples_are_valid(self):
+        """Test that sampled fleets are straight, in bounds and non-overlapping."""
+        engine = get_placement_engine(10, (5, 4, 3, 2, 2))
+        rng = random.Random(7)
+        for _ in range(500):
+            placements = engine.sample(rng)
+            cells = [cell for ship in placements for cell in ship]
+
+            assert [len(ship) for ship in placements] == [5, 4, 3, 2, 2]
+            assert len(set(cells)) == len(cells)
+            assert all(0 <= x < 10 and 0 <= y < 10 for x, y in cells)
+            for ship in placements:
+                assert Ship.is_valid_line(ship)[0]
+
+    def test_masks_match_cells(self):
+        """Test that masks use the x * board_size + y bit layout."""
+        engine = PlacementEngine(8, (3,))
+        mask, = engine.sample_masks(random.Random(3))
+        cells, = engine.sample(random.Random(3))
+        assert mask == sum(1 << (x * 8 + y) for x, y in cells)
+
+    def test_dense_fleet_always_placed(self):
+        """Test that a fleet filling the whole board is always found."""
+        engine = PlacementEngine(4, (4, 4, 4, 4))
+        for seed in range(50):
+            placements = engine.sample(random.Random(seed))
+            assert len({cell for ship in placements for cell in ship}) == 16
+
+    def test_impossible_fleet(self):
+        """Test that a fleet with no valid placement raises ValueError."""
+        engine = PlacementEngine(5, (5, 5, 5, 3, 3, 3))
+        with pytest.raises(ValueError):
+            engine.sample_indices(random.Random(0))
+
+    def test_seeded_board_placement(self):
+        """Test that Board and BitBoard placement is reproducible from a seed."""
+        first = Board()
+        first.place_ships(random.Random(42))
+        second = Board()
+        second.place_ships(random.Random(42))
+        bitboard = BitBoard()
+        bitboard.place_ships(random.Random(42))
+
+        assert [ship.coordinates for ship in first.ships] == \
+            [ship.coordinates for ship in second.ships]
+        assert [ship.coordinates for ship in bitboard.ships] == \
+            [ship.coordinates for ship in first.ships]
+        assert sum(first.board.values()) == sum(Board.SHIP_SIZES)
+
+    def test_replacing_ships_clears_old_cells(self):
+        """Test that placing again leaves only the new fleet on the board."""
+        board = Board()
+        board.place_ships()
+        board.place_ships()
+        assert sum(board.board.values()) == sum(Board.SHIP_SIZES)
+
+    def test_infeasible_fleet_raises_quickly(self):
+        """Test that a fleet passing the config checks but never fitting raises ValueError."""
+        board = Board(board_size=6, fleet=[("Battleship", 4)] * 9)
+        start = time.perf_counter()
+        with pytest.raises(ValueError):
+            board.place_ships(random.Random(0))
+        assert time.perf_counter() - start < 10
+
+    @pytest.mark.parametrize("ship_sizes", [(5,) * 20, (5,) * 18, (2,) * 50, (3,) * 33])
+    def test_dense_fleets_always_placed(self, ship_sizes):
+        """Test that fleets which fit are placed for every seed, even filling the board."""
+        engine = PlacementEngine(10, ship_sizes)
+        for seed in range(20):
+            masks = engine.sample_masks(random.Random(seed))
+            occupied = 0
+            for mask in masks:
+                assert not mask & occupied
+                occupied |= mask
+            assert bin(occupied).count("1") == sum(ship_sizes)
+
+    def test_search_is_complete(self):
+        """Test that the search proves a board-sized fleet that cannot tile it unplaceable."""
+        with pytest.raises(ValueError):
+            PlacementEngine(10, (4,) * 25)._backtrack(random.Random(0))
+
+    def test_cell_count_prune(self):
+        """Test that a fleet with more cells than the board fails without searching."""
+        engine = PlacementEngine(4, (4, 4, 4, 4, 1))
+        with pytest.raises(ValueError):
+            engine._backtrack(random.Random(0))
@@ -0,0 +1,105 @@
+"""
+Unit tests for the binary ciphertext format.
+"""
+
+import pytest
+from board import Board
+from crypto import generate_keypair, encrypt_value, decrypt_value, perform_homomorphic_hit_check
+from serialization import (
+    HEADER,
+    EncryptedBoardView,
+    ciphertext_size,
+    serialize_encrypted_board,
+    deserialize_encrypted_number,
+    serialize_encrypted_number,
+)
+
+
+@pytest.fixture(scope="module")
+def encrypted_setup(keypair):
+    """Encrypt a random board once for the module."""
+    public_key, _ = keypair
+    board = Board()
+    board.place_ships()
+    return board, board.encrypt_board(public_key)
+
+
+class TestEncryptedNumberFormat:
+    """Tests for single encrypted number serialization."""
+    
+    def test_roundtrip(self, keypair):
+        """Test that a hit-check result survives serialization."""
+        public_key, private_key = keypair
+        encrypted_result = perform_homomorphic_hit_check(encrypt_value(public_key, 0), 1)
+        
+        data = serialize_encrypted_number(encrypted_result)
+        decoded = deserialize_encrypted_number(data, public_key)
+        
+        assert len(data) == HEADER.size + ciphertext_size(public_key)
+        assert decrypt_value(private_key, decoded) == decrypt_value(private_key, encrypted_result)
+    
+    def test_wrong_key_rejected(self, keypair):
+        """Test that the key fingerprint is checked."""
+        public_key, _ = keypair
+        other_public_key, _ = generate_keypair(n_length=1024)
+        data = serialize_encrypted_number(encrypt_value(public_key, 1))
+        
+        with pytest.raises(ValueError, match="different key"):
+            deserialize_encrypted_number(data, other_public_key)
+
+
+class TestEncryptedBoardFormat:
+    """Tests for encrypted board serialization."""
+    
+    def test_board_roundtrip(self, keypair, encrypted_setup):
+        """Test that every cell decodes to the original ciphertext."""
+        public_key, private_key = keypair
+        board, encrypted_board = encrypted_setup
+        
+        data = serialize_encrypted_board(encrypted_board, public_key)
+        view = EncryptedBoardView(data, public_key)
+        
+        assert len(data) == HEADER.size + 100 * ciphertext_size(public_key)
+        assert (view.width, view.height) == (10, 10)
+        assert set(view) == set(encrypted_board)
+        for coord, encrypted in encrypted_board.items():
+            assert view[coord].ciphertext() == encrypted.ciphertext()
+        x, y = board.ships[0].coordinates[0]
+        assert decrypt_value(private_key, view[(x, y)]) == 1
+    
+    def test_view_does_not_copy(self, keypair, encrypted_setup):
+        """Test that the view reads cells directly from the buffer."""
+        public_key, _ = keypair
+        _, encrypted_board = encrypted_setup
+        buffer = bytearray(serialize_encrypted_board(encrypted_board, public_key))
+        view = EncryptedBoardView(buffer, public_key)
+        
+        cell_bytes = view.ciphertext_bytes(0, 0)
+        assert isinstance(cell_bytes, memoryview)
+        buffer[HEADER.size] ^= 0xFF
+        assert cell_bytes[0] == buffer[HEADER.size]
+    
+    def test_out_of_bounds_and_bad_data(self, keypair, encrypted_setup):
+        """Test lookups off the board and corrupted buffers."""
+        public_key, _ = keypair
+        _, encrypted_board = encrypted_setup
+        data = serialize_encrypted_board(encrypted_board, public_key)
+        view = EncryptedBoardView(data, public_key)
+        
+        assert (10, 0) not in view
+        with pytest.raises(KeyError):
+            view[(10, 0)]
+        with pytest.raises(ValueError):
+            EncryptedBoardView(b"XXXX" + data[4:], public_key)
+        with pytest.raises(ValueError):
+            EncryptedBoardView(data[:-1], public_key)
+    
+    def test_partial_board_rejected(self, keypair, encrypted_setup):
+        """Test that boards with missing cells cannot be serialized."""
+        public_key, _ = keypair
+        _, encrypted_board = encrypted_setup
+        partial = dict(encrypted_board)
+        del partial[(3, 3)]
+        
+        with pytest.raises(ValueError):
+            serialize_encrypted_board(partial, public_key)
@@ -0,0 +1,235 @@
+"""
+Unit tests for the multi-game session manager.
+"""
+
+import os
+import threading
+import pytest
+from board_store import EncryptedBoardStore
+from key_pool import KeyPool
+from sessions import SessionManager
+
+
+class FakeClock:
+    """Manually advanced clock for eviction tests."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class GatedKeyPool:
+    """Key pool whose acquire blocks until released, or fails."""
+    
+    def __init__(self, keypair, fail=False):
+        self.keypair = keypair
+        self.fail = fail
+        self.acquiring = threading.Event()
+        self.release = threading.Event()
+    
+    def acquire(self):
+        self.acquiring.set()
+        self.release.wait(10)
+        if self.fail:
+            raise RuntimeError("key generation failed")
+        return self.keypair
+    
+    def stats(self):
+        return {}
+
+
+class TestSessionManager:
+    """Tests for the SessionManager class."""
+    
+    def test_create_and_play_games(self):
+        """Test that games are independent and share the key pool."""
+        with KeyPool(target_depth=2, n_length=1024) as key_pool:
+            manager = SessionManager(key_pool=key_pool)
+            game_a = manager.create_game(lazy_boards=True)
+            game_b = manager.create_game(lazy_boards=True)
+        
+        assert game_a != game_b
+        assert len(manager) == 2
+        
+        server_a = manager.get_server(game_a)
+        server_b = manager.get_server(game_b)
+        assert server_a.game_logic.alice_public_key != server_b.game_logic.alice_public_key
+        
+        x, y = server_a.game_logic.bob_board.ships[0].coordinates[0]
+        result = manager.process_player_guess(game_a, "Alice", x, y)
+        assert result["is_hit"]
+        assert server_b.get_game_state()["total_turns"] == 0
+        
+        metrics = manager.metrics()
+        assert metrics["active_games"] == 2
+        assert metrics["games_created"] == 2
+        assert metrics["key_pool"]["target_depth"] == 2
+    
+    def test_idle_games_evicted(self):
+        """Test that games without activity are evicted."""
+        clock = FakeClock()
+        manager = SessionManager(idle_timeout=10, n_length=1024, clock=clock)
+        idle_game = manager.create_game(lazy_boards=True)
+        active_game = manager.create_game(lazy_boards=True)
+        
+        clock.now = 8
+        manager.get_server(active_game)
+        clock.now = 12
+        
+        assert manager.evict() == [idle_game]
+        assert idle_game not in manager
+        assert active_game in manager
+        with pytest.raises(KeyError):
+            manager.get_server(idle_game)
+    
+    def test_finished_games_evicted_after_ttl(self):
+        """Test that finished games stay briefly, then are evicted."""
+        clock = FakeClock()
+        manager = SessionManager(finished_ttl=5, n_length=1024, clock=clock)
+        game_id = manager.create_game(lazy_boards=True)
+        bob_board = manager.get_server(game_id).game_logic.bob_board
+        
+        for ship in bob_board.ships:
+            for x, y in ship.coordinates:
+                manager.process_player_guess(game_id, "Alice", x, y)
+        
+        assert manager.metrics()["finished_games"] == 1
+        clock.now = 4
+        assert manager.evict() == []
+        clock.now = 5
+        assert manager.evict() == [game_id]
+        assert manager.metrics()["games_evicted"] == 1
+    
+    def test_capacity_limit(self):
+        """Test that games beyond max_games are refused."""
+        manager = SessionManager(max_games=1, n_length=1024)
+        game_id = manager.create_game(lazy_boards=True)
+        
+        with pytest.raises(RuntimeError):
+            manager.create_game(lazy_boards=True)
+        assert manager.metrics()["capacity_remaining"] == 0
+        
+        manager.end_game(game_id)
+        manager.create_game(lazy_boards=True)
+        assert len(manager) == 1
+    
+    def test_finished_game_releases_stored_boards(self):
+        """Test that a game's board files are removed when it ends."""
+        with EncryptedBoardStore() as store:
+            manager = SessionManager(n_length=1024)
+            game_id = manager.create_game(board_store=store)
+            assert len(os.listdir(store.directory)) == 2
+            
+            bob_board = manager.get_server(game_id).game_logic.bob_board
+            for ship in bob_board.ships:
+                for x, y in ship.coordinates:
+                    manager.process_player_guess(game_id, "Alice", x, y)
+            
+            assert os.listdir(store.directory) == []
+            assert manager.get_server(game_id).get_game_state()["game_over"]
+    
+    def test_evicted_games_release_stored_boards(self, monkeypatch):
+        """Test that eviction removes board files and idle games are paged out."""
+        clock = FakeClock()
+        with EncryptedBoardStore() as store:
+            manager = SessionManager(idle_timeout=10, idle_advise_after=5,
+                                     n_length=1024, clock=clock)
+            game_id = manager.create_game(board_store=store)
+            game_logic = manager.get_server(game_id).game_logic
+            advised = []
+            monkeypatch.setattr(game_logic, "advise_idle", lambda: advised.append(game_id))
+            
+            clock.now = 4
+            manager.evict()
+            assert advised == []
+            clock.now = 6
+            manager.evict()
+            assert advised == [game_id]
+            
+            clock.now = 10
+            assert manager.evict() == [game_id]
+            assert os.listdir(store.directory) == []
+    
+    def test_capacity_reserved_while_creating(self, keypair):
+        """Test that a game being set up holds its slot against concurrent creates."""
+        key_pool = GatedKeyPool(keypair)
+        manager = SessionManager(key_pool=key_pool, max_games=1)
+        created = []
+        creator = threading.Thread(
+            target=lambda: created.append(manager.create_game(lazy_boards=True))
+        )
+        creator.start()
+        assert key_pool.acquiring.wait(10)
+        
+        with pytest.raises(RuntimeError):
+            manager.create_game(lazy_boards=True)
+        assert manager.metrics()["capacity_remaining"] == 0
+        
+        key_pool.release.set()
+        creator.join(10)
+        assert created and created[0] in manager
+    
+    def test_failed_create_releases_slot(self, keypair):
+        """Test that a game that fails to start does not keep its slot."""
+        key_pool = GatedKeyPool(keypair, fail=True)
+        key_pool.release.set()
+        manager = SessionManager(key_pool=key_pool, max_games=1)
+        
+        with pytest.raises(RuntimeError, match="key generation failed"):
+            manager.create_game(lazy_boards=True)
+        assert manager.metrics()["capacity_remaining"] == 1
+        
+        key_pool.fail = False
+        manager.create_game(lazy_boards=True)
+        assert len(manager) == 1
+    
+    def test_salvo_finishing_game_releases_boards(self, keypair):
+        """Test that a salvo ending the game marks it finished and releases its boards."""
+        key_pool = GatedKeyPool(keypair)
+        key_pool.release.set()
+        with EncryptedBoardStore() as store:
+            manager = SessionManager(key_pool=key_pool)
+            game_id = manager.create_game(board_store=store)
+            bob_board = manager.get_server(game_id).game_logic.bob_board
+            
+            coordinates = [coord for ship in bob_board.ships for coord in ship.coordinates]
+            result = manager.process_player_salvo(game_id, "Alice", coordinates)
+            
+            assert result["game_over"]
+            assert result["winner"] == "Alice"
+            assert os.listdir(store.directory) == []
+            assert manager.metrics()["finished_games"] == 1
+    
+    def test_turns_in_one_game_serialized(self, keypair, monkeypatch):
+        """Test that two threads playing the same game take turns one at a time."""
+        key_pool = GatedKeyPool(keypair)
+        key_pool.release.set()
+        manager = SessionManager(key_pool=key_pool)
+        game_id = manager.create_game(lazy_boards=True)
+        server = manager.get_server(game_id)
+        in_turn = threading.Event()
+        release_turn = threading.Event()
+        entered = []
+        
+        def slow_guess(player_name, x, y):
+            entered.append(player_name)
+            in_turn.set()
+            release_turn.wait(10)
+            return {"player": player_name}
+        
+        monkeypatch.setattr(server, "process_player_guess", slow_guess)
+        threads = [threading.Thread(target=manager.process_player_guess,
+                                    args=(game_id, player_name, 0, 0))
+                   for player_name in ("Alice", "Bob")]
+        threads[0].start()
+        assert in_turn.wait(10)
+        threads[1].start()
+        threads[1].join(0.2)
+        
+        assert entered == ["Alice"]
+        release_turn.set()
+        for thread in threads:
+            thread.join(10)
+        assert entered == ["Alice", "Bob"]
@@ -0,0 +1,183 @@
+"""
+Unit tests for the headless self-play harness and strategies.
+"""
+
+import random
+import pytest
+from bitboard import BitBoard
+from board import Board
+from game_logic import GameLogic, PlaintextGameLogic
+from simulation import play_headless_game, run_simulation
+from strategies import DensityStrategy, HuntTargetStrategy, RandomStrategy, Strategy
+
+
+class TestStrategies:
+    """Tests for the built-in strategies."""
+    
+    @pytest.mark.parametrize("strategy_class", [RandomStrategy, HuntTargetStrategy, DensityStrategy])
+    def test_never_repeats_a_cell(self, strategy_class):
+        """Test that strategies cover the board without repeating shots."""
+        strategy = strategy_class()
+        strategy.reset(6, [("Cruiser", 3)], random.Random(1))
+        
+        shots = []
+        for _ in range(36):
+            x, y = strategy.next_shot()
+            strategy.observe(x, y, (x, y) == (2, 2), None)
+            shots.append((x, y))
+        
+        assert len(set(shots)) == 36
+    
+    def test_hunt_target_follows_hits(self):
+        """Test that a hit makes the next shot a neighbour."""
+        strategy = HuntTargetStrategy()
+        strategy.reset(10, [("Cruiser", 3)], random.Random(2))
+        strategy.observe(5, 5, True, None)
+        
+        assert strategy.next_shot() in {(4, 5), (6, 5), (5, 4), (5, 6)}
+
+    
+    def test_density_matches_full_recount(self):
+        """Test that incremental density updates equal a from-scratch count."""
+        fleet = [("Battleship", 4), ("Cruiser", 3), ("Destroyer", 2)]
+        board = Board(board_size=8, fleet=fleet)
+        board._place_fleet([[(0, y) for y in range(4)], [(3, y) for y in range(2, 5)],
+                            [(6, 6), (7, 6)]])
+        strategy = DensityStrategy()
+        strategy.reset(8, fleet, random.Random(4))
+        
+        def recount():
+            blocked = {coord for coord in board.guesses if board.board[coord] == 0}
+            for ship in board.ships:
+                if ship.is_sunk():
+                    blocked.update(ship.coordinates)
+            density = [0] * 64
+            for ship in board.ships:
+                if ship.is_sunk():
+                    continue
+                for x in range(8):
+                    for y in range(8):
+                        for cells in ([(x + i, y) for i in range(ship.size)],
+                                      [(x, y + i) for i in range(ship.size)]):
+                            if all(cx < 8 and cy < 8 and (cx, cy) not in blocked for cx, cy in cells):
+                                for cx, cy in cells:
+                                    density[cx * 8 + cy] += 1
+            return density
+        
+        cells = [(x, y) for x in range(8) for y in range(8)]
+        random.Random(9).shuffle(cells)
+        for x, y in cells:
+            is_hit, _ = board.record_hit_on_board(x, y)
+            ship = board.get_ship_at(x, y)
+            strategy.observe(x, y, is_hit, ship.name if ship and ship.is_sunk() else None)
+            assert strategy.density_map() == recount()
+    
+    def test_density_shot_is_best_unshot_cell(self):
+        """Test that the bucketed choice equals a scan of the unshot cells."""
+        board = Board(board_size=8, fleet=[("Cruiser", 3), ("Destroyer", 2)])
+        board.place_ships(random.Random(5))
+        strategy = DensityStrategy()
+        strategy.reset(8, board.fleet, random.Random(6))
+        unshot = {(x, y) for x in range(8) for y in range(8)}
+        
+        while not board.all_ships_sunk():
+            scores = strategy.density_map()
+            targeted = [strategy._target_density[x * 8 + y] for x, y in unshot]
+            if strategy._unresolved_hits and any(targeted):
+                scores = strategy._target_density
+            best = max(scores[x * 8 + y] for x, y in unshot)
+            
+            x, y = strategy.next_shot()
+            assert (x, y) in unshot and scores[x * 8 + y] == best
+            unshot.discard((x, y))
+            is_hit, _ = board.record_hit_on_board(x, y)
+            ship = board.get_ship_at(x, y)
+            strategy.observe(x, y, is_hit, ship.name if ship and ship.is_sunk() else None)
+    
+    def test_strategy_is_abstract(self):
+        """Test that a strategy must implement next_shot."""
+        class Idle(Strategy):
+            pass
+        
+        with pytest.raises(TypeError):
+            Idle()
+    
+    def test_density_beats_random(self):
+        """Test that density targeting needs far fewer shots than random fire."""
+        report = run_simulation(20, DensityStrategy, RandomStrategy, seed=8)
+        assert report.wins["Alice"] >= 17
+
+
+class TestSimulation:
+    """Tests for headless games and simulation reports."""
+    
+    def test_plaintext_game_finishes(self):
+        """Test that a plaintext game is played to the end through the server."""
+        result = play_headless_game(RandomStrategy(), HuntTargetStrategy(), seed=3)
+        
+        assert result.winner in ("Alice", "Bob")
+        assert sum(Board.SHIP_SIZES) <= result.turns <= 200
+        assert result.timings["keygen"] == 0.0
+        assert result.timings["turns"] > 0.0
+    
+    def test_seeded_runs_are_reproducible(self):
+        """Test that the same seed gives the same games in or out of a process pool."""
+        serial = run_simulation(6, HuntTargetStrategy, RandomStrategy, seed=11)
+        parallel = run_simulation(6, HuntTargetStrategy, RandomStrategy, seed=11, workers=2)
+        
+        assert list(serial.turns) == list(parallel.turns)
+        assert serial.wins == parallel.wins
+        summary = serial.summary()
+        assert summary["games"] == 6
+        assert summary["mode"] == "plaintext"
+        assert summary["games_per_second"] > 0
+    
+    def test_crypto_game_matches_plaintext(self):
+        """Test that full-crypto mode plays the same game as plaintext mode."""
+        fleet = [("Cruiser", 3), ("Dinghy", 1)]
+        plain = play_headless_game(HuntTargetStrategy(), HuntTargetStrategy(),
+                                   board_size=4, fleet=fleet, seed=5)
+        crypto = play_headless_game(HuntTargetStrategy(), HuntTargetStrategy(),
+                                    board_size=4, fleet=fleet, seed=5, crypto=True)
+        
+        assert (crypto.winner, crypto.turns) == (plain.winner, plain.turns)
+        assert crypto.timings["encryption"] > 0.0
+
+
+class TestPlaintextGameLogic:
+    """Tests for the encryption-free game logic."""
+    
+    def test_same_rules_without_keys(self):
+        """Test hits, sinking, duplicates and game over on plaintext boards."""
+        alice_board = Board("Alice", board_size=4, fleet=[("Dinghy", 1)])
+        alice_board.place_ships(random.Random(0))
+        bob_board = Board("Bob", board_size=4, fleet=[("Dinghy", 1)])
+        bob_board.place_ships(random.Random(1))
+        game = PlaintextGameLogic(alice_board, bob_board)
+        
+        x, y = bob_board.ships[0].coordinates[0]
+        assert game.make_salvo("Alice", [(x, y), (x, y)]) == [(True, "Dinghy", False)]
+        assert game.game_state.winner == "Alice"
+        assert game.get_decryption_stats() == {}
+        with pytest.raises(RuntimeError):
+            game.make_guess("Bob", 0, 0)
+    
+    def test_shares_game_logic_setup(self):
+        """Test that the plaintext logic is GameLogic with encryption turned off."""
+        alice_board = BitBoard("Alice", board_size=4, fleet=[("Dinghy", 1)])
+        alice_board.place_ships(random.Random(0))
+        bob_board = BitBoard("Bob", board_size=4, fleet=[("Dinghy", 1)])
+        bob_board.place_ships(random.Random(1))
+        game = PlaintextGameLogic(alice_board, bob_board)
+        
+        assert not game.encrypted
+        assert game.alice_encrypted_board is None and game.probe_tables == {}
+        with pytest.raises(ValueError):
+            game.prepare_guess("Alice", 0, 0)
+        with pytest.raises(ValueError):
+            GameLogic(alice_board, bob_board, None, None, None, None,
+                      lazy_boards=True, encrypted=False)
+        
+        x, y = bob_board.ships[0].coordinates[0]
+        assert game.make_guess("Alice", x, y) == (True, "Dinghy", False)
+        game.close()
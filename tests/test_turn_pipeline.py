@@ -0,0 +1,153 @@
+"""
+Unit tests for pipelined turn processing.
+"""
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+from board import Board
+from game_logic import GameLogic
+from server import GameServer
+from simulation import play_headless_game
+from strategies import HuntTargetStrategy
+from turn_pipeline import PipelinedTurnEngine
+
+
+FLEET = [("Destroyer", 2), ("Submarine", 1)]
+
+
+@pytest.fixture(scope="module")
+def executor():
+    """Two-worker process pool shared by the tests in this module."""
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        yield pool
+
+
+def _make_server(keypairs, seed, **options):
+    """Create a started game server on small seeded boards."""
+    (alice_pub, alice_priv), (bob_pub, bob_priv) = keypairs
+    rng = random.Random(seed)
+    alice_board = Board("Alice", board_size=4, fleet=FLEET)
+    alice_board.place_ships(rng)
+    bob_board = Board("Bob", board_size=4, fleet=FLEET)
+    bob_board.place_ships(rng)
+    game = GameLogic(alice_board, bob_board, alice_pub, bob_pub,
+                     alice_priv, bob_priv, **options)
+    server = GameServer(game)
+    server.start_game()
+    return server
+
+
+def _scripted_shots():
+    """Shots that sweep the opponent's board in row order, per player."""
+    order = {player: [(x, y) for x in range(4) for y in range(4)] for player in ("Alice", "Bob")}
+    return lambda player: order[player].pop(0)
+
+
+class TestPipelinedTurnEngine:
+    """Tests for PipelinedTurnEngine."""
+
+    def test_matches_sequential_play(self, keypairs, executor):
+        """Test that pipelined play records the same turns as sequential play."""
+        sequential = _make_server(keypairs, seed=5)
+        choose = _scripted_shots()
+        expected = []
+        while not sequential.is_game_over():
+            player = sequential.get_whose_turn()
+            expected.append(sequential.process_player_guess(player, *choose(player)))
+
+        pipelined = _make_server(keypairs, seed=5)
+        with PipelinedTurnEngine(pipelined, executor) as engine:
+            responses = engine.play(_scripted_shots())
+
+        assert responses == expected
+        assert pipelined.get_winner() == sequential.get_winner()
+        assert list(pipelined.get_game_history()) == list(sequential.get_game_history())
+
+    def test_game_over_discards_in_flight_shot(self, keypairs, executor):
+        """Test that no shot is recorded after the winning shot."""
+        server = _make_server(keypairs, seed=11)
+        with PipelinedTurnEngine(server, executor) as engine:
+            responses = engine.play(_scripted_shots())
+
+        assert responses[-1]["game_over"]
+        assert not any(response["game_over"] for response in responses[:-1])
+        assert len(list(server.get_game_history())) == len(responses)
+
+    def test_strategies_see_results_in_order(self, keypairs, executor):
+        """Test that each player's results arrive before their next shot is chosen."""
+        server = _make_server(keypairs, seed=3)
+        strategies = {"Alice": HuntTargetStrategy(), "Bob": HuntTargetStrategy()}
+        rng = random.Random(3)
+        for strategy in strategies.values():
+            strategy.reset(4, FLEET, rng)
+        outstanding = {"Alice": 0, "Bob": 0}
+
+        def choose(player):
+            assert outstanding[player] == 0
+            outstanding[player] += 1
+            return strategies[player].next_shot()
+
+        def observe(player, response):
+            outstanding[player] -= 1
+            strategies[player].observe(*response["coordinate"], response["is_hit"],
+                                       response["ship_sunk"])
+
+        with PipelinedTurnEngine(server, executor) as engine:
+            responses = engine.play(choose, observe)
+
+        assert server.is_game_over()
+        assert not any(response["is_duplicate"] for response in responses)
+        assert [response["player"] for response in responses[:4]] == ["Alice", "Bob", "Alice", "Bob"]
+
+    def test_max_turns(self, keypairs, executor):
+        """Test that play stops after max_turns shots and can resume."""
+        server = _make_server(keypairs, seed=8)
+        choose = _scripted_shots()
+        with PipelinedTurnEngine(server, executor) as engine:
+            first = engine.play(choose, max_turns=3)
+            assert len(first) == 3
+            assert server.get_whose_turn() == "Bob"
+            rest = engine.play(choose)
+
+        assert len(list(server.get_game_history())) == len(first) + len(rest)
+        assert rest[-1]["game_over"]
+
+    def test_records_zero_test_latency(self, keypairs):
+        """Test that pipelined zero tests show up in the decryption stats."""
+        server = _make_server(keypairs, seed=2)
+        # The engine's own pool is shut down on exit, so every latency callback has run
+        with PipelinedTurnEngine(server) as engine:
+            responses = engine.play(_scripted_shots(), max_turns=4)
+
+        stats = server.game_logic.get_decryption_stats()
+        assert stats["Alice"]["calls"] + stats["Bob"]["calls"] == len(responses)
+        assert stats["Bob"]["p99_ns"] > 0
+
+    def test_zero_test_result_checked(self, keypairs):
+        """Test that a defender result contradicting the board is not recorded."""
+        server = _make_server(keypairs, seed=3)
+        game = server.game_logic
+        x, y = game.bob_board.ships[0].coordinates[0]
+
+        with pytest.raises(RuntimeError):
+            game.complete_guess("Alice", x, y, is_hit=False)
+        assert len(game.get_history()) == 0
+        assert game.complete_guess("Alice", x, y, is_hit=True)[0]
+
+    def test_rejects_packed_boards(self, keypairs):
+        """Test that games with packed boards cannot be pipelined."""
+        server = _make_server(keypairs, seed=1, packed_boards=True)
+        with pytest.raises(ValueError):
+            PipelinedTurnEngine(server)
+
+    def test_headless_pipelined_game(self, executor):
+        """Test the simulation harness's pipelined crypto mode."""
+        result = play_headless_game(HuntTargetStrategy(), HuntTargetStrategy(),
+                                    board_size=4, fleet=FLEET, crypto=True, seed=4,
+                                    pipelined=True, pipeline_executor=executor)
+        sequential = play_headless_game(HuntTargetStrategy(), HuntTargetStrategy(),
+                                        board_size=4, fleet=FLEET, crypto=True, seed=4)
+
+        assert (result.winner, result.turns) == (sequential.winner, sequential.turns)
+        assert result.timings["turns"] > 0